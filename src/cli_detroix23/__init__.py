@@ -0,0 +1,89 @@
+"""
+CLI - Detroix23
+__init__.py
+Public API, resolved lazily: a module is only imported when one of its names is first used.
+```python
+    from cli_detroix23 import loadings, SelectMenu
+    import cli_detroix23 as cli
+    cli.Bar("█", 100)
+```
+"""
+import importlib
+from typing import Any, Optional
+
+# Public name: (module, in the package; attribute, None for the module itself).
+_EXPORTS: dict[str, tuple[str, Optional[str]]] = {
+    # Modules.
+    "loadings": (".animations.loadings", None),
+    "async_loadings": (".animations.async_loadings", None),
+    "screen": (".animations.screen", None),
+    "canvas": (".animations.canvas", None),
+    "images": (".animations.images", None),
+    "ansi": (".base.ansi", None),
+    "boxes": (".base.boxes", None),
+    "colors": (".base.colors", None),
+    "formating": (".base.formating", None),
+    "models": (".base.models", None),
+    "style": (".base.style", None),
+    "keys": (".inputs.keys", None),
+    "mouse": (".inputs.mouse", None),
+    "fuzzy": (".inputs.fuzzy", None),
+    "sources": (".inputs.sources", None),
+    "select_menu": (".inputs.select_menu", None),
+    "directory": (".inputs.directory", None),
+    "sprites": (".shapes.sprites", None),
+    "transformations": (".maths.transformations", None),
+    # Animations.
+    "Bar": (".animations.loadings", "Bar"),
+    "Spinner": (".animations.loadings", "Spinner"),
+    "Progress": (".animations.loadings", "Progress"),
+    "MultiProgress": (".animations.loadings", "MultiProgress"),
+    "track": (".animations.loadings", "track"),
+    "Screen": (".animations.screen", "Screen"),
+    "Canvas": (".animations.canvas", "Canvas"),
+    # Base.
+    "printc": (".base.style", "printc"),
+    "Color": (".base.style", "Color"),
+    "Text": (".base.style", "Text"),
+    "Back": (".base.style", "Back"),
+    "strip_ansi": (".base.ansi", "strip_ansi"),
+    "visible_len": (".base.ansi", "visible_len"),
+    "table": (".base.formating", "table"),
+    "table_lines": (".base.formating", "table_lines"),
+    "print_table": (".base.formating", "print_table"),
+    "BORDERS": (".base.boxes", "BORDERS"),
+    # Inputs.
+    "get_key": (".inputs.keys", "get_key"),
+    "KeyReader": (".inputs.keys", "KeyReader"),
+    "SelectMenu": (".inputs.select_menu", "SelectMenu"),
+    "MultiSelectMenu": (".inputs.select_menu", "MultiSelectMenu"),
+    "DirectoryBrowser": (".inputs.directory", "DirectoryBrowser"),
+    "Validator": (".inputs.inputs", "Validator"),
+    "boolean_input": (".inputs.inputs", "boolean_input"),
+    # Maths.
+    "Vector2D": (".maths.maths", "Vector2D"),
+    "Size": (".maths.maths", "Size"),
+}
+# Subpackages, also imported on first access.
+_PACKAGES: tuple[str, ...] = ("animations", "base", "compatibility", "inputs", "maths", "shapes")
+
+__all__: list[str] = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import the module of a public name on first access, then keep the name as an attribute.
+    """
+    if name in _PACKAGES:
+        return importlib.import_module(f".{name}", __name__)
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _EXPORTS[name]
+    module = importlib.import_module(module_name, __name__)
+    value: Any = module if attribute is None else getattr(module, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__, *_PACKAGES})
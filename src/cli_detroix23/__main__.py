@@ -2,15 +2,75 @@
 """
 main.py
 """
-import base.style as style
-import animations.exemples
-import animations.loadings as loadings
-import inputs.select_menu as select
-import base.exemples
-import base.models as models
-import shapes.exemples
-import base.colors
-import inputs.exemples
+import os
+import sys
+import importlib
+
+from .base import style
+from .inputs import select_menu as select
+from .base import models
+
+# Menu entries: module (in the package) and function of the demo. Modules are imported only when chosen.
+DEMOS: dict[str, tuple[str, str]] = {
+    "Animations.Matrix": ("animations.exemples", "run_matrix"),
+    "Animations.Canvas": ("animations.exemples", "run_plot"),
+    "Animations.Image": ("animations.exemples", "run_picture"),
+    "Base.Style": ("base.exemples", "main"),
+    "Animations.Loadings": ("animations.loadings", "main"),
+    "Base.Models": ("base.exemples", "run_models"),
+    "Shapes.Base": ("shapes.exemples", "run_exemple1"),
+    "Base.Colors": ("base.colors", "main"),
+    "Inputs.Keys": ("inputs.exemples", "run_basic_keys"),
+    "Inputs.Sources": ("inputs.exemples", "run_sources"),
+    "Inputs.Directory": ("inputs.directory", "main"),
+}
+
+# Import time budget of this entry point, in milliseconds (checked by `--startup`).
+STARTUP_BUDGET: float = 20.0
+# Interpreters started by `--startup`: their median time is checked, not a single noisy one.
+STARTUP_RUNS: int = 7
+
+
+def startup_time(runs: int = STARTUP_RUNS) -> float:
+    """
+    Return the time taken to import this entry point's modules, in milliseconds:
+    the median of `runs` measures (see `_import_time`).
+    """
+    import statistics
+    return statistics.median(_import_time() for _ in range(runs))
+
+def _import_time() -> float:
+    """
+    Return the time taken to import this entry point's modules once, in milliseconds.
+    Measured in a new interpreter with `python -X importtime`: the cumulative time of each
+    module of the package imported at top level (with the modules it imports, `typing`, `re`... included).
+    """
+    import subprocess
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {__package__}.__main__"],
+        capture_output=True,
+        text=True,
+        # Where the package is.
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    )
+    total: int = 0
+    for line in process.stderr.splitlines():
+        # `import time: self [us] | cumulative | name`, nested imports being indented.
+        fields: list[str] = line.split("|")
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            continue
+        name: str = fields[2][1:]
+        if not name.startswith(" ") and name.split(".")[0] == __package__:
+            total += int(fields[1])
+    return total / 1000
+
+
+def run_demo(name: str) -> None:
+    """
+    Import the module of a demo, and run it.
+    """
+    module_name, function = DEMOS[name]
+    getattr(importlib.import_module(f".{module_name}", __package__), function)()
 
 def main() -> None:
     print("# CLI module for Python, by Detroix23.")
@@ -19,45 +79,14 @@ def main() -> None:
     try:
         while user_in:
             main_select: select.SelectMenu = select.SelectMenu(
-                [
-                    "Animations.Matrix",
-                    "Base.Style", 
-                    "Animations.Loadings",
-                    "Base.Models",
-                    "Shapes.Base",
-                    "Base.Colors",
-                    "Inputs.Keys",
-                    "Quit",
-                ],
+                [*DEMOS, "Quit"],
                 models.select_gh_style("Select widget.")
             )
             user_main_choice: str = main_select.show()
             print()
 
-            if user_main_choice == "Animations.Matrix":
-                animations.exemples.run_matrix()
-
-            elif user_main_choice == "Base.Style":
-                base.exemples.main()
-
-            elif user_main_choice == "Animations.Loadings":
-                loadings.main()
-
-            elif user_main_choice == "Base.Models":
-                print(models.input_gh_style("What's your name ? I dont read it actually.", usage="asd", default="a"))
-                print(models.bool_gh_style("You sure ? But I dont care"))
-                print(models.select_gh_style("You know this one."))
-
-                print()
-
-            elif user_main_choice == "Shapes.Base":
-                shapes.exemples.run_exemple1()
-
-            elif user_main_choice == "Base.Colors":
-                base.colors.main()
-
-            elif user_main_choice == "Inputs.Keys":
-                inputs.exemples.run_basic_keys()
+            if user_main_choice in DEMOS:
+                run_demo(user_main_choice)
 
             elif user_main_choice == "Quit":
                 style.printc("Quiting.", style=style.Color.YELLOW)
@@ -72,4 +101,9 @@ def main() -> None:
         style.printc("Quiting (Ctrl+C).", style=style.Color.YELLOW)
 
 if __name__ == "__main__":
+    if "--startup" in sys.argv:
+        # Startup check: fails when over budget.
+        elapsed: float = startup_time()
+        print(f"Startup: {elapsed:.1f}ms (budget: {STARTUP_BUDGET}ms).")
+        sys.exit(elapsed > STARTUP_BUDGET)
     main()
\ No newline at end of file
@@ -0,0 +1,146 @@
+"""
+CLI - Animations
+async_loadings.py
+asyncio integration of the loadings animations: no thread, everything runs on the event loop.
+"""
+import asyncio
+from typing import Any, AsyncIterable, AsyncIterator, Awaitable, Optional, TypeVar
+
+from . import loadings
+
+T = TypeVar("T")
+
+
+class Animate:
+    """
+    Async context manager animating while the awaited work runs. \n
+    A background task redraws the animation every `interval` seconds: spinners
+    advance one symbol per redraw, bars update their time and rate.
+    The animation is finished on success, stopped on exception or cancellation.
+    ```python
+        async with Animate(spinner):
+            data = await reader.read()
+    ```
+    """
+    animation: loadings.Animation
+    interval: float
+    _task: Optional['asyncio.Task[None]']
+
+    def __init__(self, animation: loadings.Animation, interval: float = 0.1, reset: bool = True) -> None:
+        self.animation: loadings.Animation = animation
+        self.interval: float = interval
+        self._task = None
+        if reset:
+            animation.reset()
+
+    async def _run(self) -> None:
+        """
+        Background task loop.
+        """
+        while True:
+            if isinstance(self.animation, loadings.Spinner):
+                self.animation.tick()
+            else:
+                self.animation.refresh()
+            await asyncio.sleep(self.interval)
+
+    async def __aenter__(self) -> loadings.Animation:
+        self._task = asyncio.get_running_loop().create_task(self._run())
+        return self.animation
+
+    async def __aexit__(self, exception_type: Optional[type[BaseException]], *_: object) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        if exception_type is None:
+            self.animation.finish()
+        else:
+            self.animation.stop()
+
+
+async def track(
+    iterable: AsyncIterable[T],
+    animation: Optional[loadings.Animation] = None,
+    *, total: Optional[int] = None,
+    prefix: str = "Loading: ",
+    interval: float = 0.1,
+) -> AsyncIterator[T]:
+    """
+    `async for` over an async iterable, counting each item, and animating between items.
+    ```python
+        async for chunk in track(stream.iter_chunks(), prefix="Reading: "):
+            ...
+    ```
+    """
+    if animation is None:
+        # Counting redraws at most as often as the background task.
+        animation = loadings.default_animation(total, prefix, interval)
+
+    async with Animate(animation, interval):
+        async for item in iterable:
+            yield item
+            animation.increment()
+
+async def gather(
+    *awaitables: Awaitable[T],
+    animation: Optional[loadings.Animation] = None,
+    prefix: str = "Tasks: ",
+    interval: float = 0.1,
+    return_exceptions: bool = False,
+) -> list[Any]:
+    """
+    Like `asyncio.gather`, one operation counted per completed awaitable on a single bar.
+    If an awaitable raises (without `return_exceptions`), the others keep running as with
+    `asyncio.gather`, but are no longer counted: the stopped bar isn't redrawn.
+    """
+    if animation is None:
+        animation = loadings.default_animation(len(awaitables), prefix, interval)
+    counted: loadings.Animation = animation
+
+    def count(_: object) -> None:
+        # Callbacks already scheduled when the bar stopped.
+        if counted.state in (loadings.State.READY, loadings.State.RUNNING):
+            counted.increment()
+
+    async with Animate(animation, interval):
+        tasks: list[asyncio.Future[T]] = [asyncio.ensure_future(awaitable) for awaitable in awaitables]
+        for task in tasks:
+            task.add_done_callback(count)
+        try:
+            return await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+        finally:
+            for task in tasks:
+                task.remove_done_callback(count)
+
+
+async def _exemples() -> None:
+    import random
+
+    # Spinner while awaiting.
+    async with Animate(loadings.default_animation(None, "Waiting: ")):
+        await asyncio.sleep(2)
+    print()
+
+    # Async iteration.
+    async def numbers() -> AsyncIterator[int]:
+        for i in range(30):
+            await asyncio.sleep(0.05)
+            yield i
+    async for _ in track(numbers(), total=30, prefix="Async for: "):
+        pass
+    print()
+
+    # Many tasks on one bar.
+    await gather(*(asyncio.sleep(random.random() * 2) for _ in range(100)))
+    print()
+
+def main() -> None:
+    asyncio.run(_exemples())
+
+if __name__ == "__main__":
+    main()
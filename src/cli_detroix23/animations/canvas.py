@@ -0,0 +1,167 @@
+"""
+CLI - Animations
+canvas.py
+Pixel canvas, drawn on a `Screen` with half-block or braille characters.
+Pixels are bit-packed: one byte per cell, converted to a glyph by a table lookup.
+"""
+from enum import Enum
+
+from ..maths import maths
+from . import screen
+from ..base import style
+
+
+class Mode(Enum):
+    """
+    Pixels packing: 1x2 pixels in half-blocks, 2x4 pixels in braille cells.
+    """
+    HALF_BLOCK = 0
+    BRAILLE = 1
+
+
+# Pixels per cell, (x, y).
+CELL_SIZES: dict[Mode, tuple[int, int]] = {
+    Mode.HALF_BLOCK: (1, 2),
+    Mode.BRAILLE: (2, 4),
+}
+# Bit of each pixel of a cell, by [y][x].
+CELL_BITS: dict[Mode, list[list[int]]] = {
+    Mode.HALF_BLOCK: [[0x01], [0x02]],
+    Mode.BRAILLE: [[0x01, 0x08], [0x02, 0x10], [0x04, 0x20], [0x40, 0x80]],
+}
+# Glyph of each cell value. An empty cell is an empty string, so the screen is left untouched.
+GLYPHS: dict[Mode, list[str]] = {
+    Mode.HALF_BLOCK: ["", "▀", "▄", "█"],
+    Mode.BRAILLE: [""] + [chr(0x2800 + mask) for mask in range(1, 256)],
+}
+
+
+class Canvas:
+    """
+    Monochrome pixel buffer, `mode` defining the resolution of each cell.
+    (0, 0) is the upper left corner.
+    """
+    mode: Mode
+    cells: maths.Size
+    size: maths.Size
+    pixels: bytearray
+    styles: str
+
+    def __init__(self, cells: maths.Size, mode: Mode = Mode.BRAILLE, styles: str = "") -> None:
+        """
+        Create a blank canvas of `cells` characters.
+        """
+        self.mode: Mode = mode
+        self._cell_size: tuple[int, int] = CELL_SIZES[mode]
+        self._bits: list[list[int]] = CELL_BITS[mode]
+        self.styles: str = styles
+        self._glyphs: list[str] = self._styled_glyphs(styles)
+        self.resize(cells)
+
+    @staticmethod
+    def from_screen(support: screen.Screen, mode: Mode = Mode.BRAILLE, styles: str = "") -> 'Canvas':
+        """
+        Create a canvas covering the whole screen.
+        """
+        return Canvas(maths.Size(support.size.x, support.size.y), mode, styles)
+
+    def _styled_glyphs(self, styles: str) -> list[str]:
+        """
+        Return the glyph table, with the style applied once to every glyph.
+        """
+        if not styles:
+            return GLYPHS[self.mode]
+        return [glyph and styles + glyph + style.END for glyph in GLYPHS[self.mode]]
+
+    def resize(self, cells: maths.Size) -> None:
+        """
+        Change the number of cells. Clears the canvas.
+        """
+        self.cells: maths.Size = maths.Size(cells.x, cells.y)
+        self.size: maths.Size = maths.Size(cells.x * self._cell_size[0], cells.y * self._cell_size[1])
+        self.pixels: bytearray = bytearray(cells.x * cells.y)
+
+    def clear(self) -> None:
+        """
+        Turn off every pixel.
+        """
+        self.pixels[:] = bytes(len(self.pixels))
+
+    def set(self, x: int, y: int, on: bool = True) -> None:
+        """
+        Turn on (or off) a pixel. Pixels outside of the canvas are ignored.
+        """
+        if 0 <= x < self.size.x and 0 <= y < self.size.y:
+            cell_x, bit_x = divmod(x, self._cell_size[0])
+            cell_y, bit_y = divmod(y, self._cell_size[1])
+            if on:
+                self.pixels[cell_y * self.cells.x + cell_x] |= self._bits[bit_y][bit_x]
+            else:
+                self.pixels[cell_y * self.cells.x + cell_x] &= ~self._bits[bit_y][bit_x]
+
+    def get(self, x: int, y: int) -> bool:
+        """
+        Return if a pixel is on.
+        """
+        if 0 <= x < self.size.x and 0 <= y < self.size.y:
+            cell_x, bit_x = divmod(x, self._cell_size[0])
+            cell_y, bit_y = divmod(y, self._cell_size[1])
+            return bool(self.pixels[cell_y * self.cells.x + cell_x] & self._bits[bit_y][bit_x])
+        return False
+
+    def line(self, start: maths.Vector2D, end: maths.Vector2D) -> None:
+        """
+        Turn on the pixels of a line, using Bresenham's algorithm.
+        """
+        x0, y0 = int(start.x), int(start.y)
+        x1, y1 = int(end.x), int(end.y)
+        dx: int = abs(x1 - x0)
+        dy: int = -abs(y1 - y0)
+        step_x: int = 1 if x0 < x1 else -1
+        step_y: int = 1 if y0 < y1 else -1
+        error: int = dx + dy
+
+        while True:
+            self.set(x0, y0)
+            if x0 == x1 and y0 == y1:
+                break
+            double: int = 2 * error
+            if double >= dy:
+                error += dy
+                x0 += step_x
+            if double <= dx:
+                error += dx
+                y0 += step_y
+
+    def rows(self) -> maths.table2D:
+        """
+        Return the 2D table of glyphs, one per cell.
+        """
+        glyphs: list[str] = self._glyphs
+        width: int = self.cells.x
+        return [
+            [glyphs[mask] for mask in self.pixels[y * width:(y + 1) * width]]
+            for y in range(self.cells.y)
+        ]
+
+    def draw(self, support: screen.Screen, position: maths.Vector2D = maths.Vector2D(0, 0)) -> None:
+        """
+        Write the lit cells on the screen char table, from the upper left `position`.
+        Blank cells leave the screen untouched.
+        """
+        glyphs: list[str] = self._glyphs
+        width: int = self.cells.x
+        start_x: int = int(position.x)
+        start_y: int = int(position.y)
+        table: list[list[str]] = support.char_table
+
+        for y in range(max(0, -start_y), min(self.cells.y, len(table) - start_y)):
+            row: list[str] = table[start_y + y]
+            limit: int = len(row) - start_x
+            for x, mask in enumerate(self.pixels[y * width:(y + 1) * width]):
+                if mask and 0 <= start_x + x and x < limit:
+                    row[start_x + x] = glyphs[mask]
+
+
+if __name__ == "__main__":
+    print("See `animations/exemples.py`.")
@@ -3,11 +3,14 @@ CLI - Animations
 exemples.py
 """
 import time
+import math
 import random
 
-import maths.maths as maths
-import animations.screen as screen
-import base.style as style
+from ..maths import maths
+from . import screen
+from . import canvas
+from . import images
+from ..base import style
 
 class Dropplet:
     """
@@ -139,6 +142,89 @@ class Matrix(screen.Screen):
 
 
 
+class Plot(screen.Screen):
+    """
+    Scrolling sine wave, drawn on a braille canvas.
+    Left and right arrows change the scrolling speed, space pauses.
+    """
+    canvas: canvas.Canvas
+    shift: int
+    speed: int
+
+    def __init__(self, frame_delay: float, mode: canvas.Mode = canvas.Mode.BRAILLE) -> None:
+        super().__init__(
+            frame_delay=frame_delay,
+            void_char=" ",
+            debug=False,
+            deactivate_screen=False
+        )
+        self.canvas = canvas.Canvas.from_screen(self, mode, style.Color.LIGHT_GREEN)
+        self.shift = 0
+        self.speed = 1
+
+    def on_key(self, key: str) -> None:
+        if key == "\x1b[C":
+            self.speed += 1
+        elif key == "\x1b[D":
+            self.speed -= 1
+        elif key == " ":
+            self.speed = 0 if self.speed else 1
+
+    def updater(self) -> None:
+        self.shift += self.speed
+        if self.canvas.cells.x != self.size.x or self.canvas.cells.y != self.size.y:
+            self.canvas.resize(maths.Size(self.size.x, self.size.y))
+        self.canvas.clear()
+
+        height: int = self.canvas.size.y
+        previous: maths.Vector2D = maths.Vector2D(0, height // 2)
+        for x in range(self.canvas.size.x):
+            y: float = height / 2 * (1 - 0.8 * math.sin((x + self.shift) / 12))
+            current: maths.Vector2D = maths.Vector2D(x, y)
+            self.canvas.line(previous, current)
+            previous = current
+
+    def drawer(self) -> None:
+        self.canvas.draw(self)
+
+
+def run_plot() -> None:
+    screen = Plot(frame_delay=1/30)
+
+    screen.run(Plot.updater, Plot.drawer, Plot.on_key)
+
+class Picture(screen.Screen):
+    """
+    Show a generated image, re-rendered only when the window is resized.
+    """
+    image: images.Image
+
+    def __init__(self, frame_delay: float, width: int = 320, height: int = 200) -> None:
+        super().__init__(
+            frame_delay=frame_delay,
+            void_char=" ",
+            debug=False,
+            deactivate_screen=False
+        )
+        pixels: bytearray = bytearray()
+        for y in range(height):
+            for x in range(width):
+                wave: float = math.sin(x / 16) + math.sin(y / 8) + math.sin((x + y) / 24)
+                pixels += bytes((x * 255 // width, int(42 * (wave + 3)), y * 255 // height))
+        self.image = images.from_rgb(pixels, width, height, source="plasma")
+
+    def updater(self) -> None:
+        pass
+
+    def drawer(self) -> None:
+        images.draw_image(self, self.image)
+
+
+def run_picture() -> None:
+    screen = Picture(frame_delay=1/10)
+
+    screen.run(Picture.updater, Picture.drawer)
+
 def run_matrix() -> None:
     # (48, 49) binary.
 	# (32, 132) general.
@@ -0,0 +1,344 @@
+"""
+CLI - Animations
+images.py
+Display images (PPM/ PGM files, raw RGB buffers) on a `Screen` with half-block cells.
+Each cell holds 2 pixels: the upper one as foreground of `▀`, the lower one as background.
+Uses NumPy when available, and a pure Python fallback.
+"""
+import io
+import mmap
+import itertools
+from collections import OrderedDict
+from typing import Iterator, Optional, Union
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from ..maths import maths
+from . import screen
+from ..base import colors
+from ..base import style
+
+# Type - Any bytes-like pixels buffer.
+Buffer = Union[bytes, bytearray, memoryview, mmap.mmap]
+
+HALF_BLOCK: str = "▀"
+# Number of converted frames kept in cache.
+CACHE_SIZE: int = 64
+
+_buffer_ids: Iterator[int] = itertools.count()
+# Rendered tables by (image source, columns, rows, depth), the least recently used first.
+# Keyed by the source, not the image: its buffer (a frame's memory map) isn't kept alive.
+_RENDERED: OrderedDict[tuple[str, int, int, Optional[colors.Depth]], maths.table2D] = OrderedDict()
+
+
+class ImageError(Exception):
+    """
+    Raised when an image can't be read or doesn't match its size.
+    """
+    message: str
+
+    def __init__(self, message: str) -> None:
+        self.message: str = message
+        super().__init__(message)
+
+    def __repr__(self) -> str:
+        return f"(X) - ImageError: {self.message}."
+
+    def __str__(self) -> str:
+        return f"(X) - ImageError: {self.message}."
+
+
+class Image:
+    """
+    RGB image, 3 bytes per pixel, rows from top to bottom. \n
+    `source` identifies the pixels (a path, a frame...) and is used as cache key:
+    two images with the same source are considered equal.
+    """
+    width: int
+    height: int
+    data: Buffer
+    source: str
+
+    def __init__(self, width: int, height: int, data: Buffer, source: Optional[str] = None) -> None:
+        if len(data) < width * height * 3:
+            raise ImageError(f"Buffer too small for {width}x{height} RGB ({len(data)} bytes)")
+        self.width: int = width
+        self.height: int = height
+        self.data: Buffer = data
+        self.source: str = source if source is not None else f"<buffer {next(_buffer_ids)}>"
+
+    def __hash__(self) -> int:
+        return hash(self.source)
+
+    def __eq__(self, target: object) -> bool:
+        if isinstance(target, Image):
+            return self.source == target.source
+        return False
+
+    def __repr__(self) -> str:
+        return f"Image(width: int = {self.width}, height: int = {self.height}, source: str = {repr(self.source)})"
+
+
+def _pnm_token(stream: io.BufferedReader) -> bytes:
+    """
+    Read the next whitespace separated token of a PNM header, skipping comments.
+    """
+    token: bytes = b""
+    while True:
+        char: bytes = stream.read(1)
+        if not char:
+            return token
+        if char == b"#":
+            stream.readline()
+        elif char.isspace():
+            if token:
+                return token
+        else:
+            token += char
+
+def load_pnm(path: str) -> Image:
+    """
+    Load a PPM (P6, P3) or PGM (P5, P2) image. Gray images are expanded to RGB.
+    """
+    with open(path, "rb") as stream:
+        magic: bytes = _pnm_token(stream)
+        if magic not in {b"P2", b"P3", b"P5", b"P6"}:
+            raise ImageError(f"Unsupported format {magic!r} in {path}")
+        width, height, maximum = (int(_pnm_token(stream)) for _ in range(3))
+        channels: int = 3 if magic in {b"P3", b"P6"} else 1
+        count: int = width * height * channels
+
+        if magic in {b"P5", b"P6"}:
+            if maximum > 255:
+                raise ImageError(f"16 bits images are not supported ({path})")
+            data: bytes = stream.read(count)
+        else:
+            data = bytes(int(value) * 255 // maximum for value in stream.read().split()[:count])
+            maximum = 255
+
+    if len(data) < count:
+        raise ImageError(f"Truncated image {path}")
+    if maximum != 255:
+        data = bytes(value * 255 // maximum for value in data)
+    if channels == 1:
+        data = bytes(value for value in data for _ in range(3))
+
+    return Image(width, height, data, source=path)
+
+def from_rgb(data: Buffer, width: int, height: int, source: Optional[str] = None) -> Image:
+    """
+    Wrap a raw RGB buffer, without copy.
+    """
+    return Image(width, height, data, source)
+
+
+def _bins(source: int, target: int) -> list[tuple[int, int]]:
+    """
+    Return, for each of the `target` cells, the range of source pixels it covers (at least one).
+    """
+    return [
+        (start, max(start + 1, (i + 1) * source // target))
+        for i, start in ((i, i * source // target) for i in range(target))
+    ]
+
+def downsample(image: Image, width: int, height: int) -> bytes:
+    """
+    Return the RGB pixels of the image, box-filtered to `width` x `height`.
+    """
+    if numpy is not None:
+        pixels = numpy.frombuffer(image.data, dtype=numpy.uint8, count=image.width * image.height * 3)
+        pixels = pixels.reshape(image.height, image.width, 3).astype(numpy.uint32)
+        rows = numpy.arange(height) * image.height // height
+        columns = numpy.arange(width) * image.width // width
+        summed = numpy.add.reduceat(numpy.add.reduceat(pixels, rows, axis=0), columns, axis=1)
+        row_counts = numpy.maximum(numpy.diff(numpy.append(rows, image.height)), 1)
+        column_counts = numpy.maximum(numpy.diff(numpy.append(columns, image.width)), 1)
+        counts = (row_counts[:, None] * column_counts[None, :])[:, :, None]
+        return (summed // counts).astype(numpy.uint8).tobytes()
+
+    # Pure Python: sums of contiguous slices of each channel.
+    data: bytes = bytes(image.data[:image.width * image.height * 3])
+    channels: list[bytes] = [data[0::3], data[1::3], data[2::3]]
+    column_bins: list[tuple[int, int]] = _bins(image.width, width)
+    result: bytearray = bytearray()
+    for row_start, row_end in _bins(image.height, height):
+        offsets: range = range(row_start * image.width, row_end * image.width, image.width)
+        for column_start, column_end in column_bins:
+            count: int = (row_end - row_start) * (column_end - column_start)
+            for channel in channels:
+                result.append(sum(
+                    sum(channel[offset + column_start:offset + column_end]) for offset in offsets
+                ) // count)
+    return bytes(result)
+
+def _color_codes(pixels: bytes, depth: colors.Depth, background: bool) -> list[str]:
+    """
+    Return the escape code of each RGB pixel; quantized with the lookup tables.
+    """
+    if depth == colors.Depth.NONE:
+        return [""] * (len(pixels) // 3)
+    if depth == colors.Depth.TRUECOLOR:
+        code: str = "48" if background else "38"
+        return [
+            f"{style.ESC}[{code};2;{r};{g};{b}m"
+            for r, g, b in zip(pixels[0::3], pixels[1::3], pixels[2::3])
+        ]
+
+    if depth == colors.Depth.COLORS_256:
+        table: bytes = colors.lut_256()
+        codes: list[str] = colors.BG_256 if background else colors.FG_256
+    else:
+        table = colors.lut_16()
+        codes = colors.BG_16 if background else colors.FG_16
+
+    shift: int = 8 - colors.LUT_BITS
+    if numpy is not None:
+        rgb = numpy.frombuffer(pixels, dtype=numpy.uint8).reshape(-1, 3) >> shift
+        indexes = (rgb[:, 0].astype(numpy.uint32) << (2 * colors.LUT_BITS)) | (rgb[:, 1].astype(numpy.uint32) << colors.LUT_BITS) | rgb[:, 2]
+        quantized: bytes = numpy.frombuffer(table, dtype=numpy.uint8)[indexes].tobytes()
+    else:
+        quantized = bytes(
+            table[(r >> shift) << (2 * colors.LUT_BITS) | (g >> shift) << colors.LUT_BITS | (b >> shift)]
+            for r, g, b in zip(pixels[0::3], pixels[1::3], pixels[2::3])
+        )
+    return [codes[index] for index in quantized]
+
+def render(image: Image, columns: int, rows: int, depth: Optional[colors.Depth] = None) -> maths.table2D:
+    """
+    Return the 2D table of half-block cells of the image, scaled to `columns` x `rows`.
+    Cached by (image source, size, depth), for the `CACHE_SIZE` most recent ones.
+    """
+    key: tuple[str, int, int, Optional[colors.Depth]] = (image.source, columns, rows, depth)
+    cached: Optional[maths.table2D] = _RENDERED.get(key)
+    if cached is not None:
+        _RENDERED.move_to_end(key)
+        return cached
+
+    depth = colors.color_depth() if depth is None else depth
+    pixels: bytes = downsample(image, columns, rows * 2)
+    line: int = columns * 3
+
+    table: maths.table2D = list()
+    for row in range(rows):
+        upper: bytes = pixels[2 * row * line:(2 * row + 1) * line]
+        lower: bytes = pixels[(2 * row + 1) * line:(2 * row + 2) * line]
+        table.append([
+            foreground + background + HALF_BLOCK
+            for foreground, background in zip(
+                _color_codes(upper, depth, False),
+                _color_codes(lower, depth, True),
+            )
+        ])
+    _RENDERED[key] = table
+    if len(_RENDERED) > CACHE_SIZE:
+        _RENDERED.popitem(last=False)
+    return table
+
+def fit(image: Image, size: maths.Size) -> maths.Size:
+    """
+    Return the biggest cells size holding the image in `size`, keeping its ratio (cells are 1x2 pixels).
+    """
+    columns: int = min(size.x, image.width * size.y * 2 // image.height)
+    rows: int = min(size.y, image.height * size.x // (image.width * 2))
+    return maths.Size(max(1, columns), max(1, rows))
+
+def draw_image(
+    support: screen.Screen,
+    image: Image,
+    position: maths.Vector2D = maths.Vector2D(0, 0),
+    size: Optional[maths.Size] = None,
+) -> None:
+    """
+    Write the image on the screen char table, from the upper left `position`.
+    By default, fits the whole screen.
+    """
+    size = fit(image, support.size) if size is None else size
+    start_x: int = int(position.x)
+    start_y: int = int(position.y)
+    table: list[list[str]] = support.char_table
+
+    for y, cells in enumerate(render(image, size.x, size.y)):
+        if 0 <= start_y + y < len(table):
+            row: list[str] = table[start_y + y]
+            visible: list[str] = cells[max(0, -start_x):max(0, len(row) - start_x)]
+            row[max(0, start_x):max(0, start_x) + len(visible)] = visible
+
+
+class FrameStream:
+    """
+    Sequence of raw RGB frames, stored back to back in a memory-mapped file.
+    Frames are read without copy, only the displayed ones are converted.
+    """
+    path: str
+    width: int
+    height: int
+
+    def __init__(self, path: str, width: int, height: int) -> None:
+        self.path: str = path
+        self.width: int = width
+        self.height: int = height
+        self._frame_size: int = width * height * 3
+        self._file = open(path, "rb")
+        self._map: mmap.mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __len__(self) -> int:
+        return len(self._map) // self._frame_size
+
+    def __getitem__(self, index: int) -> Image:
+        if not 0 <= index < len(self):
+            raise IndexError(f"(X) - Frame {index} out of {len(self)}.")
+        start: int = index * self._frame_size
+        return Image(
+            self.width,
+            self.height,
+            memoryview(self._map)[start:start + self._frame_size],
+            source=f"{self.path}#{index}",
+        )
+
+    def __iter__(self) -> Iterator[Image]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def close(self) -> None:
+        """
+        Release the memory map and the file. Its rendered frames stay cached (by source).
+        """
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self) -> 'FrameStream':
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+
+class Player(screen.Screen):
+    """
+    Display the frames of a stream, one per screen frame, looping.
+    """
+    stream: FrameStream
+    index: int
+
+    def __init__(self, stream: FrameStream, frame_delay: float = 1/24) -> None:
+        super().__init__(
+            void_char=" ",
+            frame_delay=frame_delay,
+            debug=False,
+            deactivate_screen=False
+        )
+        self.stream: FrameStream = stream
+        self.index: int = 0
+
+    def updater(self) -> None:
+        self.index = (self.index + 1) % len(self.stream)
+
+    def drawer(self) -> None:
+        draw_image(self, self.stream[self.index])
+
+
+if __name__ == "__main__":
+    print("See `animations/exemples.py`.")
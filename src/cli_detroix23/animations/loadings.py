@@ -7,20 +7,230 @@ Utilize the \r escape operator
 
 import time
 import sys
+import threading
 from enum import Enum
-from typing import Union
+from string import Formatter
+from typing import Callable, Generic, Iterable, Iterator, Optional, TypeVar, Union
+
+from ..base import ansi
+
+T = TypeVar("T")
 
 class State(Enum):
     READY = 0
     RUNNING = 1
     FINISHED = 2
+    STOPPED = 3
+
+class RateEstimator:
+    """
+    Smoothed throughput, in operations per second. \n
+    Operations are counted over time windows of `window` seconds, and each window's rate
+    is blended in an exponential moving average: bursts are averaged over their window.
+    O(1) per update, no history.
+    """
+    window: float
+    smoothing: float
+    _rate: Optional[float]
+    _start_time: float
+    _start_count: int
+    _window_time: float
+    _window_count: int
+    _last_time: float
+    _last_count: int
+
+    def __init__(self, window: float = 0.5, smoothing: float = 0.3) -> None:
+        """
+        `smoothing` is the weight of the last window, between 0 and 1.
+        """
+        self.window: float = window
+        self.smoothing: float = smoothing
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Forget every measure.
+        """
+        self._rate = None
+        self._start_time = 0.0
+        self._start_count = 0
+        self._window_time = 0.0
+        self._window_count = 0
+        self._last_time = 0.0
+        self._last_count = 0
+
+    def update(self, count: int, now: float) -> None:
+        """
+        Give the total count of operations at `now` (monotonic seconds).
+        """
+        self._last_time = now
+        self._last_count = count
+        if self._start_time == 0:
+            self._start_time = self._window_time = now
+            self._start_count = self._window_count = count
+            return
+
+        elapsed: float = now - self._window_time
+        if elapsed >= self.window:
+            sample: float = (count - self._window_count) / elapsed
+            if self._rate is None:
+                self._rate = sample
+            else:
+                self._rate += self.smoothing * (sample - self._rate)
+            self._window_time = now
+            self._window_count = count
+
+    @property
+    def rate(self) -> float:
+        """
+        Smoothed operations per second. Before the first full window, the average since the start.
+        """
+        if self._rate is not None:
+            return self._rate
+        elapsed: float = self._last_time - self._start_time
+        if elapsed <= 0:
+            return 0.0
+        return (self._last_count - self._start_count) / elapsed
+
+    def eta(self, remaining: int) -> Optional[float]:
+        """
+        Return the estimated seconds to do the `remaining` operations, if the rate is known.
+        """
+        rate: float = self.rate
+        if rate <= 0:
+            return None
+        return max(0, remaining) / rate
+
+
+# Partial blocks, from 1/8 to 7/8 (cf. `base.boxes.CharactersList.BLOCK_ELEMENTS`).
+EIGHTHS: list[str] = ["", "▏", "▎", "▍", "▌", "▋", "▊", "▉"]
+FULL_BLOCK: str = "█"
+
+# Every displayed percentage, per 0.1%.
+PERCENTAGES: list[str] = [f"{permille / 10:5.1f}%" for permille in range(1001)]
+
+
+class Template:
+    """
+    Line layout, compiled once into static segments and dynamic fields. \n
+    `layout` uses `{name}` fields: the ones given in `static` are inlined at compilation,
+    the others are the dynamic fields, filled on each draw in their order of appearance.
+    `update` returns only what changed: cursor-column moves and the new fields' text.
+    ```python
+        template = Template("{prefix}[{bar}] {percentage}", {"prefix": "Loading: "})
+        template.update(["####  ", " 66.7%"])
+    ```
+    """
+    fields: list[str]
+    end: str
+    _statics: list[str]
+    _widths: list[int]
+    _previous: Optional[list[str]]
+    _previous_widths: list[int]
+
+    def __init__(self, layout: str, static: dict[str, str] = dict(), end: str = "") -> None:
+        """
+        `end` is written after each full draw or update (like a `\\r`).
+        """
+        self.fields: list[str] = list()
+        self.end: str = end
+        self._statics = [""]
+        for text, name, _, _ in Formatter().parse(layout):
+            self._statics[-1] += text
+            if name is None:
+                continue
+            if name in static:
+                self._statics[-1] += static[name]
+            else:
+                self.fields.append(name)
+                self._statics.append("")
+        self._widths = [ansi.visible_len(static) for static in self._statics]
+        self._previous = None
+        self._previous_widths = list()
+
+    def render(self, values: list[str]) -> str:
+        """
+        Return the whole line, with the values of the dynamic fields.
+        """
+        line: str = self._statics[0]
+        for value, static in zip(values, self._statics[1:]):
+            line += value + static
+        return line
+
+    def draw(self, values: list[str]) -> str:
+        """
+        Return the whole line to write from the start of the line, and remember it.
+        """
+        self._previous = values
+        self._previous_widths = [ansi.visible_len(value) for value in values]
+        return "\r" + self.render(values) + "\x1b[K" + self.end
+
+    def update(self, values: list[str]) -> str:
+        """
+        Return the escapes and text rewriting only the changed fields (empty if none).
+        If a field changes width, the rest of the line is rewritten.
+        """
+        previous: Optional[list[str]] = self._previous
+        if previous is None:
+            return self.draw(values)
+
+        update: str = ""
+        column: int = 0
+        for index, (value, old, width, static) in enumerate(zip(values, previous, self._previous_widths, self._widths)):
+            column += static
+            if value != old:
+                if ansi.visible_len(value) != width:
+                    update += f"\x1b[{column + 1}G" + value
+                    for rest, text in zip(values[index + 1:], self._statics[index + 1:]):
+                        update += text + rest
+                    self._previous = values
+                    self._previous_widths = [ansi.visible_len(value) for value in values]
+                    return update + self._statics[-1] + "\x1b[K" + self.end
+                update += f"\x1b[{column + 1}G" + value
+            column += width
+
+        self._previous = values
+        if update:
+            update += self.end
+        return update
+
+    @property
+    def drawn(self) -> bool:
+        """
+        Get if the line was drawn since the last `forget`.
+        """
+        return self._previous is not None
+
+    def forget(self) -> None:
+        """
+        Forget the previous line: the next update is a full draw.
+        """
+        self._previous = None
+
+
+def is_terminal() -> bool:
+    """
+    Return if the standard output is a terminal (not a pipe or a file).
+    """
+    try:
+        return sys.stdout.isatty()
+    except (AttributeError, ValueError):
+        return False
+
 
 class Animation:
     """
-    Loading animation.
+    Loading animation. \n
+    Counting is cheap: the line is only redrawn when at least `min_delta` operations
+    were added, and `min_interval` seconds passed, since the last draw. \n
+    When the output is not a terminal (or `log` is True), plain status lines are written
+    instead, without escapes: one every `log_interval` seconds or `log_percent` percents.
     """
     _i: int
     first_time: float
+    last_time: float
+    _next_draw: int
+    _next_time: float
 
     state: State
 
@@ -34,11 +244,22 @@ class Animation:
         borders: str = "|",
         prefix: str = "Loading: ",
         suffix: str = " ",
-        more_counters: list[str] = list()
+        more_counters: list[str] = list(),
+        min_interval: float = 0.0,
+        min_delta: int = 1,
+        show_rate: bool = False,
+        log: Optional[bool] = None,
+        log_interval: float = 10.0,
+        log_percent: float = 10.0,
     ) -> None:
         self._i = 0
         self.first_time: float = 0
+        self.last_time: float = 0
         self.state: State = State.READY
+        self._next_draw = 0
+        self._next_time = 0.0
+        self.min_interval: float = min_interval
+        self.min_delta: int = max(1, min_delta)
 
         self.symbols: Union[list[str], str] = symbols
 
@@ -55,10 +276,218 @@ class Animation:
 
         self.counters: dict[str, int] = {counter: 0 for counter in more_counters}
 
+        self.show_rate: bool = show_rate
+        self._rate: RateEstimator = RateEstimator()
+        # Drawn by a `MultiProgress` instead of itself.
+        self.managed: bool = False
+        # Compiled on the next draw.
+        self._template: Optional[Template] = None
+
+        # Log mode: None to detect it on the next draw.
+        self.log: Optional[bool] = log
+        self.log_interval: float = log_interval
+        self.log_percent: float = log_percent
+        self._logging: bool = False
+        self._logged_time: float = 0.0
+        self._logged_percent: float = 0.0
+        self._logged_line: str = ""
+
+    def reset(self) -> None:
+        """
+        Reset the counter. Run this method when using default bars.
+        """
+        self._i = 0
+        self.first_time: float = 0
+        self.last_time: float = 0
+        self.state = State.READY
+        self._next_draw = 0
+        self._next_time = 0.0
+        self._rate.reset()
+        self._template = None
+        self._logged_time = 0.0
+        self._logged_percent = 0.0
+        self._logged_line = ""
+
+    @property
+    def count(self) -> int:
+        """
+        Get the number of operations done. Read-only.
+        """
+        return self._i
+
+    @property
+    def rate(self) -> float:
+        """
+        Get the smoothed operations per second. Read-only.
+        """
+        return self._rate.rate
+
+    @property
+    def eta(self) -> Optional[float]:
+        """
+        Get the estimated seconds left, if there is a maximum and a known rate. Read-only.
+        """
+        if self.max <= 0:
+            return None
+        return self._rate.eta(self.max - self._i)
+
+    def elapsed(self) -> float:
+        """
+        Return the seconds since the first increment, frozen once finished or stopped.
+        """
+        if self.first_time == 0:
+            return 0.0
+        return (self.last_time or time.monotonic()) - self.first_time
+
+    def _rate_text(self) -> str:
+        """
+        Return the throughput and ETA part of the template, if shown.
+        """
+        if not self.show_rate:
+            return ""
+        text: str = f"{self.rate:.1f}ops/s "
+        eta: Optional[float] = self.eta
+        if eta is not None and self.state == State.RUNNING:
+            text += f"ETA {eta:.1f}s "
+        return text
+
+    def increment(self, add: int = 1) -> None:
+        """
+        Progress the animation of `add` operations. Redraws only when due.
+        """
+        self._i += add
+        if self._i >= self._next_draw:
+            self._due()
+
+    def _due(self) -> None:
+        """
+        Enough operations were added: start the clock, and redraw if enough time passed.
+        """
+        now: float = time.monotonic()
+        if self.first_time == 0:
+            self.first_time = now
+            self.state = State.RUNNING
+
+        self._next_draw = self._i + self.min_delta
+        self._rate.update(self._i, now)
+        if now >= self._next_time:
+            self._next_time = now + self.min_interval
+            self.refresh()
+
+    def _compile(self) -> Template:
+        """
+        Return the template of the line, with every precomputed part.
+        """
+        raise NotImplementedError("(X) - `Animation` doesn't implement any template.")
+
+    def _values(self) -> list[str]:
+        """
+        Return the current values of the template's dynamic fields.
+        """
+        raise NotImplementedError("(X) - `Animation` doesn't implement any values.")
+
+    @property
+    def template(self) -> Template:
+        """
+        Get the compiled template, compiling it if needed (after a reset).
+        """
+        if self._template is None:
+            self._template = self._compile()
+            self._logging = not is_terminal() if self.log is None else self.log
+        return self._template
+
+    @property
+    def logging(self) -> bool:
+        """
+        Get if the animation writes plain log lines instead of updating its line.
+        """
+        self.template
+        return self._logging
+
+    def render(self) -> str:
+        """
+        Return the current line of the animation.
+        """
+        template: Template = self.template
+        return "\r" + template.render(self._values()) + template.end
+
+    def refresh(self) -> None:
+        """
+        Write the changes of the line since the last draw, hiding the cursor on the first.
+        """
+        if self.managed:
+            return
+        template: Template = self.template
+        if self._logging:
+            self._log()
+            return
+        if not template.drawn:
+            # Hide cursor
+            sys.stdout.write('\x1b[?25l')
+        update: str = template.update(self._values())
+        if update:
+            sys.stdout.write(update)
+            sys.stdout.flush()
+
+    def _log(self, force: bool = False) -> None:
+        """
+        Write a plain status line, if enough time or progress passed since the last one.
+        """
+        now: float = time.monotonic()
+        percent: float = self._i * 100 / self.max if self.max > 0 else 0.0
+        if (
+            force
+            or now - self._logged_time >= self.log_interval
+            or percent - self._logged_percent >= self.log_percent
+        ):
+            line: str = " ".join(ansi.strip_ansi(self.template.render(self._values())).split())
+            if line == self._logged_line:
+                return
+            self._logged_time = now
+            self._logged_percent = percent
+            self._logged_line = line
+            sys.stdout.write(line + "\n")
+            sys.stdout.flush()
+
+    def finish(self) -> None:
+        """
+        Allow to prematurly and ensure the animation to complete.
+        Set the state to FINISHED, and draw one last time.
+        """
+        if self._i < self.max:
+            self._i = self.max
+
+        self.state = State.FINISHED
+        self.last_time = time.monotonic()
+        self._close()
+
+    def stop(self) -> None:
+        """
+        Interrupt the animation where it is: set the state to STOPPED, and draw one last time.
+        """
+        self.state = State.STOPPED
+        self.last_time = time.monotonic()
+        self._close()
+
+    def _close(self) -> None:
+        """
+        Draw one last time, and show the cursor again.
+        """
+        if self.managed:
+            return
+        if self.logging:
+            self._log(force=True)
+            return
+        self.refresh()
+        # Show cursor again
+        sys.stdout.write('\x1b[?25h')
+        sys.stdout.flush()
+
 
 class Bar(Animation):
     """
     Loading bar, child of Animation.
+    With `smooth`, cells are filled by eighths with partial blocks: 8 times finer progress.
     """
     def __init__(
         self, 
@@ -70,6 +499,13 @@ class Bar(Animation):
         prefix: str,
         suffix: str = " ",
         more_counters: list[str] = list(),
+        min_interval: float = 0.0,
+        min_delta: int = 1,
+        show_rate: bool = False,
+        smooth: bool = False,
+        log: Optional[bool] = None,
+        log_interval: float = 10.0,
+        log_percent: float = 10.0,
     ) -> None:
         super().__init__(
             symbols,
@@ -81,80 +517,60 @@ class Bar(Animation):
             prefix,
             suffix,
             more_counters,
+            min_interval,
+            min_delta,
+            show_rate,
+            log,
+            log_interval,
+            log_percent,
         )
         # For Bar, ensure max > 0
         self.max = self.max if self.max > 0 else 1
+        self.smooth: bool = smooth
 
-        
-    def reset(self) -> None:
+
+    def _compile(self) -> Template:
         """
-        Reset the counter. Run this method when using default bars.
+        Compile the line, and the bar strip: `width` full cells then `width` empty ones,
+        each bar being a `width` long slice of it (8 * `width` + 1 steps if smooth).
         """
-        self._i = 0
-        self.first_time: float = 0
-        self.state = State.READY
-
-    def increment(self, add: int = 1) -> None:
-        if self.first_time == 0:
-            self.first_time = time.monotonic()
-            self.state = State.RUNNING
-        
-        self._i += add
-        progress_bar_symbol: str = self.symbols[0]
-        bar: str
-        if self.multiple > 0 and self._i <= self.max:
-            true_i: int = int(self.multiple * (float(self._i) / float(self.max)))
-            bar = (
-                progress_bar_symbol * true_i
-                + self.empty * (self.multiple - true_i)
-            )
-        elif self.multiple > 0 and self._i > self.max:
-            bar = progress_bar_symbol * self.multiple 
-        elif self._i <= self.max:
-            bar = (
-                progress_bar_symbol * self._i
-                + self.empty * (self.max - self._i)
-            )
-        else:
-            bar = progress_bar_symbol * self.max
-
-        template: str = "\r"
-
-        template += self.prefix
-        template += self.borders
-        template += bar
-        template += self.borders
-        template += " - "
-
-        percentage: float = self._i / self.max * 100
-        template += f"{percentage:.1f}% "
-        template += f"{self._i}/{self.max}ops "
-
-        time_elapsed: float = time.monotonic() - self.first_time
-        template += f"{time_elapsed:.2f}s "
+        width: int = self.multiple if self.multiple > 0 else self.max
+        self._width: int = width
+        self._strip: str = (FULL_BLOCK if self.smooth else self.symbols[0]) * width + self.empty * width
+        self._digits: int = len(str(self.max))
+        return Template(
+            "{prefix}{borders}{bar}{borders} - {percentage} {count} {time} {rate}{suffix}",
+            {"prefix": self.prefix, "borders": self.borders, "suffix": self.suffix},
+            end="\r",
+        )
 
-        template += self.suffix
-        template += "\r"
+    def _bar(self) -> str:
+        """
+        Return the bar of the current count: a slice of the strip, not one string per step.
+        """
+        width: int = self._width
+        if self.smooth:
+            eighths: int = min(8 * width, max(0, 8 * width * self._i // self.max))
+            full, partial = divmod(eighths, 8)
+            if partial:
+                # Full cells, the partial block, then one empty cell less.
+                return f"{self._strip[width - full:width]}{EIGHTHS[partial]}{self._strip[width + full + 1:2 * width]}"
+            return self._strip[width - full:2 * width - full]
+        full = min(width, max(0, width * self._i // self.max))
+        return self._strip[width - full:2 * width - full]
 
-        # Hide cursor
-        sys.stdout.write('\x1b[?25l')
-        sys.stdout.write(
-            template,
-        )
-        sys.stdout.flush()
-    
-    def finish(self) -> None:
+    def _values(self) -> list[str]:
         """
-        Allow to prematurly and ensure the bar to complete.
-        Fill the bar on call.
+        Bar, percentage, count, time and rate.
         """
-        if self._i < self.max:
-            self._i = self.max
-        
-        self.state = State.FINISHED
-        # Show cursor again
-        sys.stdout.write('\x1b[?25h')
-        self.increment(0)
+        permille: int = self._i * 1000 // self.max
+        return [
+            self._bar(),
+            PERCENTAGES[permille] if 0 <= permille <= 1000 else f"{permille / 10:5.1f}%",
+            f"{self._i:>{self._digits}}/{self.max}ops",
+            f"{self.elapsed():.2f}s",
+            self._rate_text() if self.show_rate else "",
+        ]
 
 class Spinner(Animation):
     """
@@ -170,7 +586,13 @@ class Spinner(Animation):
         borders: str = "|",
         prefix: str = "Loading: ",
         suffix: str = " ",
-        more_counters: list[str] = list()
+        more_counters: list[str] = list(),
+        min_interval: float = 0.0,
+        min_delta: int = 1,
+        show_rate: bool = False,
+        log: Optional[bool] = None,
+        log_interval: float = 10.0,
+        log_percent: float = 10.0,
     ) -> None:
         super().__init__(
             symbols,
@@ -182,7 +604,14 @@ class Spinner(Animation):
             prefix,
             suffix,
             more_counters,
+            min_interval,
+            min_delta,
+            show_rate,
+            log,
+            log_interval,
+            log_percent,
         )
+        self._frame: int = 0
 
     def more_counters(self, more_counters: Union[list[str], str]) -> None:
         """
@@ -197,133 +626,376 @@ class Spinner(Animation):
         """
         Reset the counter. Run this method when using default bars.
         """
-        self._i = 0
-        self.first_time: float = 0
-        self.state = State.READY
+        super().reset()
+        self._frame = 0
         # Update custom counters
         self.counters = {key: 0 for key in self.counters.keys()}
 
-    def increment(self, add: int = 1) -> None:
+    def tick(self, frames: int = 1) -> None:
         """
-        Progress the bar for 1 tick.
+        Advance the spinner of `frames` symbols and redraw, without counting operations.
+        Use it to animate while waiting.
         """
         if self.first_time == 0:
             self.first_time = time.monotonic()
             self.state = State.RUNNING
-        
-        self._i += add
-        i: int = self._i // self.multiple
-        
-        spinner: str = ""
-        for j in range(self.span):
-            spinner += self.symbols[(i + j) % len(self.symbols)]
-        
-        template: str = "\r"
+        self._frame += frames
+        self.refresh()
 
-        # Drawing
-        template += self.prefix
-        template += self.borders
+    def _compile(self) -> Template:
+        """
+        Compile the line, and every possible spinner.
+        """
+        self._spinners: list[str] = [
+            "".join(self.symbols[(i + j) % len(self.symbols)] for j in range(self.span))
+            for i in range(len(self.symbols))
+        ]
+        self._digits: int = len(str(self.max))
+        return Template(
+            "{prefix}{borders}{spinner}{borders} - {counter} {counters}{time} {rate}{suffix}",
+            {"prefix": self.prefix, "borders": self.borders, "suffix": self.suffix},
+        )
+
+    def _values(self) -> list[str]:
+        """
+        Spinner, main counter, custom counters, time and rate.
+        """
+        spinner: str
         if self.state == State.FINISHED:
-            template += f"{self.empty * self.span}"
+            spinner = self.empty * self.span
         elif self.state == State.READY:
-            template += f"{self.ready_character * self.span}"
+            spinner = self.ready_character * self.span
         else:
-            template += spinner
-        template += self.borders
-        template += " - "
+            spinner = self._spinners[(self._i // self.multiple + self._frame) % len(self._spinners)]
 
         # Main counter
+        counter: str
         if self.max != 0:
-            percentage: float = self._i / self.max * 100
-            template += f"{percentage:.1f}% "
-            template += f"{self._i}/{self.max}ops "
+            permille: int = self._i * 1000 // self.max
+            percentage: str = PERCENTAGES[permille] if 0 <= permille <= 1000 else f"{permille / 10:5.1f}%"
+            counter = f"{percentage} {self._i:>{self._digits}}/{self.max}ops"
         else:
-            template += f"{self._i}ops "
+            counter = f"{self._i}ops"
 
         # Custom counters
-        if self.counters:
-            for name, count in self.counters.items():
-                template += f"{name}: {count} "
+        counters: str = ""
+        for name, count in self.counters.items():
+            counters += f"{name}: {count} "
 
-        # Time counter
-        time_elapsed: float = time.monotonic() - self.first_time
-        template += f"{time_elapsed:.2f}s "
+        return [
+            spinner,
+            counter,
+            counters,
+            f"{self.elapsed():.2f}s",
+            self._rate_text() if self.show_rate else "",
+        ]
 
-        template += self.suffix
-
-        # Hide cursor
-        sys.stdout.write('\x1b[?25l')
-        sys.stdout.write(
-            template,
-        )
-        sys.stdout.flush()
-
-
-    
     def __copy__(self) -> 'Spinner':
         copied: 'Spinner' = Spinner(
             self.symbols, 
             self.max, 
             span=self.span, 
-            multiple=self.multiple
+            multiple=self.multiple,
+            min_interval=self.min_interval,
+            min_delta=self.min_delta,
+            show_rate=self.show_rate,
+            log=self.log,
+            log_interval=self.log_interval,
+            log_percent=self.log_percent,
         )
         copied.reset()
         return copied
 
-    def finish(self) -> None:
+def default_animation(
+    total: Optional[int],
+    prefix: str = "Loading: ",
+    min_interval: float = 0.1,
+    show_rate: bool = True,
+) -> Animation:
+    """
+    Return a new `Bar` if the total is known, else a new `Spinner`.
+    """
+    if total:
+        return Bar(
+            "█",
+            total,
+            prefix=prefix,
+            multiple=20,
+            min_interval=min_interval,
+            min_delta=max(1, total // 1000),
+            show_rate=show_rate,
+            smooth=True,
+        )
+    return Spinner(
+        ["▂", "▃", "▄", "▅", "▆", "▇", "█", "▇", "▆", "▅", "▄", "▃", "▂", "▁"],
+        span=3,
+        prefix=prefix,
+        min_interval=min_interval,
+        show_rate=show_rate,
+    )
+
+
+class Progress(Generic[T]):
+    """
+    Iterate over `iterable` while showing a progress animation, like `tqdm`. \n
+    A `Bar` is used when the total is known (from `total` or `len`), else a `Spinner`.
+    The animation is always closed: finished when the iteration completes,
+    stopped (with the cursor shown again) on break or exception.
+    ```python
+        for item in Progress(items):
+            ...
+        with Progress(generator(), prefix="Reading: ") as progress:
+            for item in progress:
+                ...
+    ```
+    """
+    iterable: Iterable[T]
+    total: Optional[int]
+    animation: Animation
+
+    def __init__(
+        self,
+        iterable: Iterable[T],
+        animation: Optional[Animation] = None,
+        *, total: Optional[int] = None,
+        prefix: str = "Loading: ",
+        min_interval: float = 0.1,
+        show_rate: bool = True,
+    ) -> None:
         """
-        Allow to prematurly and ensure the spinner to complete.
-        Set the state to FINISHED, and update one last time.
+        Use `animation` if given (reset), else create one.
         """
-        if self._i < self.max:
-            self._i = self.max
+        self.iterable: Iterable[T] = iterable
+        if total is None:
+            try:
+                total = len(iterable)  # pyright: ignore[reportArgumentType]
+            except TypeError:
+                total = None
+        self.total: Optional[int] = total
 
-        self.state = State.FINISHED
-        # Show cursor again
+        if animation is None:
+            animation = default_animation(total, prefix, min_interval, show_rate)
+        animation.reset()
+        self.animation: Animation = animation
+
+    def __iter__(self) -> Iterator[T]:
+        """
+        Yield the items. Counts locally, and only calls the animation every `min_delta` items.
+        """
+        animation: Animation = self.animation
+        step: int = animation.min_delta
+        counted: int = 0
+        done: int = 0
+        limit: int = 0
+        completed: bool = False
+        try:
+            for item in self.iterable:
+                yield item
+                counted += 1
+                if counted >= limit:
+                    animation.increment(counted - done)
+                    done = counted
+                    limit = counted + step
+            animation.increment(counted - done)
+            completed = True
+        finally:
+            self.close(completed)
+
+    def __len__(self) -> int:
+        if self.total is None:
+            raise TypeError("(X) - `Progress` over an iterable without length.")
+        return self.total
+
+    def close(self, completed: bool = False) -> None:
+        """
+        Finish (or stop, if not `completed`) the animation, once.
+        """
+        if self.animation.state in {State.FINISHED, State.STOPPED}:
+            return
+        if completed:
+            self.animation.finish()
+        else:
+            self.animation.stop()
+        if not self.animation.logging:
+            sys.stdout.write("\n")
+
+    def __enter__(self) -> 'Progress[T]':
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+
+class MultiProgress:
+    """
+    Several animations stacked on separate lines, repainted together at a fixed rate
+    by a single renderer thread, moving the cursor up over the previous paint. \n
+    Workers only increment their own animation (one per thread): nothing is written
+    from their threads and no lock is taken on increments. \n
+    When the output is not a terminal, no thread is started: each animation writes
+    its own plain log lines.
+    ```python
+        with MultiProgress() as multi:
+            bars = [multi.add(Bar("█", 100, prefix=f"Worker {i}: ")) for i in range(32)]
+            # Give a bar to each worker...
+    ```
+    """
+    animations: list[Animation]
+    interval: float
+
+    def __init__(self, animations: Iterable[Animation] = (), interval: float = 0.1) -> None:
+        self.animations: list[Animation] = list()
+        self.interval: float = interval
+        self._lock: threading.Lock = threading.Lock()
+        self._stop: threading.Event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._painted: int = 0
+        self._terminal: bool = is_terminal()
+        for animation in animations:
+            self.add(animation)
+
+    def add(self, animation: Animation) -> Animation:
+        """
+        Manage a new animation, on a new line. Return the animation.
+        """
+        animation.managed = self._terminal
+        with self._lock:
+            self.animations.append(animation)
+        return animation
+
+    def repaint(self) -> None:
+        """
+        Write every line again, over the previous ones.
+        """
+        with self._lock:
+            lines: list[str] = [animation.render().strip("\r") for animation in self.animations]
+            template: str = f"\x1b[{self._painted}A" if self._painted else ""
+            for line in lines:
+                template += "\r\x1b[2K" + line + "\n"
+            self._painted = len(lines)
+            sys.stdout.write(template)
+            sys.stdout.flush()
+
+    def _run(self) -> None:
+        """
+        Renderer thread loop.
+        """
+        while not self._stop.wait(self.interval):
+            self.repaint()
+
+    def start(self) -> None:
+        """
+        Hide the cursor and start the renderer thread.
+        """
+        if self._thread is not None or not self._terminal:
+            return
+        sys.stdout.write('\x1b[?25l')
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="MultiProgress", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop the renderer thread, paint one last time and show the cursor again.
+        """
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self.repaint()
         sys.stdout.write('\x1b[?25h')
-        self.increment(0)
+        sys.stdout.flush()
 
-# Default
-bars: dict[str, Bar] = {
-    "SimpleFull1": Bar(
-        "█",
-        100,
-        prefix="Loading: ",
-        multiple=10    
-    ),
-}
-spinners: dict[str, Spinner] = {
-    "Bars1": Spinner(
-        ["│", "╲", "─", "/"],
-        maximum=1000,
-        multiple=2,
-    ),
-    "Wave1": Spinner(
-        ["▂", "▃", "▄", "▅", "▆", "▇", "█", "▇", "▆", "▅", "▄", "▃", "▂", "▁"],
-        span=3,
-        multiple=1
-    ),
-    "Wave2": Spinner(
-        ["▂", "▄", "▆", "█", "▆", "▄", "▂", "▁"],
-        span=3,
-        multiple=1
-    ),
-    # Box-drawing chars: ▖▗▘▙▚▛▜▝▞▟
-    "Solid1": Spinner(
-        "▙▚▘▛▞▝▜▚▗▟▞▖"
-    ),
-    "Solid2": Spinner(
-        "▙▌▛▔▜▐▟▁"
-    ),
+    def __enter__(self) -> 'MultiProgress':
+        self.start()
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.stop()
+
+
+def track(
+    iterable: Iterable[T],
+    animation: Optional[Animation] = None,
+    *, total: Optional[int] = None,
+    prefix: str = "Loading: ",
+    min_interval: float = 0.1,
+    show_rate: bool = True,
+) -> Progress[T]:
+    """
+    Wrap an iterable in a `Progress`.
+    """
+    return Progress(iterable, animation, total=total, prefix=prefix, min_interval=min_interval, show_rate=show_rate)
+
+
+# Default animations: built on first access (`loadings.bars`, `loadings.spinners`), not at import.
+def _default_bars() -> dict[str, Bar]:
+    return {
+        "SimpleFull1": Bar(
+            "█",
+            100,
+            prefix="Loading: ",
+            multiple=10    
+        ),
+    }
+
+def _default_spinners() -> dict[str, Spinner]:
+    return {
+        "Bars1": Spinner(
+            ["│", "╲", "─", "/"],
+            maximum=1000,
+            multiple=2,
+        ),
+        "Wave1": Spinner(
+            ["▂", "▃", "▄", "▅", "▆", "▇", "█", "▇", "▆", "▅", "▄", "▃", "▂", "▁"],
+            span=3,
+            multiple=1
+        ),
+        "Wave2": Spinner(
+            ["▂", "▄", "▆", "█", "▆", "▄", "▂", "▁"],
+            span=3,
+            multiple=1
+        ),
+        # Box-drawing chars: ▖▗▘▙▚▛▜▝▞▟
+        "Solid1": Spinner(
+            "▙▚▘▛▞▝▜▚▗▟▞▖"
+        ),
+        "Solid2": Spinner(
+            "▙▌▛▔▜▐▟▁"
+        ),
+    }
+
+# Default animations, built by `__getattr__` on first access (annotated only: not set before).
+bars: dict[str, Bar]
+spinners: dict[str, Spinner]
+
+_DEFAULTS: dict[str, Callable[[], Union[dict[str, Bar], dict[str, Spinner]]]] = {
+    "bars": _default_bars,
+    "spinners": _default_spinners,
 }
 
+def __getattr__(name: str) -> Union[dict[str, Bar], dict[str, Spinner]]:
+    """
+    Build a default animations dict on first access, then keep it as a module attribute.
+    """
+    if name not in _DEFAULTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    defaults: Union[dict[str, Bar], dict[str, Spinner]] = _DEFAULTS[name]()
+    globals()[name] = defaults
+    return defaults
+
 def main() -> None:
     run_bars1()
     run_spinners1()
+    run_bars_fast()
+    run_bars_smooth()
+    run_track1()
+    run_multi1()
 
 
 def run_spinners1() -> None:
-    b: Spinner = spinners["Wave1"]
+    b: Spinner = _default_spinners()["Wave1"]
     b.reset()
 
     for _ in range(100):
@@ -334,7 +1006,7 @@ def run_spinners1() -> None:
     print()
 
 def run_bars1() -> None:
-    a: Bar = bars["SimpleFull1"]
+    a: Bar = _default_bars()["SimpleFull1"]
     a.reset()
 
     for _ in range(100):
@@ -344,5 +1016,71 @@ def run_bars1() -> None:
     a.finish()
     print() 
 
+def run_bars_fast() -> None:
+    """
+    A million increments: only redrawn every 1000 operations, at most 20 times per second.
+    """
+    c: Bar = Bar(
+        "█",
+        1_000_000,
+        prefix="Fast: ",
+        multiple=20,
+        min_interval=0.05,
+        min_delta=1000,
+        show_rate=True,
+    )
+
+    for _ in range(1_000_000):
+        c.increment()
+
+    c.finish()
+    print()
+
+def run_bars_smooth() -> None:
+    """
+    A 10 cells bar, moving by eighths of cell.
+    """
+    d: Bar = Bar("█", 400, prefix="Smooth: ", multiple=10, smooth=True)
+
+    for _ in range(400):
+        d.increment()
+        time.sleep(0.01)
+
+    d.finish()
+    print()
+
+def run_track1() -> None:
+    """
+    Progress over a list, then over a generator.
+    """
+    for _ in track(range(50), prefix="List: "):
+        time.sleep(0.05)
+
+    with track((i * i for i in range(50)), prefix="Generator: ") as squares:
+        for _ in squares:
+            time.sleep(0.05)
+
+def run_multi1() -> None:
+    """
+    8 threads, each reporting on its own bar.
+    """
+    import random
+    from concurrent.futures import ThreadPoolExecutor
+
+    def work(bar: Bar) -> None:
+        for _ in range(100):
+            bar.increment()
+            time.sleep(random.random() / 20)
+        bar.finish()
+
+    with MultiProgress(interval=0.05) as multi:
+        workers: list[Bar] = [
+            Bar("█", 100, prefix=f"Worker {i}: ", multiple=20) for i in range(8)
+        ]
+        for bar in workers:
+            multi.add(bar)
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(work, workers))
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -10,8 +10,10 @@ import time
 from typing import Callable, Union, Optional
 from enum import Enum
 
-import maths.maths as maths
-import base.style as style
+from ..maths import maths
+from ..base import style
+from ..inputs import keys
+from ..inputs import mouse
 
 
 
@@ -25,6 +27,9 @@ class Screen:
     size: maths.Size
     updater: Optional[Callable[..., None]]
     drawer: Optional[Callable[..., None]]
+    on_key: Optional[Callable[..., None]]
+    on_mouse: Optional[Callable[..., None]]
+    hit_map: mouse.HitMap[object]
     _frames: int
     char_table: list[list[str]]
 
@@ -39,6 +44,9 @@ class Screen:
         self.size: maths.Size = maths.Size(*self.update_size())
         self.updater: Optional[Callable[..., None]] = None
         self.drawer: Optional[Callable[..., None]] = None
+        self.on_key: Optional[Callable[..., None]] = None
+        self.on_mouse: Optional[Callable[..., None]] = None
+        self.hit_map: mouse.HitMap[object] = mouse.HitMap()
         self._frames: int = 0
         self.debug: bool = debug
         self.deactivate_screen: bool = deactivate_screen
@@ -55,17 +63,34 @@ class Screen:
         self,       
         updater: Callable[..., None], 
         drawer: Callable[..., None],
+        on_key: Optional[Callable[..., None]] = None,
+        on_mouse: Optional[Callable[..., None]] = None,
+        tracking: mouse.Tracking = mouse.Tracking.CLICKS,
     ) -> None:
         """
-        Screen main loop, using `updater` and `drawer` as functions.
+        Screen main loop, using `updater` and `drawer` as functions. \n
+        With `on_key`, the keyboard is polled once per frame, without waiting:
+        `on_key(screen, key)` is called for each key pressed since the last frame, before `updater`.
+        With `on_mouse`, mouse `tracking` is turned on: `on_mouse(screen, event)` is called for
+        each click, release or scroll, and once per frame for the motions (coalesced).
+        The areas registered in `hit_map` by the previous `drawer` call are still there.
         """
         self.updater = updater
         self.drawer = drawer
+        self.on_key = on_key
+        self.on_mouse = on_mouse
         self._frames: int = 0
 
         running: bool = True
+        reader: Optional[keys.KeyReader] = None
+        if on_key is not None or on_mouse is not None:
+            reader = keys.default_reader()
 
         try:
+            if reader is not None:
+                reader.open()
+            if on_mouse is not None:
+                sys.stdout.write(mouse.enable(tracking))
             # Main loop
             while running:
                 # Clear the whole screen.
@@ -78,8 +103,13 @@ class Screen:
                 # Update.
                 self.size = maths.Size(*self.update_size())
 
+                # Input.
+                if reader is not None:
+                    self._dispatch(reader.poll())
+
                 # User functions.
                 self.updater(self)
+                self.hit_map.clear()
                 self.drawer(self)
 
                 # Char table
@@ -99,6 +129,26 @@ class Screen:
         except KeyboardInterrupt:
             print("\033[H\033[2J", end="")
             style.printc("(!) - Keyboard interrupt.", style.Color.YELLOW)
+        finally:
+            if on_mouse is not None:
+                sys.stdout.write(mouse.disable(tracking))
+                sys.stdout.flush()
+            if reader is not None:
+                reader.close()
+
+    def _dispatch(self, pressed: list[str]) -> None:
+        """
+        Call the handlers with the keys and mouse events of the frame.
+        """
+        events: list[mouse.MouseEvent] = list()
+        for key in pressed:
+            event: Optional[mouse.MouseEvent] = mouse.decode(key) if self.on_mouse is not None else None
+            if event is not None:
+                events.append(event)
+            elif self.on_key is not None:
+                self.on_key(self, key)
+        for event in mouse.coalesce(events):
+            self.on_mouse(self, event)  # pyright: ignore[reportOptionalCall]
 
 
     def update_size(self) -> tuple[int, int]:
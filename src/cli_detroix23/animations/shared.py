@@ -0,0 +1,181 @@
+"""
+CLI - Animations
+shared.py
+Progress counters shared between processes, for loadings animations.
+Aim: one bar in the parent process, for the work of a whole process pool.
+"""
+import time
+import atexit
+from multiprocessing import shared_memory
+from typing import Callable, Optional
+
+from . import loadings
+
+
+class SharedCounter:
+    """
+    Progress counter backed by shared memory: one 64 bits slot per worker. \n
+    Each worker only adds to its own slot, without lock, pickling nor queue;
+    the parent sums the slots when it redraws. Pickled by name: pass it to the workers
+    (task arguments or pool initializer), they attach to the same memory, once per process
+    however many times it is unpickled (detached at exit).
+    ```python
+        with SharedCounter(workers) as counter:
+            futures = [pool.submit(work, counter, slot) for slot in range(workers)]
+            counter.drive(bar, lambda: all(future.done() for future in futures))
+    ```
+    """
+    slots: int
+    _memory: shared_memory.SharedMemory
+    _view: memoryview
+    _owner: bool
+
+    def __init__(self, slots: int, name: Optional[str] = None) -> None:
+        """
+        Create the shared memory, or attach to the existing `name`.
+        """
+        self.slots: int = slots
+        self._owner = name is None
+        if self._owner:
+            self._memory = shared_memory.SharedMemory(create=True, size=slots * 8)
+            self._view = self._memory.buf.cast("q")
+            for slot in range(slots):
+                self._view[slot] = 0
+        else:
+            self._memory, self._view = _attach(name)  # pyright: ignore[reportArgumentType]
+
+    @property
+    def name(self) -> str:
+        return self._memory.name
+
+    def __reduce__(self) -> tuple[type['SharedCounter'], tuple[int, str]]:
+        return (SharedCounter, (self.slots, self._memory.name))
+
+    def add(self, slot: int, count: int = 1) -> None:
+        """
+        Add to a slot. Only one process should write each slot.
+        """
+        self._view[slot] += count
+
+    def get(self, slot: int) -> int:
+        return self._view[slot]
+
+    def total(self) -> int:
+        """
+        Return the sum of every slot.
+        """
+        return sum(self._view)
+
+    def reset(self) -> None:
+        for slot in range(self.slots):
+            self._view[slot] = 0
+
+    def sync(self, animation: loadings.Animation) -> None:
+        """
+        Bring the animation's count to the total, redrawing it if due.
+        """
+        total: int = self.total()
+        if total != animation.count:
+            animation.increment(total - animation.count)
+
+    def drive(
+        self,
+        animation: loadings.Animation,
+        done: Callable[[], bool],
+        interval: float = 0.1,
+    ) -> None:
+        """
+        Sync the animation every `interval` seconds until `done()`, then finish it.
+        """
+        animation.reset()
+        try:
+            while not done():
+                self.sync(animation)
+                time.sleep(interval)
+            self.sync(animation)
+        except BaseException:
+            animation.stop()
+            raise
+        animation.finish()
+
+    def close(self) -> None:
+        """
+        Detach from the shared memory, and free it: only in the creating process,
+        the others stay attached (shared by their counters) until exit.
+        """
+        if not self._owner:
+            return
+        self._view.release()
+        self._memory.close()
+        self._memory.unlink()
+
+    def __enter__(self) -> 'SharedCounter':
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+
+# Memories attached by this process, by name: with their view, released before closing them.
+_ATTACHED: dict[str, tuple[shared_memory.SharedMemory, memoryview]] = dict()
+
+
+def _attach(name: str) -> tuple[shared_memory.SharedMemory, memoryview]:
+    """
+    Attach to an existing shared memory, once per process, without tracking it: the creator frees it.
+    """
+    if name not in _ATTACHED:
+        try:
+            memory = shared_memory.SharedMemory(name=name, track=False)  # pyright: ignore[reportCallIssue]
+        except TypeError:
+            # Before Python 3.13: child processes share the creator's resource tracker,
+            # where registering the same memory again is harmless.
+            memory = shared_memory.SharedMemory(name=name)
+        if not _ATTACHED:
+            atexit.register(_detach_all)
+        _ATTACHED[name] = (memory, memory.buf.cast("q"))
+    return _ATTACHED[name]
+
+def _detach_all() -> None:
+    """
+    Close the attached memories; views first, else the memory can't be closed.
+    """
+    for memory, view in _ATTACHED.values():
+        view.release()
+        memory.close()
+    _ATTACHED.clear()
+
+
+def _work(counter: SharedCounter, slot: int, operations: int) -> int:
+    """
+    Exemple worker: busy loop reporting each operation in its slot.
+    """
+    total: int = 0
+    for i in range(operations):
+        total += i * i
+        counter.add(slot)
+    return total
+
+def main() -> None:
+    from concurrent.futures import Future, ProcessPoolExecutor
+
+    workers: int = 4
+    operations: int = 500_000
+    bar: loadings.Bar = loadings.Bar(
+        "█",
+        workers * operations,
+        prefix="Processes: ",
+        multiple=20,
+        min_interval=0.05,
+        show_rate=True,
+    )
+    with SharedCounter(workers) as counter, ProcessPoolExecutor(max_workers=workers) as pool:
+        futures: list[Future[int]] = [
+            pool.submit(_work, counter, slot, operations) for slot in range(workers)
+        ]
+        counter.drive(bar, lambda: all(future.done() for future in futures))
+    print()
+
+
+if __name__ == "__main__":
+    main()
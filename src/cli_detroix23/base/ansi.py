@@ -0,0 +1,93 @@
+"""
+CLI - Style/ Base
+ansi.py
+Compiled tokenizer for escape sequences (CSI, SGR, OSC).
+All helpers are cached, so measuring the same styled string twice is free.
+"""
+import re
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from . import style as base
+if TYPE_CHECKING:
+    from . import code
+
+# Cache sizes of the helpers.
+CACHE_SIZE: int = 4096
+
+# Any escape sequence: CSI (`ESC [ ... final`), OSC (`ESC ] ... BEL/ST`) or a 2 characters escape.
+ESCAPE_PATTERN: re.Pattern[str] = re.compile(
+    r"\x1b(?:\[[0-?]*[ -/]*[@-~]|\][^\x07\x1b]*(?:\x07|\x1b\\)|[@-Z\\-_])"
+)
+# Select Graphic Rendition only, capturing the parameters.
+SGR_PATTERN: re.Pattern[str] = re.compile(r"\x1b\[([0-9;:]*)m")
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def strip_ansi(string: str) -> str:
+    """
+    Return the string without any escape sequence.
+    """
+    if base.ESC not in string:
+        return string
+    return ESCAPE_PATTERN.sub("", string)
+
+def visible_len(string: str) -> int:
+    """
+    Return the number of printed characters of a string, ignoring escape sequences.
+    """
+    if base.ESC not in string:
+        return len(string)
+    return len(strip_ansi(string))
+
+@lru_cache(maxsize=CACHE_SIZE)
+def split_styled(string: str) -> tuple[tuple[str, str], ...]:
+    """
+    Split a string into `(escapes, text)` pairs. \n
+    `escapes` are all the sequences written just before `text`.
+    Trailing sequences are returned with an empty text.
+    """
+    if base.ESC not in string:
+        return (("", string),) if string else ()
+
+    parts: list[tuple[str, str]] = list()
+    escapes: list[str] = list()
+    cursor: int = 0
+    for match in ESCAPE_PATTERN.finditer(string):
+        start: int = match.start()
+        if start > cursor:
+            parts.append(("".join(escapes), string[cursor:start]))
+            escapes = list()
+        escapes.append(match.group())
+        cursor = match.end()
+
+    if cursor < len(string) or escapes:
+        parts.append(("".join(escapes), string[cursor:]))
+
+    return tuple(parts)
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_sgr(string: str) -> tuple['code.Code', ...]:
+    """
+    Return every SGR sequence of the string as a `Code`, in order.
+    An empty sequence (`ESC[m`) is a reset, `Code` 0.
+    """
+    # `base.code` relies on this module: imported here to avoid a cycle.
+    from . import code
+
+    return tuple(
+        code.Code(codes=sgr_params(params))
+        for params in SGR_PATTERN.findall(string)
+    )
+
+def sgr_params(params: str) -> list[int]:
+    """
+    Return the integer parameters of a SGR sequence body (between `[` and `m`).
+    """
+    if not params:
+        return [0]
+    return [int(param) if param else 0 for param in params.replace(":", ";").split(";")]
+
+
+if __name__ == "__main__":
+    print("cf. Exemples.")
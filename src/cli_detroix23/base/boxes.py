@@ -65,6 +65,46 @@ U+1FBEx 	🯠 	🯡 	🯢 	🯣 	🯤 	🯥 	🯦 	🯧 	🯨 	🯩 	🯪 	🯫
 U+1FBFx 	🯰 	🯱 	🯲 	🯳 	🯴 	🯵 	🯶 	🯷 	🯸 	🯹 	🯺 					
 """
 
+class Border:
+    """
+    Characters of a table's border: edges, corners, and junctions. \n
+    Given as 11 characters, in order: `─│┌┬┐├┼┤└┴┘`.
+    """
+    horizontal: str
+    vertical: str
+    top_left: str
+    top: str
+    top_right: str
+    left: str
+    cross: str
+    right: str
+    bottom_left: str
+    bottom: str
+    bottom_right: str
+
+    def __init__(self, characters: str) -> None:
+        if len(characters) != 11:
+            raise ValueError(f"(X) - Border: 11 characters expected, got {len(characters)} ({characters}).")
+        (
+            self.horizontal, self.vertical,
+            self.top_left, self.top, self.top_right,
+            self.left, self.cross, self.right,
+            self.bottom_left, self.bottom, self.bottom_right,
+        ) = characters
+
+    def __repr__(self) -> str:
+        return f"Border({self.horizontal}{self.vertical}{self.top_left}{self.top}{self.top_right}{self.left}{self.cross}{self.right}{self.bottom_left}{self.bottom}{self.bottom_right})"
+
+
+BORDERS: dict[str, Border] = {
+    "light": Border("─│┌┬┐├┼┤└┴┘"),
+    "heavy": Border("━┃┏┳┓┣╋┫┗┻┛"),
+    "double": Border("═║╔╦╗╠╬╣╚╩╝"),
+    "rounded": Border("─│╭┬╮├┼┤╰┴╯"),
+    "ascii": Border("-|+++++++++"),
+}
+
+
 class Exemples:
     Window1: str = """
 ┌─┬┐  ╔═╦╗  ╓─╥╖  ╒═╤╕
@@ -2,24 +2,55 @@
 CLI - Style/ Base
 code.py
 """
-from typing import Union
+from functools import lru_cache
+from typing import Iterable, Optional, Union
 
-import base.style as base
+from . import style as base
+from . import ansi
+
+# Remove the escape, the bracket and the final `m` of a sequence.
+_IMPURE: dict[int, None] = str.maketrans("", "", base.ESC + "[m")
 
 class Code:
     """
-    Describe an or multiple escape code of VT-100 charset.
+    Describe an or multiple escape code of VT-100 charset. \n
+    Codes are interned and immutable: identical code sets are the same object,
+    with a small integer `id`. Hashable, so usable as dict keys; renderers can
+    store the `id` per cell and get the `Code` back with `code_from_id`.
     """
+    __slots__ = ("string", "codes", "id", "encoded")
+
     string: str
-    codes: list[int]
+    codes: tuple[int, ...]
+    id: int
+    encoded: bytes
 
-    def __init__(self, string: str = "", codes: list[int] = list()) -> None:
+    def __new__(cls, string: str = "", codes: Iterable[int] = ()) -> 'Code':
         """
-        Create (clean, divide and fuse) a `string`.
+        Create (clean, divide and fuse) a `string`, or return the already existing `Code`.
         If `codes` is passed, uses them instead.
         """
-        self.codes = code_clean_all(string) if not codes else codes
-        self.string = code_fuse(self.codes)
+        key: tuple[int, ...] = tuple(codes)
+        if not key:
+            key = _parse(string)
+
+        self: Optional[Code] = _REGISTRY.get(key)
+        if self is None:
+            self = object.__new__(cls)
+            fused: str = code_fuse(key)
+            object.__setattr__(self, "codes", key)
+            object.__setattr__(self, "string", fused)
+            object.__setattr__(self, "id", len(_BY_ID))
+            object.__setattr__(self, "encoded", fused.encode())
+            _REGISTRY[key] = self
+            _BY_ID.append(self)
+        return self
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"(X) - `Code` is immutable ({name}).")
+
+    def __reduce__(self) -> tuple[type['Code'], tuple[str, tuple[int, ...]]]:
+        return (Code, ("", self.codes))
 
     def __str__(self) -> str:
         """
@@ -31,10 +62,17 @@ class Code:
         """
         Print debug informations, with no formatting.
         """
-        return f"Code(string: str = {repr(self.string)}, codes: list[int] = {self.codes})"
+        return f"Code(string: str = {repr(self.string)}, codes: tuple[int, ...] = {self.codes}, id: int = {self.id})"
     
     def fuse(self, other: 'Code') -> 'Code':
-        return Code(codes=self.codes + other.codes)
+        """
+        Return the `Code` of both codes, memoized.
+        """
+        fused: Optional[Code] = _FUSIONS.get((self.id, other.id))
+        if fused is None:
+            fused = Code(codes=self.codes + other.codes)
+            _FUSIONS[(self.id, other.id)] = fused
+        return fused
 
     def __add__(self, other: object) -> Union[str, 'Code']:
         """
@@ -45,23 +83,44 @@ class Code:
         if isinstance(other, str):
             return self.string + other
         elif isinstance(other, Code):
-            return Code(codes=self.codes + other.codes)
+            return self.fuse(other)
         else:
             raise ValueError(f"(X) - `Code` addiction must be `str` or `Code` ({repr(other)}).")
- 
 
-def code_clean(string: str) -> int:
+
+# Registry of the interned codes.
+_REGISTRY: dict[tuple[int, ...], Code] = dict()
+_BY_ID: list[Code] = list()
+_FUSIONS: dict[tuple[int, int], Code] = dict()
+
+@lru_cache(maxsize=ansi.CACHE_SIZE)
+def _parse(string: str) -> tuple[int, ...]:
     """
-    Return a string cleansed of its first escape character.
+    Return the codes of a string, memoized for the `ansi.CACHE_SIZE` most recent strings.
+    """
+    return tuple(code_clean_all(string))
+
+def code_from_id(id: int) -> Code:
     """
-    impure: set[str] = {base.ESC, "[", "m"}
-    cleaned: str = ""
+    Return the interned `Code` of the given id.
+    """
+    return _BY_ID[id]
 
-    for char in string:    
-        if char not in impure:
-            cleaned += char
+def fuse_ids(first: int, second: int) -> int:
+    """
+    Return the id of the fusion of two codes' ids. A dict lookup once memoized.
+    """
+    fused: Optional[Code] = _FUSIONS.get((first, second))
+    if fused is None:
+        fused = _BY_ID[first].fuse(_BY_ID[second])
+    return fused.id
 
-    return int(cleaned)
+ 
+def code_clean(string: str) -> int:
+    """
+    Return a string cleansed of its first escape character.
+    """
+    return int(string.translate(_IMPURE))
 
 def code_clean_all(string: str) -> list[int]:
     """
@@ -69,23 +128,13 @@ def code_clean_all(string: str) -> list[int]:
     Use for codes.
     """
     clean: list[int] = list()
-    if string:
-        splitted: list[str] = string.split(base.ESC)
-        if not splitted[0]:
-            splitted.pop(0)
-        clean = [code_clean(string) for string in splitted]
+    for params in ansi.SGR_PATTERN.findall(string):
+        clean.extend(ansi.sgr_params(params))
 
     return clean
 
-def code_fuse(codes: list[int]) -> str:
+def code_fuse(codes: Iterable[int]) -> str:
     """
     Merges together codes into a multi-style character.
     """
-    string: str = base.ESC + "["
-    for index, code in enumerate(codes):
-        string += str(code)
-        if index < len(codes) - 1:
-            string += ";"
-    string += "m"
-
-    return string
+    return base.ESC + "[" + ";".join(map(str, codes)) + "m"
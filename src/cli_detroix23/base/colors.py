@@ -1,7 +1,192 @@
 """
 CLI - Base
 colors.py
+RGB colors: truecolor, 256 and 16 colors escape codes.
+Quantization uses lookup tables of 32x32x32 entries, built once on first use.
 """
+import os
+from enum import Enum
+from functools import cache
+from typing import Optional
+
+from . import style
+
+# Type - Red, green and blue components, from 0 to 255.
+Rgb = tuple[int, int, int]
+
+
+class Depth(Enum):
+    """
+    Color depth supported by the terminal, in bits.
+    """
+    NONE = 0
+    COLORS_16 = 4
+    COLORS_256 = 8
+    TRUECOLOR = 24
+
+
+@cache
+def color_depth() -> Depth:
+    """
+    Detect once, from the environment, the color depth of the terminal.
+    """
+    term: str = os.environ.get("TERM", "")
+    colorterm: str = os.environ.get("COLORTERM", "").lower()
+
+    if "NO_COLOR" in os.environ or term == "dumb":
+        return Depth.NONE
+    if colorterm in {"truecolor", "24bit"} or "WT_SESSION" in os.environ:
+        return Depth.TRUECOLOR
+    if "256color" in term:
+        return Depth.COLORS_256
+    return Depth.COLORS_16
+
+
+# Palettes (xterm defaults).
+PALETTE_16: list[Rgb] = [
+    (0, 0, 0), (205, 0, 0), (0, 205, 0), (205, 205, 0),
+    (0, 0, 238), (205, 0, 205), (0, 205, 205), (229, 229, 229),
+    (127, 127, 127), (255, 0, 0), (0, 255, 0), (255, 255, 0),
+    (92, 92, 255), (255, 0, 255), (0, 255, 255), (255, 255, 255),
+]
+_CUBE_LEVELS: list[int] = [0, 95, 135, 175, 215, 255]
+PALETTE_256: list[Rgb] = (
+    PALETTE_16
+    + [(r, g, b) for r in _CUBE_LEVELS for g in _CUBE_LEVELS for b in _CUBE_LEVELS]
+    + [(8 + 10 * i, 8 + 10 * i, 8 + 10 * i) for i in range(24)]
+)
+
+# Escape codes, precomputed for each palette index.
+FG_16: list[str] = [f"{style.ESC}[{30 + i if i < 8 else 82 + i}m" for i in range(16)]
+BG_16: list[str] = [f"{style.ESC}[{40 + i if i < 8 else 92 + i}m" for i in range(16)]
+FG_256: list[str] = [f"{style.ESC}[38;5;{i}m" for i in range(256)]
+BG_256: list[str] = [f"{style.ESC}[48;5;{i}m" for i in range(256)]
+
+# Lookup tables: 5 bits per component.
+LUT_BITS: int = 5
+_LUT_SHIFT: int = 8 - LUT_BITS
+_LUT_SIDE: int = 1 << LUT_BITS
+
+
+def lut_index(r: int, g: int, b: int) -> int:
+    """
+    Return the index of a color in the lookup tables.
+    """
+    return (r >> _LUT_SHIFT) << (2 * LUT_BITS) | (g >> _LUT_SHIFT) << LUT_BITS | (b >> _LUT_SHIFT)
+
+def _cube_level(value: int) -> int:
+    """
+    Return the index of the nearest level of the 6x6x6 cube.
+    """
+    if value < 48:
+        return 0
+    if value < 115:
+        return 1
+    return (value - 35) // 40
+
+def _nearest_256(r: int, g: int, b: int) -> int:
+    """
+    Return the nearest extended color (16 - 255): only compares the cube and the grays candidates.
+    """
+    lr, lg, lb = _cube_level(r), _cube_level(g), _cube_level(b)
+    cube: Rgb = (_CUBE_LEVELS[lr], _CUBE_LEVELS[lg], _CUBE_LEVELS[lb])
+    average: int = (r + g + b) // 3
+    gray_index: int = 23 if average > 238 else max(0, (average - 3) // 10)
+    gray: int = 8 + 10 * gray_index
+
+    cube_distance: int = (cube[0] - r) ** 2 + (cube[1] - g) ** 2 + (cube[2] - b) ** 2
+    gray_distance: int = (gray - r) ** 2 + (gray - g) ** 2 + (gray - b) ** 2
+    if gray_distance < cube_distance:
+        return 232 + gray_index
+    return 16 + 36 * lr + 6 * lg + lb
+
+@cache
+def lut_256() -> bytes:
+    """
+    Return the lookup table from `lut_index` to the 256 colors palette.
+    """
+    centers: list[int] = [(i << _LUT_SHIFT) | (1 << (_LUT_SHIFT - 1)) for i in range(_LUT_SIDE)]
+    return bytes(
+        _nearest_256(r, g, b)
+        for r in centers for g in centers for b in centers
+    )
+
+@cache
+def lut_16() -> bytes:
+    """
+    Return the lookup table from `lut_index` to the 16 colors palette.
+    Distances are summed per component, from precomputed squares.
+    """
+    centers: list[int] = [(i << _LUT_SHIFT) | (1 << (_LUT_SHIFT - 1)) for i in range(_LUT_SIDE)]
+    squares: list[list[list[int]]] = [
+        [[(center - color[component]) ** 2 for color in PALETTE_16] for center in centers]
+        for component in range(3)
+    ]
+    indexes: range = range(16)
+    table: bytearray = bytearray()
+    for r in range(_LUT_SIDE):
+        for g in range(_LUT_SIDE):
+            partial: list[int] = [squares[0][r][i] + squares[1][g][i] for i in indexes]
+            for b in range(_LUT_SIDE):
+                blue: list[int] = squares[2][b]
+                distances: list[int] = [p + q for p, q in zip(partial, blue)]
+                table.append(distances.index(min(distances)))
+    return bytes(table)
+
+def rgb_to_256(r: int, g: int, b: int) -> int:
+    """
+    Return the nearest 256 colors palette index.
+    """
+    return lut_256()[lut_index(r, g, b)]
+
+def rgb_to_16(r: int, g: int, b: int) -> int:
+    """
+    Return the nearest 16 colors palette index.
+    """
+    return lut_16()[lut_index(r, g, b)]
+
+
+def fg(r: int, g: int, b: int, depth: Optional[Depth] = None) -> str:
+    """
+    Return the foreground escape code of a color, for the given (or detected) depth.
+    """
+    depth = color_depth() if depth is None else depth
+    if depth == Depth.TRUECOLOR:
+        return f"{style.ESC}[38;2;{r};{g};{b}m"
+    elif depth == Depth.COLORS_256:
+        return FG_256[lut_256()[lut_index(r, g, b)]]
+    elif depth == Depth.COLORS_16:
+        return FG_16[lut_16()[lut_index(r, g, b)]]
+    return ""
+
+def bg(r: int, g: int, b: int, depth: Optional[Depth] = None) -> str:
+    """
+    Return the background escape code of a color, for the given (or detected) depth.
+    """
+    depth = color_depth() if depth is None else depth
+    if depth == Depth.TRUECOLOR:
+        return f"{style.ESC}[48;2;{r};{g};{b}m"
+    elif depth == Depth.COLORS_256:
+        return BG_256[lut_256()[lut_index(r, g, b)]]
+    elif depth == Depth.COLORS_16:
+        return BG_16[lut_16()[lut_index(r, g, b)]]
+    return ""
+
+def gradient(start: Rgb, end: Rgb, steps: int) -> list[Rgb]:
+    """
+    Return `steps` colors, linearly from `start` to `end` included.
+    """
+    if steps < 2:
+        return [start][:steps]
+    return [
+        (
+            start[0] + (end[0] - start[0]) * i // (steps - 1),
+            start[1] + (end[1] - start[1]) * i // (steps - 1),
+            start[2] + (end[2] - start[2]) * i // (steps - 1),
+        )
+        for i in range(steps)
+    ]
+
 
 def color_table() -> None:
     """
@@ -16,9 +201,20 @@ def color_table() -> None:
             print(s1)
         print('\n')
 
+def gradient_table(width: int = 64) -> None:
+    """
+    Print gradients at every color depth, to compare the quantizations.
+    """
+    colors: list[Rgb] = gradient((255, 0, 64), (0, 128, 255), width)
+    for depth in (Depth.TRUECOLOR, Depth.COLORS_256, Depth.COLORS_16):
+        line: str = "".join(bg(*color, depth=depth) + " " for color in colors)
+        print(f"{line}{style.END} {depth.name}")
+    print(f"Detected: {color_depth().name}.")
+
 
 def main() -> None:
     color_table()
+    gradient_table()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -2,8 +2,9 @@
 CLI - Base / Style.
 exemples.py
 """
-import base.style as style
-import base.code as code
+from . import style
+from . import code
+from . import models
 
 def main() -> None:
     style.Style.display_all_rendition_subset()
@@ -33,5 +34,13 @@ def main() -> None:
     style.printc(f"█", style.Color.DIMMER)
 
 
+def run_models() -> None:
+    print(models.input_gh_style("What's your name ? I dont read it actually.", usage="asd", default="a"))
+    print(models.bool_gh_style("You sure ? But I dont care"))
+    print(models.select_gh_style("You know this one."))
+
+    print()
+
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
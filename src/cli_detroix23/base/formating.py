@@ -2,34 +2,181 @@
 CLI - Terminal
 formating.py
 """
+import sys
+import itertools
+from typing import IO, Iterable, Iterator, Optional, Sequence, Union
 
-from typing import Iterable
+from . import style
+from . import ansi
+from . import boxes
 
-import base.style as style
+# Marks the cut of a cell too wide for its column.
+ELLIPSIS: str = "…"
 
-def table(
-    elements: Iterable[str], 
+
+def flow_lines(
+    elements: Iterable[str],
     max_per_col: int = 60,
     row_prefix: str = "\t",
     row_suffix: str = "",
     spacer: str = " ",
     table_footer: str = "─",
     color: str = style.Color.GREEN
-) -> str:
+) -> Iterator[str]:
     """
-    Return a formatted string of row-col table.
-    Counts the character number.
+    Yield the lines of `table`, one at a time: elements side by side, wrapped to a new row
+    when they would go over `max_per_col` visible characters.
     """
-    table: str = row_prefix
+    line: list[str] = [row_prefix]
     char_count: int = 0
+    spacer_length: int = ansi.visible_len(spacer)
     for element in elements:
-        char_count += len(element)
-        if char_count > max_per_col and len(element) <= max_per_col:
-            table += f"{row_suffix}\n{row_prefix}"
-        else:
-            table += f"{spacer}{color}{element}{style.Style.END}"
+        length: int = spacer_length + ansi.visible_len(element)
+        if char_count and char_count + length > max_per_col:
+            # The element starts the next row.
+            yield f"{''.join(line)}{row_suffix}"
+            line = [row_prefix]
+            char_count = 0
+        line.append(f"{spacer}{color}{element}{style.Style.END}")
+        char_count += length
+    yield "".join(line)
 
     if table_footer:
-        table += f"\n{row_prefix}{table_footer * max_per_col}"
+        yield f"{row_prefix}{table_footer * max_per_col}"
+
+def table(
+    elements: Iterable[str],
+    max_per_col: int = 60,
+    row_prefix: str = "\t",
+    row_suffix: str = "",
+    spacer: str = " ",
+    table_footer: str = "─",
+    color: str = style.Color.GREEN
+) -> str:
+    """
+    Return a formatted string of row-col table.
+    Counts the visible character number (escape sequences are ignored).
+    """
+    return "\n".join(flow_lines(elements, max_per_col, row_prefix, row_suffix, spacer, table_footer, color))
+
+
+def fit(cell: str, width: int, align: str = "<") -> str:
+    """
+    Return the cell on exactly `width` visible characters: padded (`<` left, `>` right, `^` center),
+    or cut with `ELLIPSIS` (escape sequences are kept, the style is reset after the cut).
+    """
+    length: int = ansi.visible_len(cell)
+    if length > width:
+        if style.ESC not in cell:
+            return f"{cell[:width - 1]}{ELLIPSIS}" if width else ""
+        kept: list[str] = list()
+        room: int = width - 1
+        for escapes, text in ansi.split_styled(cell):
+            kept.append(escapes)
+            kept.append(text[:room])
+            room -= min(room, len(text))
+        return f"{''.join(kept)}{style.END}{ELLIPSIS}" if width else ""
+    # Padding to `width` visible characters: escape sequences count in `len`.
+    padded: int = width + len(cell) - length
+    if align == ">":
+        return cell.rjust(padded)
+    if align == "^":
+        missing: int = width - length
+        return f"{' ' * (missing // 2)}{cell}{' ' * (missing - missing // 2)}"
+    return cell.ljust(padded)
+
+def table_lines(
+    rows: Iterable[Sequence[object]],
+    header: Optional[Sequence[str]] = None,
+    border: Optional[boxes.Border] = boxes.BORDERS["light"],
+    sample: Optional[int] = 1000,
+    max_width: Optional[int] = None,
+    align: Union[str, Sequence[str]] = "<",
+    spacer: str = "  ",
+) -> Iterator[str]:
+    """
+    Yield the lines of a table of rows (sequences of cells, turned to `str`), one at a time. \n
+    Column widths are the widest visible cell (escape sequences ignored) of the header and the
+    first `sample` rows: only them are kept in memory, and lines come as soon as they are read.
+    Later wider cells are cut (see `fit`). If `sample` is None, every row is read first (and kept).
+    `max_width` caps the columns' width; `align` is one alignment, or one per column
+    (missing ones are `<`). Without `border`, cells are separated by `spacer`.
+    """
+    if sample is not None and sample < 1:
+        raise ValueError(f"(X) - table_lines: sample must be at least 1 (or None), not {sample}.")
+    iterator: Iterator[Sequence[object]] = iter(rows)
+    head: list[list[str]] = [
+        [str(cell) for cell in row]
+        for row in (iterator if sample is None else itertools.islice(iterator, sample))
+    ]
+    sampled: list[Sequence[str]] = [header, *head] if header is not None else head
+    count: int = max((len(row) for row in sampled), default=0)
+    widths: list[int] = [0] * count
+    for row in sampled:
+        for column, cell in enumerate(row):
+            widths[column] = max(widths[column], ansi.visible_len(cell))
+    if max_width is not None:
+        widths = [min(width, max_width) for width in widths]
+    aligns: list[str] = [align] * count if isinstance(align, str) else [*align[:count], *"<" * (count - len(align))]
+    horizontal: str = border.horizontal if border is not None else ""
+
+    def line(cells: Sequence[str]) -> str:
+        # Missing cells are empty, extra ones dropped.
+        fitted: list[str] = [
+            fit(cells[column] if column < len(cells) else "", width, aligns[column])
+            for column, width in enumerate(widths)
+        ]
+        if border is None:
+            return spacer.join(fitted)
+        return f"{border.vertical} {f' {border.vertical} '.join(fitted)} {border.vertical}"
+
+    def rule(left: str, junction: str, right: str) -> str:
+        return f"{left}{junction.join(horizontal * (width + 2) for width in widths)}{right}"
+
+    if border is not None:
+        yield rule(border.top_left, border.top, border.top_right)
+    if header is not None:
+        yield line(header)
+        if border is not None:
+            yield rule(border.left, border.cross, border.right)
+    for row in head:
+        yield line(row)
+    for row in iterator:
+        yield line([str(cell) for cell in row])
+    if border is not None:
+        yield rule(border.bottom_left, border.bottom, border.bottom_right)
+
+def write_lines(lines: Iterable[str], file: Optional[IO[str]] = None, buffer_lines: int = 1000) -> None:
+    """
+    Write lines to a file (stdout by default), by blocks of `buffer_lines`: a single write per block.
+    """
+    file = file if file is not None else sys.stdout
+    iterator: Iterator[str] = iter(lines)
+    for block in iter(lambda: list(itertools.islice(iterator, buffer_lines)), []):
+        file.write("\n".join(block))
+        file.write("\n")
+    file.flush()
+
+def print_table(
+    rows: Iterable[Sequence[object]],
+    header: Optional[Sequence[str]] = None,
+    border: Optional[boxes.Border] = boxes.BORDERS["light"],
+    file: Optional[IO[str]] = None,
+    buffer_lines: int = 1000,
+    sample: Optional[int] = 1000,
+    max_width: Optional[int] = None,
+    align: Union[str, Sequence[str]] = "<",
+    spacer: str = "  ",
+) -> None:
+    """
+    Print a table of rows as it is formatted (see `table_lines`), through `write_lines`.
+    ```python
+        print_table(connection.execute("SELECT id, name FROM users"), header=("Id", "Name"))
+    ```
+    """
+    write_lines(table_lines(rows, header, border, sample, max_width, align, spacer), file, buffer_lines)
+
 
-    return table
\ No newline at end of file
+if __name__ == "__main__":
+    print(table((f"{style.Color.RED}item{index}{style.END}" for index in range(30)), max_per_col=40))
+    print_table(((index, f"{index ** 2:,}", "x" * (index % 7)) for index in range(10)), header=("n", "n²", "x"), align=("<", ">", "<"))
@@ -9,7 +9,7 @@ Prefixes:
 
 """
 
-import base.style as style
+from . import style
 
 def select_gh_style(message: str, start: str = "$", usage: str = "[↑ ↓ - Enter to accept]") -> str:
     """
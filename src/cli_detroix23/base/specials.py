@@ -28,6 +28,10 @@ NICE_MAP: dict[str, str] = {
     "\x1b[2": "Insert",
     "\x1b[3": "Delete",
     "\x1b[6": "Page down",
+    "\x1b[2~": "Insert",
+    "\x1b[3~": "Delete",
+    "\x1b[5~": "Page up",
+    "\x1b[6~": "Page down",
     "\x1b[5": "Page up",
     "\x1b[F": "Fin",
     "\x1b[H": "Home",
@@ -0,0 +1,337 @@
+"""
+CLI - Inputs
+directory.py
+Directory browser: entries streamed with `os.scandir`, sorted as they come, shown in a scrolling menu.
+"""
+import os
+import sys
+import time
+import bisect
+import itertools
+from collections import OrderedDict
+from typing import Iterator, Optional
+
+from . import keys
+from . import sources
+from . import select_menu
+
+# Time spent reading entries between two repaints, in seconds (unless a key is pressed).
+STREAM_BUDGET: float = 0.05
+# Entries read at most from a directory (memory bound, see `Listing`).
+MAX_ENTRIES: int = 1_000_000
+# Units of the size column.
+_UNITS: tuple[str, ...] = ("B", "K", "M", "G", "T", "P")
+
+
+def human_size(size: int) -> str:
+    """
+    Return a size in bytes on 5 characters: `  12B`, ` 4.0K`, ` 512M`...
+    """
+    value: float = size
+    for unit in _UNITS:
+        if value < 1000 or unit == _UNITS[-1]:
+            if unit == "B" or value >= 10:
+                return f"{value:4.0f}{unit}"
+            return f"{value:4.1f}{unit}"
+        value /= 1024
+    return f"{value:4.0f}{_UNITS[-1]}"
+
+
+class StatCache:
+    """
+    Bounded cache of stat results by path, the least recently used being dropped first.
+    Only the shown entries are stat-ed: memory doesn't grow with the directory.
+    """
+    size: int
+    _stats: OrderedDict[str, Optional[os.stat_result]]
+
+    def __init__(self, size: int = 4096) -> None:
+        self.size: int = size
+        self._stats = OrderedDict()
+
+    def get(self, path: str) -> Optional[os.stat_result]:
+        """
+        Return the stat result of the path (without following links), None if it can't be read.
+        """
+        if path in self._stats:
+            self._stats.move_to_end(path)
+            return self._stats[path]
+        try:
+            stat: Optional[os.stat_result] = os.stat(path, follow_symlinks=False)
+        except OSError:
+            stat = None
+        self._stats[path] = stat
+        if len(self._stats) > self.size:
+            self._stats.popitem(last=False)
+        return stat
+
+    def clear(self) -> None:
+        self._stats.clear()
+
+    def __len__(self) -> int:
+        return len(self._stats)
+
+
+def _key(name: str) -> str:
+    """
+    Return the sort key of an entry's name (directories end with `/`).
+    """
+    return f"{'0' if name.endswith('/') else '1'}{name.casefold()}\0{name}"
+
+
+class Listing(sources.Source):
+    """
+    Entries of a directory, read by batches of `page_size` with `os.scandir`, and kept sorted:
+    directories first (ending with `/`), then case insensitive names.
+    Read batches wait unsorted until an entry is accessed, then are sorted and merged
+    at once (two sorted runs: linear). No `DirEntry` is kept.
+    Entries are stored as their sort key, a single string (fast to compare):
+    `0` for directories or `1`, the case folded name, `\0`, and the name. \n
+    Sorting needs every entry: memory is bounded by reading `max_entries` of them at most
+    (then `truncated` is True). Each costs about twice its name's size plus a string's
+    overhead: ~90 bytes for 15 characters names, 27 MB for 300k entries.
+    """
+    path: str
+    hidden: bool
+    max_entries: Optional[int]
+    truncated: bool
+    _sorted: list[str]
+    _pending: list[str]
+
+    def __init__(
+        self,
+        path: str = ".",
+        page_size: int = 2048,
+        hidden: bool = True,
+        max_entries: Optional[int] = MAX_ENTRIES,
+    ) -> None:
+        super().__init__(page_size)
+        self.path: str = path
+        self.hidden: bool = hidden
+        self.max_entries: Optional[int] = max_entries
+        self.truncated: bool = False
+        self._sorted = list()
+        self._pending = list()
+        self._scan = os.scandir(path)
+
+    def stream(self) -> None:
+        """
+        Read the next batch of entries.
+        """
+        if self._exhausted:
+            return
+        batch: list[str] = self._pending
+        read: int = 0
+        for entry in itertools.islice(self._scan, self.page_size):
+            read += 1
+            if not self.hidden and entry.name.startswith("."):
+                continue
+            try:
+                directory: bool = entry.is_dir()
+            except OSError:
+                directory = False
+            batch.append(_key(entry.name + "/" if directory else entry.name))
+        count: int = len(self._sorted) + len(batch)
+        if self.max_entries is not None and count >= self.max_entries:
+            # The scan stops here: truncated if any other entry is left.
+            self.truncated = count > self.max_entries or (read == self.page_size and self._more())
+            del batch[self.max_entries - len(self._sorted):]
+            read = 0
+        if read < self.page_size:
+            self._exhausted = True
+            self._scan.close()
+
+    def _more(self) -> bool:
+        """
+        Return if the scan has another (shown) entry.
+        """
+        return any(self.hidden or not entry.name.startswith(".") for entry in self._scan)
+
+    def _merge(self) -> None:
+        """
+        Sort the read entries into the others.
+        """
+        if self._pending:
+            self._pending.sort()
+            self._sorted += self._pending
+            self._sorted.sort()
+            self._pending.clear()
+
+    def ensure(self, count: Optional[int] = None) -> None:
+        while not self._exhausted and (count is None or len(self._sorted) + len(self._pending) < count):
+            self.stream()
+
+    def close(self) -> None:
+        self._scan.close()
+
+    def index(self, name: str) -> int:
+        """
+        Return the position of an entry's name (or where it would be).
+        """
+        self._merge()
+        return bisect.bisect_left(self._sorted, _key(name))
+
+    def __len__(self) -> int:
+        self._merge()
+        return len(self._sorted)
+
+    def __getitem__(self, index: int) -> str:
+        self._merge()
+        key: str = self._sorted[index]
+        return key[key.index("\0") + 1:]
+
+    def __iter__(self) -> Iterator[str]:
+        self.ensure()
+        self._merge()
+        return (key[key.index("\0") + 1:] for key in self._sorted)
+
+
+class DirectoryBrowser(select_menu.SelectMenu):
+    """
+    Browse directories and pick a file. \n
+    Opens on the first batch of entries; the next ones are streamed while no key is pressed,
+    the shown window being repainted every `STREAM_BUDGET` seconds.
+    Sizes are stat-ed only for the shown entries, through a bounded `StatCache`,
+    and at most `max_entries` entries are read from a directory (noted in the prompt).
+    Enter or right opens a directory, left (or backspace without search) goes to the parent.
+    """
+    path: str
+    stats: StatCache
+    options: Listing
+    hidden: bool
+    max_entries: Optional[int]
+
+    def __init__(
+        self,
+        path: str = ".",
+        height: Optional[int] = None,
+        page_size: int = 2048,
+        hidden: bool = True,
+        stat_cache: int = 4096,
+        max_entries: Optional[int] = MAX_ENTRIES,
+    ) -> None:
+        self.path: str = os.path.abspath(path)
+        self.hidden: bool = hidden
+        self.max_entries: Optional[int] = max_entries
+        self.stats: StatCache = StatCache(stat_cache)
+        self._page_size: int = page_size
+        listing: Listing = Listing(self.path, page_size, hidden, max_entries)
+        listing.stream()
+        super().__init__(listing, self._prompt(listing), height)
+
+    def _prompt(self, listing: Listing) -> str:
+        """
+        Return the prompt: the listed path, and whether its entries were cut.
+        """
+        truncated: str = f" (first {listing.max_entries} entries)" if listing.truncated else ""
+        return f"{listing.path}{os.sep if not listing.path.endswith(os.sep) else ''}{truncated}"
+
+    def _fit_height(self) -> int:
+        """
+        Return the window height fitting the terminal, whatever the directory: others can be opened.
+        """
+        return max(1, self._terminal_lines())
+
+    def _mark(self, option: int) -> str:
+        """
+        Size column: the size of files, `<dir>` for directories.
+        """
+        name: str = self.options[option]
+        if name.endswith("/"):
+            return "<dir> "
+        stat: Optional[os.stat_result] = self.stats.get(os.path.join(self.path, name))
+        return f"{human_size(stat.st_size)} " if stat is not None else "    ? "
+
+    def _stream(self, reader: keys.KeyReader) -> None:
+        """
+        Read entries until a key is pressed or for `STREAM_BUDGET` seconds,
+        then repaint, keeping the same entry selected (once the selection moved).
+        """
+        selected: Optional[str] = self.options[self._shown[self.selected_index]] if self.selected_index else None
+        deadline: float = time.monotonic() + STREAM_BUDGET
+        while not self.options.exhausted and time.monotonic() < deadline and not reader.pending():
+            self.options.stream()
+
+        self._shown = range(len(self.options))
+        if selected is not None:
+            index: int = self.options.index(selected)
+            self.top = max(0, index - (self.selected_index - self.top))
+            self.selected_index = index
+        # Repainted from the prompt once truncated, to tell it.
+        prompt: str = self._prompt(self.options)
+        lines: int = self.height + self.searchable + (prompt != self.prompt)
+        head: str = f"\r\x1b[2K{prompt[-self._width + 1:]}\n" if prompt != self.prompt else ""
+        self.prompt = prompt
+        sys.stdout.write(f"\x1b[{lines}A{head}{self._search_line()}{self._window()}")
+        sys.stdout.flush()
+
+    def _get_key(self) -> str:
+        """
+        Return the next key, streaming entries while waiting for it.
+        """
+        reader: keys.KeyReader = keys.default_reader()
+        while not self.options.exhausted and not self.query:
+            if reader.pending():
+                break
+            self._stream(reader)
+        return super()._get_key()
+
+    def open(self, path: str) -> None:
+        """
+        Show another directory, in place.
+        """
+        try:
+            listing: Listing = Listing(os.path.abspath(path), self._page_size, self.hidden, self.max_entries)
+        except OSError:
+            # Not readable: stay here.
+            return
+        self.options.close()
+        self.options = listing
+        self.path = listing.path
+        self.options.stream()
+        self.prompt = self._prompt(listing)
+        self.query = ""
+        self._index = None
+        self._shown = range(len(self.options))
+        self.selected_index = 0
+        self.top = 0
+        self.stats.clear()
+        sys.stdout.write(
+            f"\x1b[{self.height + self.searchable + 1}A\r\x1b[2K{self.prompt[-self._width + 1:]}\n"
+            f"{self._search_line()}{self._window()}"
+        )
+        sys.stdout.flush()
+
+    def _draw_menu(self) -> None:
+        sys.stdout.write(f"{self.prompt[-self._width + 1:]}\n{self._search_line()}{self._window()}")
+        sys.stdout.flush()
+
+    def _handle(self, key: str) -> bool:
+        selected: Optional[str] = self.options[self._shown[self.selected_index]] if self._shown else None
+        if key in select_menu.ENTER or key in select_menu.RIGHT:
+            if selected is not None and selected.endswith("/"):
+                self.open(os.path.join(self.path, selected))
+                return False
+            return key in select_menu.ENTER and selected is not None
+        if key in select_menu.LEFT or (key in select_menu.BACKSPACE and not self.query):
+            self.open(os.path.dirname(self.path))
+            return False
+        return super()._handle(key)
+
+    def show(self) -> str:
+        """
+        Browse, and return the path of the chosen file.
+        """
+        try:
+            self._run()
+        finally:
+            self.options.close()
+        return os.path.join(self.path, self.options[self._shown[self.selected_index]])
+
+
+def main() -> None:
+    print(f"\nChosen: {DirectoryBrowser().show()}")
+
+
+if __name__ == "__main__":
+    main()
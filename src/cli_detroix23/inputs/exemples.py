@@ -2,8 +2,12 @@
 CLI - Inputs
 exemples.py
 """
-import base.specials as specials
-import inputs.keys as keys
+import sqlite3
+
+from ..base import specials
+from . import keys
+from . import sources
+from . import select_menu
 
 def run_basic_keys() -> None:
     """
@@ -23,5 +27,22 @@ def run_basic_keys() -> None:
         mapped: list[str] = specials.filter_map(specials.NICE_MAP, key)
         print(mapped, end="\r")
 
+def run_sources() -> None:
+    """
+    Select from lazy sources: a directory listing, and rows of a SQLite database.
+    """
+    entry: str = select_menu.SelectMenu(sources.DirectorySource("."), "Pick a file:").show()
+    print(f"\nFile: {entry}")
+
+    connection: sqlite3.Connection = sqlite3.connect(":memory:")
+    connection.execute("CREATE TABLE users (name TEXT)")
+    connection.executemany("INSERT INTO users VALUES (?)", ((f"user_{i:06}",) for i in range(100_000)))
+    users: list[str] = select_menu.MultiSelectMenu(
+        sources.sqlite_source(connection, "SELECT name FROM users ORDER BY name"),
+        "Pick users (space to toggle):",
+    ).show()
+    print(f"\nUsers: {users}")
+    connection.close()
+
 if __name__ == "__main__":
     run_basic_keys()
\ No newline at end of file
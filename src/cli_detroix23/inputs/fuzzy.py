@@ -0,0 +1,229 @@
+"""
+CLI - Inputs
+fuzzy.py
+Fuzzy (subsequence) filtering of options, narrowed as the query is typed.
+"""
+import time
+import itertools
+from collections import Counter
+from typing import TYPE_CHECKING, Optional, Sequence
+
+# re is imported by the first search (`pattern`): not at startup.
+if TYPE_CHECKING:
+    import re
+
+# Characters after which a match starts a word.
+SEPARATORS: str = " _-./\\:"
+# Number of options sampled to find the common characters, whose postings are prepared ahead.
+COMMON_SAMPLE: int = 2000
+# Time spent checking candidates by a search at most, in seconds: the others are checked while idle.
+VERIFY_BUDGET: float = 0.006
+# Candidates checked between two looks at the clock.
+VERIFY_CHUNK: int = 1024
+# `bin` digits to bytes flags (0 or 1), for `itertools.compress`.
+_FLAGS: bytes = bytes.maketrans(b"01", b"\x00\x01")
+
+
+def bit_indexes(mask: int) -> list[int]:
+    """
+    Return the positions of the set bits of a mask, in order.
+    """
+    return list(itertools.compress(itertools.count(), bin(mask)[:1:-1].encode().translate(_FLAGS)))
+
+def pattern(query: str) -> "re.Pattern[str]":
+    """
+    Return the regex matching (from the start) the texts containing the query's characters in order.
+    Each character is reached by skipping the others: a single pass, without backtracking.
+    """
+    import re
+    return re.compile("".join(f"[^{re.escape(char)}]*{re.escape(char)}" for char in query))
+
+def score(text: str, query: str) -> int:
+    """
+    Return how well a (casefolded) text matches a query, higher is better:
+    consecutive characters, and characters starting a word, weight more; late and long matches less.
+    """
+    total: int = 0
+    position: int = -1
+    previous: int = -2
+    for char in query:
+        position = text.find(char, position + 1)
+        if position < 0:
+            return 0
+        if position == previous + 1:
+            total += 8
+        if position == 0 or text[position - 1] in SEPARATORS:
+            total += 6
+        previous = position
+    return total * 16 - text.find(query[0]) - len(text) // 4
+
+
+class Narrowing:
+    """
+    Matches of a query, checked by parts: `results` are the matching `candidates[:checked]`,
+    in the options' order.
+    """
+    query: str
+    mask: int
+    candidates: list[int]
+    checked: int
+    results: list[int]
+
+    def __init__(self, query: str, mask: int, candidates: list[int], exact: bool = False) -> None:
+        """
+        If `exact`, every candidate is known to match.
+        """
+        self.query: str = query
+        self.mask: int = mask
+        self.candidates: list[int] = candidates
+        self.checked: int = len(candidates) if exact else 0
+        self.results: list[int] = candidates if exact else list()
+
+    @property
+    def complete(self) -> bool:
+        """
+        Get if every candidate was checked.
+        """
+        return self.checked == len(self.candidates)
+
+    def remaining(self) -> list[int]:
+        """
+        Return the candidates which may match: the results, then the unchecked candidates.
+        """
+        if self.complete:
+            return self.results
+        return self.results + self.candidates[self.checked:]
+
+
+class FuzzyIndex:
+    """
+    Index of options for fuzzy filtering. \n
+    Each character has a posting: a bitset (an int) of the options containing it, built
+    on first use. A query's candidates are the AND of its characters' postings; only
+    them are checked by a subsequence regex. Typing a character narrows the previous
+    results, kept in a stack so backspace is free; when they are few, they are checked
+    directly instead of building a new posting. Results are sorted by score only
+    when there are at most `score_limit` of them, else they keep the options' order. \n
+    A search checks candidates for `verify_budget` seconds at most (by chunks of `VERIFY_CHUNK`):
+    its results may be partial (`complete` is False), the next ones being checked by `prepare`
+    or the next search.
+    A posting costs a pass on every option: `prepare` also builds the next common
+    character's one ahead. It is called while idle (as `SelectMenu` does), not on a keystroke.
+    """
+    options: Sequence[str]
+    score_limit: int
+    verify_budget: float
+    _folded: list[str]
+    _postings: dict[str, int]
+    # Characters of the options, most common first, whose posting isn't built yet.
+    _common: list[str]
+    _stack: list[Narrowing]
+
+    def __init__(self, options: Sequence[str], score_limit: int = 1000, verify_budget: float = VERIFY_BUDGET) -> None:
+        self.options: Sequence[str] = options
+        self.score_limit: int = score_limit
+        self.verify_budget: float = verify_budget
+        self._folded = [option.casefold() for option in options]
+        self._postings = dict()
+        sample: Counter[str] = Counter("".join(self._folded[:COMMON_SAMPLE]))
+        self._common = [char for char, _ in sample.most_common()][::-1]
+        self._stack = [Narrowing("", (1 << len(options)) - 1, list(range(len(options))), exact=True)]
+
+    def posting(self, char: str) -> int:
+        """
+        Return the bitset of the options containing the (casefolded) character.
+        """
+        mask: Optional[int] = self._postings.get(char)
+        if mask is None:
+            # Bit i is option i: the string is written from the last option.
+            bits: str = "".join(["1" if char in text else "0" for text in reversed(self._folded)])
+            mask = int(bits or "0", 2)
+            self._postings[char] = mask
+        return mask
+
+    @property
+    def complete(self) -> bool:
+        """
+        Get if the results of the last search are complete.
+        """
+        return self._stack[-1].complete
+
+    def prepare(self) -> bool:
+        """
+        Check the next candidates of the last search, else build the posting of the next
+        common character. Return False when there is nothing left to do.
+        """
+        if not self.complete:
+            # Short steps: a key pressed meanwhile waits for it.
+            self._check(self._stack[-1], self.verify_budget / 2)
+            return True
+        while self._common:
+            char: str = self._common.pop()
+            if char not in self._postings:
+                self.posting(char)
+                return True
+        return False
+
+    def _check(self, narrowing: Narrowing, budget: float) -> None:
+        """
+        Check the next candidates of a narrowing, for `budget` seconds (one chunk at least).
+        """
+        match = pattern(narrowing.query).match
+        folded = self._folded.__getitem__
+        deadline: float = time.perf_counter() + budget
+        while True:
+            end: int = min(len(narrowing.candidates), narrowing.checked + VERIFY_CHUNK)
+            candidates: list[int] = narrowing.candidates[narrowing.checked:end]
+            narrowing.results += itertools.compress(candidates, map(match, map(folded, candidates)))
+            narrowing.checked = end
+            if narrowing.complete or time.perf_counter() >= deadline:
+                return
+
+    def search(self, query: str) -> list[int]:
+        """
+        Return the indexes of the options matching the query, best first once complete.
+        """
+        query = query.casefold()
+        # Backspace, or any shorter query: back to the longest known prefix.
+        while len(self._stack) > 1 and not query.startswith(self._stack[-1].query):
+            self._stack.pop()
+
+        top: Narrowing = self._stack[-1]
+        for char in query[len(top.query):]:
+            # Matches of the longer query are matches of the shorter one.
+            previous: list[int] = top.remaining()
+            mask: int = top.mask
+            # A posting costs one pass on every option the first time: few results are cheaper to check.
+            if char in self._postings or len(previous) * 4 > len(self._folded):
+                mask &= self.posting(char)
+                candidates: list[int] = previous if len(previous) <= mask.bit_count() else bit_indexes(mask)
+            else:
+                candidates = previous
+            # A single character's posting is exact.
+            top = Narrowing(top.query + char, mask, candidates, exact=not top.query)
+            self._stack.append(top)
+        if not top.complete:
+            self._check(top, self.verify_budget)
+        return self.results
+
+    @property
+    def results(self) -> list[int]:
+        """
+        Get the results of the last search so far, sorted by score once complete.
+        """
+        top: Narrowing = self._stack[-1]
+        if top.query and top.complete and len(top.results) <= self.score_limit:
+            folded: list[str] = self._folded
+            query: str = top.query
+            return sorted(top.results, key=lambda index: -score(folded[index], query))
+        return top.results
+
+    def reset(self) -> None:
+        """
+        Forget the typed queries (not the postings).
+        """
+        del self._stack[1:]
+
+
+if __name__ == "__main__":
+    print("cf. Exemples.")
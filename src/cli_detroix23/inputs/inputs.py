@@ -4,8 +4,12 @@ inputs.py
 """
 
 import os
+import sys
+import bisect
+import builtins
 import pathlib as path
-from typing import Union, Optional
+from types import MappingProxyType
+from typing import Iterable, Iterator, Mapping, Union, Optional
 
 symbol_mode: dict[str, list[str]] = {
         "1": ["1", "en", "encode", "enc"],
@@ -21,23 +25,121 @@ symbol_bool: dict[str, list[str]] = {
     "1": ["Yes", "YES", "yes", "ye", "y", "Y"]
 }
    
-def list_directory(directory: path.Path) -> None:
+def list_directory(directory: path.Path, buffer_lines: int = 1000) -> None:
     """
-    Print the items of the given directory
+    Print the items of the given directory. \n
+    Entries are streamed (`os.scandir`) and written by blocks of `buffer_lines`,
+    not listed at once: huge directories start printing immediately.
+    For browsing them, see `inputs.directory.DirectoryBrowser`.
     """
     print(f"*Files in `{directory}`.*")
-    files: list[str] = os.listdir(directory)
-
-    for file in files:
-        if file.lower() not in ["readme.md", "readme"]:
-            print(f"\t- {file}")
+    lines: list[str] = list()
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.lower() not in ("readme.md", "readme"):
+                lines.append(f"\t- {entry.name}\n")
+                if len(lines) >= buffer_lines:
+                    sys.stdout.write("".join(lines))
+                    lines.clear()
+    sys.stdout.write("".join(lines))
     print()
     return
 
 
+class Validator:
+    """
+    Precompiled check of typed answers against symbols. \n
+    `symbols`, as in `input`: a list (each symbol is its own alias), or a dict of symbol: aliases.
+    The aliases are turned once into a frozen alias -> symbol map: an answer costs a single
+    lookup, whatever the number of aliases. \n
+    If `casefold`, the case is ignored. If `prefix`, an answer can be the start of aliases,
+    when they all have the same symbol (`"enc"` for `"encode"`); found with a sorted index.
+    """
+    symbols: tuple[str, ...]
+    casefold: bool
+    prefix: bool
+    aliases: Mapping[str, str]
+    _sorted: tuple[str, ...]
+    _sorted_symbols: tuple[str, ...]
+
+    def __init__(
+        self,
+        symbols: Union[dict[str, list[str]], list[str]],
+        casefold: bool = False,
+        prefix: bool = False,
+    ) -> None:
+        if isinstance(symbols, list):
+            symbols = {symbol: [symbol] for symbol in symbols}
+        self.symbols: tuple[str, ...] = tuple(symbols.keys())
+        self.casefold: bool = casefold
+        self.prefix: bool = prefix
+
+        aliases: dict[str, str] = dict()
+        for symbol, values in symbols.items():
+            for value in values:
+                alias: str = value.casefold() if casefold else value
+                if aliases.get(alias, symbol) != symbol:
+                    raise ValueError(f"(X) - Validator: alias `{value}` of both `{aliases[alias]}` and `{symbol}`.")
+                aliases[alias] = symbol
+        self.aliases: Mapping[str, str] = MappingProxyType(aliases)
+        self._sorted = tuple(sorted(aliases))
+        self._sorted_symbols = tuple(aliases[alias] for alias in self._sorted)
+
+    def _complete(self, answer: str) -> Optional[str]:
+        """
+        Return the symbol of the aliases starting with the answer, None if none or ambiguous.
+        """
+        if not answer:
+            return None
+        start: int = bisect.bisect_left(self._sorted, answer)
+        end: int = bisect.bisect_left(self._sorted, answer + "\U0010ffff", start)
+        if start == end or len(set(self._sorted_symbols[start:end])) > 1:
+            return None
+        return self._sorted_symbols[start]
+
+    def get(self, answer: str) -> Optional[str]:
+        """
+        Return the symbol of an answer (stripped), None if it is invalid.
+        """
+        answer = answer.strip()
+        if self.casefold:
+            answer = answer.casefold()
+        symbol: Optional[str] = self.aliases.get(answer)
+        if symbol is None and self.prefix:
+            return self._complete(answer)
+        return symbol
+
+    def __contains__(self, answer: str) -> bool:
+        return self.get(answer) is not None
+
+    def validate_stream(self, lines: Iterable[str]) -> Iterator[Optional[str]]:
+        """
+        Return the symbols of many answers (lines of a file, a pipe...): None for the invalid ones.
+        ```python
+            with open("answers.txt") as answers:
+                symbols = list(validator.validate_stream(answers))
+        ```
+        """
+        answers: Iterator[str] = map(str.strip, lines)
+        if self.casefold:
+            answers = map(str.casefold, answers)
+        if not self.prefix:
+            return map(self.aliases.get, answers)
+        get = self.aliases.get
+        complete = self._complete
+        return (symbol if (symbol := get(answer)) is not None else complete(answer) for answer in answers)
+
+    def __repr__(self) -> str:
+        return f"Validator(symbols: tuple = {self.symbols}, aliases: int = {len(self.aliases)}, casefold: bool = {self.casefold}, prefix: bool = {self.prefix})"
+
+
+# Precompiled validator of `boolean_input`.
+validator_bool: Validator = Validator(symbol_bool)
+
+
 def input(
     message: str,
-    symbols: Union[dict[str, list[str]], list[str], None] = None,
+    symbols: Union[Validator, dict[str, list[str]], list[str], None] = None,
     default: Optional[int] = None,
     must_validate: bool = True,
     allowed_type: type = str,
@@ -50,6 +152,7 @@ def input(
         - None (default): no restriction
         - list[str]: Only one keyword for each symbol, itself
         - dict[str, list[str]]: Each symbol can have multiple keywords.
+        - Validator: precompiled (reused between calls, case folding, prefixes)
     `Allowed` contains as keys the true machine return symbol and as value the list of all string that corrispond to that key.
     If none, all responses are correct.
     `Default` is the index of the default key of the allowed list.
@@ -57,15 +160,16 @@ def input(
     valid: bool = False
     true_response: Optional[str] = None 
     i: int = 0
-    if isinstance(symbols, list):
-        symbols = {symbol: [symbol] for symbol in symbols}
+    validator: Optional[Validator] = None
+    if symbols is not None:
+        validator = symbols if isinstance(symbols, Validator) else Validator(symbols)
 
     while not valid and i < max_iterations:
-        response: str = input(message).strip()
+        response: str = builtins.input(message).strip()
 
         if response == "" and default is None:
             pass
-        elif symbols is None:
+        elif validator is None:
             try:
                 allowed_type(response)
             except:
@@ -75,18 +179,18 @@ def input(
                 valid = True
         elif response == "":
             if default is not None:
-                true_response = list(symbols.keys())[default]
+                true_response = validator.symbols[default]
                 valid = True
         else:
-            for key, values in symbols.items():
-                if response in values:
-                    try:
-                        allowed_type(response)
-                    except:
-                        pass
-                    else:
-                        true_response = key
-                        valid = True
+            symbol: Optional[str] = validator.get(response)
+            if symbol is not None:
+                try:
+                    allowed_type(response)
+                except:
+                    pass
+                else:
+                    true_response = symbol
+                    valid = True
         if not valid:
             print(f"{error_message}({response}). ", end="\n")
         i += 1
@@ -109,22 +213,18 @@ def boolean_input(
     valid: bool = False
     true_response: Optional[bool] = None 
     i: int = 0
-    symbols: dict[bool, list[str]] = {
-        False: ["No", "NO", "no", "n", "N"],
-        True: ["Yes", "YES", "yes", "ye", "y", "Y"]
-    }
 
     while not valid and i < max_iterations:
-        response: str = input(message).strip()
+        response: str = builtins.input(message).strip()
 
         if response == "":
             true_response = default
             valid = True
         else:
-            for key, values in symbols.items():
-                if response in values:
-                    true_response = key
-                    valid = True
+            symbol: Optional[str] = validator_bool.get(response)
+            if symbol is not None:
+                true_response = symbol == "1"
+                valid = True
         if not valid:
             print(f"{error_message}({response}). ", end="\n")
         i += 1
@@ -133,6 +233,3 @@ def boolean_input(
         raise ValueError(f"(X) - Can't return an invalid response.")
     print(f"R: `{true_response}`")
     return true_response
-
-
-
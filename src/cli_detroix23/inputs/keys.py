@@ -2,16 +2,18 @@
 CLI - Inputs
 keys.py
 """
+import os
 import sys
+import time
+import selectors
+from typing import Iterator, Optional, Union
 
-import compatibility.plateform as plateform
-if plateform.OS == plateform.Os.UNIX:
-    import termios
-    import tty
-elif plateform.OS == plateform.Os.WINDOWS:
+from ..compatibility import plateform
+# termios and tty are imported when raw mode is first entered (`KeyReader.open`).
+if plateform.OS != plateform.Os.UNIX:
     import msvcrt
 
-import compatibility.types as types
+from ..compatibility import types
 
 # import base.specials as specials
 
@@ -62,39 +64,351 @@ class Key:
         return f"Key(name={self._name}, windows={repr(self._windows)}, unix={repr(self._unix)})"
 
 
-def get_key(*, allow_keyboard_interrupt: bool = True) -> str:
+# Known sequences, decoded before the generic rules (some don't follow them, like the Linux console F-keys).
+SEQUENCES: dict[str, str] = {
+    "\x1b[A": "Arrow up",
+    "\x1b[B": "Arrow down",
+    "\x1b[C": "Arrow right",
+    "\x1b[D": "Arrow left",
+    "\x1b[H": "Home",
+    "\x1b[F": "End",
+    "\x1bOA": "Arrow up",
+    "\x1bOB": "Arrow down",
+    "\x1bOC": "Arrow right",
+    "\x1bOD": "Arrow left",
+    "\x1bOH": "Home",
+    "\x1bOF": "End",
+    "\x1bOP": "F1",
+    "\x1bOQ": "F2",
+    "\x1bOR": "F3",
+    "\x1bOS": "F4",
+    "\x1b[[A": "F1",
+    "\x1b[[B": "F2",
+    "\x1b[[C": "F3",
+    "\x1b[[D": "F4",
+    "\x1b[[E": "F5",
+    "\x1b[1~": "Home",
+    "\x1b[2~": "Insert",
+    "\x1b[3~": "Delete",
+    "\x1b[4~": "End",
+    "\x1b[5~": "Page up",
+    "\x1b[6~": "Page down",
+    "\x1b[15~": "F5",
+    "\x1b[17~": "F6",
+    "\x1b[18~": "F7",
+    "\x1b[19~": "F8",
+    "\x1b[20~": "F9",
+    "\x1b[21~": "F10",
+    "\x1b[23~": "F11",
+    "\x1b[24~": "F12",
+    "\x1b[Z": "Shift tab",
+}
+
+# Type - Trie node: next nodes by byte, and the complete sequence ending here (or None).
+Node = tuple[dict[int, "Node"], list[Optional[bytes]]]
+
+def _build_trie(sequences: dict[str, str]) -> Node:
+    """
+    Return the bytes trie of the sequences.
+    """
+    root: Node = ({}, [None])
+    for sequence in sequences:
+        node: Node = root
+        for byte in sequence.encode():
+            node = node[0].setdefault(byte, ({}, [None]))
+        node[1][0] = sequence.encode()
+    return root
+
+_TRIE: Node = _build_trie(SEQUENCES)
+# Raw mode through termios (Unix only).
+_RAW_MODE: bool = plateform.OS == plateform.Os.UNIX
+
+ESCAPE: int = 0x1b
+# X10 mouse reports: `ESC [ M` and 3 raw bytes.
+_MOUSE_X10: bytes = b"\x1b[M"
+
+
+def _utf8_length(lead: int) -> int:
     """
-    Get the user pressed key.
+    Return the length of the UTF-8 character starting with this byte (1 if invalid).
     """
-    if plateform.OS == plateform.Os.UNIX:
-        fd: int = sys.stdin.fileno()
-        old_settings: types.Attr = termios.tcgetattr(fd)    # pyright: ignore[reportPossiblyUnboundVariable]
+    if lead >= 0xf0:
+        return 4
+    if lead >= 0xe0:
+        return 3
+    if lead >= 0xc0:
+        return 2
+    return 1
+
+def split_key(buffer: Union[bytes, bytearray]) -> int:
+    """
+    Return the length of the first complete key of the buffer, or 0 if it is incomplete. \n
+    The buffer is walked in the trie of known sequences first, then by the generic rules:
+    CSI `ESC [ params final`, SS3 `ESC O x`, X10 mouse `ESC [ M b x y`, Alt `ESC x`, and UTF-8 characters.
+    """
+    size: int = len(buffer)
+    if size == 0:
+        return 0
+
+    # Known sequences.
+    node: Node = _TRIE
+    for index in range(size):
+        following: Optional[Node] = node[0].get(buffer[index])
+        if following is None:
+            break
+        node = following
+        if node[1][0] is not None and not node[0]:
+            return index + 1
+    else:
+        if node[0]:
+            return 0
+
+    lead: int = buffer[0]
+    if lead != ESCAPE:
+        length: int = _utf8_length(lead)
+        return length if size >= length else 0
+    if size == 1:
+        return 0
+
+    second: int = buffer[1]
+    # CSI.
+    if second == 0x5b:
+        if buffer[:3] == _MOUSE_X10:
+            return 6 if size >= 6 else 0
+        for index in range(2, size):
+            if 0x40 <= buffer[index] <= 0x7e:
+                return index + 1
+        return 0
+    # SS3.
+    if second == 0x4f:
+        return 3 if size >= 3 else 0
+    # Double escape: the first one is alone.
+    if second == ESCAPE:
+        return 1
+    # Alt + character.
+    length = 1 + _utf8_length(second)
+    return length if size >= length else 0
+
+
+class KeyReader:
+    """
+    Long-lived keyboard reader. \n
+    Used as a context manager, it enters raw mode once (output processing is kept, so
+    `print` still works) and reads everything available with `os.read` into a buffer:
+    pasted text and auto-repeat are decoded key by key, never lost between two reads.
+    An escape alone is returned after `escape_timeout` seconds without its sequence.
+    Nested `with` blocks keep the same mode.
+    ```python
+        with KeyReader() as reader:
+            while (key := reader.read()) != "q":
+                ...
+    ```
+    """
+    fd: int
+    escape_timeout: float
+    allow_keyboard_interrupt: bool
+    _buffer: bytearray
+    _depth: int
+    _settings: Optional[types.Attr]
+    _selector: Optional[selectors.BaseSelector]
+    _pollable: bool
+    _incomplete: Optional[float]
+
+    def __init__(
+        self,
+        fd: Optional[int] = None,
+        escape_timeout: float = 0.05,
+        *, allow_keyboard_interrupt: bool = True,
+    ) -> None:
+        self.fd: int = sys.stdin.fileno() if fd is None else fd
+        self.escape_timeout: float = escape_timeout
+        self.allow_keyboard_interrupt: bool = allow_keyboard_interrupt
+        self._buffer = bytearray()
+        self._depth = 0
+        self._settings = None
+        # Created on the first wait (epoll, kqueue... depending on the system).
+        self._selector = None
+        # False for regular files: they can't be waited for (epoll rejects them), and are always readable.
+        self._pollable = True
+        # Time since which the buffer starts with an incomplete escape sequence.
+        self._incomplete = None
+
+    def open(self) -> None:
+        """
+        Enter raw mode, if not yet.
+        """
+        self._depth += 1
+        if self._depth > 1 or not _RAW_MODE:
+            return
+        import termios
+        import tty
         try:
-            tty.setraw(sys.stdin.fileno())                  # pyright: ignore[reportPossiblyUnboundVariable]
-            key = sys.stdin.read(1)
-            # Handle arrow keys (escape sequences).
-            if key == "\x1b":
-                key += sys.stdin.read(2)
-            # Ctrl+C.
-            elif key == "\x03" and allow_keyboard_interrupt:
-                raise KeyboardInterrupt(f"(X) - Keyboard interrupt while getting key ({repr(key)}).")
-            return key
-        finally:
-            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)      # pyright: ignore[reportPossiblyUnboundVariable]
-    # Windows
-    elif plateform.OS == plateform.Os.WINDOWS: 
-        key: str = msvcrt.getch()       # pyright: ignore
-        # Special key prefix on Windows
-        if key == b"\xe0":  
-            key += msvcrt.getch()       # pyright: ignore
-        # Ctrl+C.
-        elif key == b"\x03" and allow_keyboard_interrupt:
+            self._settings = termios.tcgetattr(self.fd)
+        except termios.error:
+            # Not a terminal (pipe, file): read it as is.
+            self._settings = None
+            return
+        # TCSANOW: unlike the default flush, keys typed in advance are kept.
+        tty.setraw(self.fd, termios.TCSANOW)
+        attributes: types.Attr = termios.tcgetattr(self.fd)
+        attributes[1] |= termios.OPOST                      # pyright: ignore
+        termios.tcsetattr(self.fd, termios.TCSANOW, attributes)
+
+    def close(self) -> None:
+        """
+        Leave raw mode, when the outermost block exits.
+        """
+        self._depth = max(0, self._depth - 1)
+        if self._depth == 0 and self._settings is not None:
+            import termios
+            termios.tcsetattr(self.fd, termios.TCSADRAIN, self._settings)
+            self._settings = None
+
+    def __enter__(self) -> 'KeyReader':
+        self.open()
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def _wait(self, timeout: Optional[float]) -> bool:
+        """
+        Wait for input, at most `timeout` seconds (forever if None). Return if some is available.
+        """
+        if plateform.OS == plateform.Os.UNIX:
+            if not self._pollable:
+                return True
+            if self._selector is None:
+                selector: selectors.BaseSelector = selectors.DefaultSelector()
+                try:
+                    selector.register(self.fd, selectors.EVENT_READ)
+                except PermissionError:
+                    selector.close()
+                    self._pollable = False
+                    return True
+                self._selector = selector
+            return bool(self._selector.select(timeout))
+        deadline: float = time.monotonic() + (timeout if timeout is not None else float("inf"))
+        while not msvcrt.kbhit():           # pyright: ignore
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.005)
+        return True
+
+    def _fill(self) -> bool:
+        """
+        Append all the available input to the buffer. Return False at the end of input.
+        """
+        if plateform.OS == plateform.Os.UNIX:
+            data: bytes = os.read(self.fd, 1024)
+            self._buffer += data
+            return bool(data)
+        while msvcrt.kbhit():               # pyright: ignore
+            char: bytes = msvcrt.getch()    # pyright: ignore
+            # Special key prefix on Windows: only keep the key, as `get_key` always did.
+            if char not in {b"\xe0", b"\x00"}:
+                self._buffer += char
+        return True
+
+    def pending(self) -> bool:
+        """
+        Return if a key can be read without waiting.
+        """
+        return split_key(self._buffer) > 0 or self._wait(0)
+
+    def _take(self, length: int, allow_keyboard_interrupt: Optional[bool] = None) -> str:
+        """
+        Remove the first `length` bytes of the buffer and return them as a key.
+        `allow_keyboard_interrupt` overrides the reader's for this key.
+        """
+        key: str = self._buffer[:length].decode(errors="replace")
+        del self._buffer[:length]
+        self._incomplete = None
+        if allow_keyboard_interrupt is None:
+            allow_keyboard_interrupt = self.allow_keyboard_interrupt
+        if key == "\x03" and allow_keyboard_interrupt:
             raise KeyboardInterrupt(f"(X) - Keyboard interrupt while getting key ({repr(key)}).")
-        return key.decode('utf-8', errors='ignore')     # pyright: ignore
-    
-    # Failed to find os.
-    else:
-        raise OSError(f"(X) - Keys.get_key: Unrecognized OS ({plateform.OS}).")
+        return key
+
+    def read(self, timeout: Optional[float] = None, *, allow_keyboard_interrupt: Optional[bool] = None) -> Optional[str]:
+        """
+        Return the next key, waiting at most `timeout` seconds (forever if None). \n
+        Return None on timeout, or an empty string at the end of input.
+        `allow_keyboard_interrupt` overrides the reader's for this call.
+        """
+        deadline: Optional[float] = None if timeout is None else time.monotonic() + timeout
+        while True:
+            length: int = split_key(self._buffer)
+            if length == 0 and self._buffer and self._buffer[0] == ESCAPE:
+                # Incomplete sequence: an escape alone, unless the rest comes quickly.
+                if not self._wait(self.escape_timeout):
+                    length = 1
+            if length > 0:
+                return self._take(length, allow_keyboard_interrupt)
+
+            remaining: Optional[float] = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if not self._wait(remaining):
+                return None
+            if not self._fill():
+                return self._take(len(self._buffer), allow_keyboard_interrupt)
+
+    def poll(self) -> list[str]:
+        """
+        Return every key available now, never waiting. Made to be called once per frame. \n
+        An incomplete escape sequence is kept for the next call, and returned as an escape
+        alone once it is older than `escape_timeout`.
+        """
+        while self._wait(0):
+            if not self._fill():
+                break
+
+        keys: list[str] = list()
+        while self._buffer:
+            length: int = split_key(self._buffer)
+            if length == 0:
+                if self._buffer[0] != ESCAPE:
+                    break
+                now: float = time.monotonic()
+                if self._incomplete is None:
+                    self._incomplete = now
+                if now - self._incomplete < self.escape_timeout:
+                    break
+                length = 1
+            keys.append(self._take(length))
+        return keys
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Yield the keys until the end of input.
+        """
+        while key := self.read():
+            yield key
+
+
+_reader: Optional[KeyReader] = None
+
+def default_reader() -> KeyReader:
+    """
+    Return the reader shared by `get_key` (and the menus), so its buffer persists between calls.
+    """
+    global _reader
+    if _reader is None:
+        _reader = KeyReader()
+    return _reader
+
+def get_key(*, allow_keyboard_interrupt: bool = True) -> str:
+    """
+    Get the user pressed key. \n
+    Uses the default `KeyReader`: raw mode is only entered if no reader is open yet,
+    and the keys read in advance are kept for the next call.
+    Raise EOFError at the end of input (closed or exhausted pipe).
+    """
+    reader: KeyReader = default_reader()
+    with reader:
+        key: Optional[str] = reader.read(allow_keyboard_interrupt=allow_keyboard_interrupt)
+    if not key:
+        raise EOFError("(X) - get_key: end of input.")
+    return key
 
 if __name__ == "__main__":
     print("cf. Exemples.")
\ No newline at end of file
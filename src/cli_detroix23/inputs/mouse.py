@@ -0,0 +1,260 @@
+"""
+CLI - Inputs
+mouse.py
+Mouse tracking: SGR 1006 reports decoded into events, and hit testing by grid buckets.
+"""
+import sys
+import re
+from enum import Enum
+from typing import Generic, Iterable, Optional, TypeVar
+
+from ..maths import maths
+
+T = TypeVar("T")
+
+# SGR 1006 report: `ESC [ < button ; x ; y M` (press, motion) or `m` (release).
+SGR_PATTERN: re.Pattern[str] = re.compile(r"\x1b\[<(\d+);(\d+);(\d+)([Mm])")
+# X10 report, when the terminal ignores SGR mode: `ESC [ M` and 3 bytes offset by 32.
+X10_PREFIX: str = "\x1b[M"
+
+# Report bits.
+_MOTION: int = 32
+_WHEEL: int = 64
+_SHIFT: int = 4
+_ALT: int = 8
+_CTRL: int = 16
+
+
+class Tracking(Enum):
+    """
+    Reported mouse events, by DEC private mode.
+    """
+    CLICKS = 1000
+    DRAG = 1002
+    ALL = 1003
+
+
+class Action(Enum):
+    CLICK = 0
+    RELEASE = 1
+    DRAG = 2
+    MOVE = 3
+    SCROLL_UP = 4
+    SCROLL_DOWN = 5
+
+
+class Button(Enum):
+    LEFT = 0
+    MIDDLE = 1
+    RIGHT = 2
+    NONE = 3
+
+
+class MouseEvent:
+    """
+    Decoded mouse report. `x`, `y` are the cell coordinates, (0, 0) being the upper left corner.
+    """
+    action: Action
+    button: Button
+    x: int
+    y: int
+    shift: bool
+    alt: bool
+    ctrl: bool
+
+    def __init__(
+        self,
+        action: Action,
+        button: Button,
+        x: int,
+        y: int,
+        shift: bool = False,
+        alt: bool = False,
+        ctrl: bool = False,
+    ) -> None:
+        self.action: Action = action
+        self.button: Button = button
+        self.x: int = x
+        self.y: int = y
+        self.shift: bool = shift
+        self.alt: bool = alt
+        self.ctrl: bool = ctrl
+
+    @property
+    def position(self) -> maths.Vector2D:
+        return maths.Vector2D(self.x, self.y)
+
+    @property
+    def motion(self) -> bool:
+        """
+        Return if the event is a motion (drag or move), which can be coalesced.
+        """
+        return self.action == Action.DRAG or self.action == Action.MOVE
+
+    def __hash__(self) -> int:
+        return hash((self.action, self.button, self.x, self.y))
+
+    def __eq__(self, target: object) -> bool:
+        if isinstance(target, MouseEvent):
+            return (
+                self.action == target.action and self.button == target.button
+                and self.x == target.x and self.y == target.y
+            )
+        return False
+
+    def __repr__(self) -> str:
+        return f"MouseEvent(action: Action = {self.action.name}, button: Button = {self.button.name}, x: int = {self.x}, y: int = {self.y})"
+
+
+def enable(tracking: Tracking = Tracking.CLICKS) -> str:
+    """
+    Return the escape sequence turning mouse reporting on, in SGR mode.
+    `Tracking.DRAG` adds motion while a button is pressed, `Tracking.ALL` every motion.
+    """
+    return f"\x1b[?{tracking.value}h\x1b[?1006h"
+
+def disable(tracking: Tracking = Tracking.CLICKS) -> str:
+    """
+    Return the escape sequence turning mouse reporting off.
+    """
+    return f"\x1b[?1006l\x1b[?{tracking.value}l"
+
+def _event(code: int, x: int, y: int, release: bool) -> MouseEvent:
+    """
+    Build the event of a report's button code; coordinates are already 0 based.
+    """
+    low: int = code & 3
+    if code & _WHEEL:
+        action: Action = Action.SCROLL_UP if low == 0 else Action.SCROLL_DOWN
+        button: Button = Button.NONE
+    else:
+        button = Button(low)
+        if release:
+            action = Action.RELEASE
+        elif code & _MOTION:
+            action = Action.MOVE if button == Button.NONE else Action.DRAG
+        else:
+            action = Action.CLICK
+    return MouseEvent(action, button, x, y, bool(code & _SHIFT), bool(code & _ALT), bool(code & _CTRL))
+
+def decode(key: str) -> Optional[MouseEvent]:
+    """
+    Return the event of a mouse report (as returned by `keys.KeyReader`), None for any other key.
+    """
+    if not key.startswith("\x1b["):
+        return None
+    match: Optional[re.Match[str]] = SGR_PATTERN.fullmatch(key)
+    if match is not None:
+        return _event(int(match[1]), int(match[2]) - 1, int(match[3]) - 1, match[4] == "m")
+    if key.startswith(X10_PREFIX) and len(key) == 6:
+        code: int = ord(key[3]) - 32
+        # X10 has no release button: the button bits are 3.
+        return _event(code, ord(key[4]) - 33, ord(key[5]) - 33, (code & 3) == 3 and not code & (_MOTION | _WHEEL))
+    return None
+
+def coalesce(events: Iterable[MouseEvent]) -> list[MouseEvent]:
+    """
+    Return the events, keeping only the last of each run of motions with the same button:
+    a whole frame of moves becomes one event, clicks and releases are kept in order.
+    """
+    result: list[MouseEvent] = list()
+    for event in events:
+        if (
+            event.motion and result and result[-1].motion
+            and result[-1].action == event.action and result[-1].button == event.button
+        ):
+            result[-1] = event
+        else:
+            result.append(event)
+    return result
+
+
+class HitMap(Generic[T]):
+    """
+    Spatial lookup of rectangular areas, for hit testing. \n
+    Areas are indexed in square buckets of `bucket` cells: a lookup only checks the
+    areas of one bucket, not every area. Later areas are on top of earlier ones.
+    """
+    bucket: int
+    _buckets: dict[tuple[int, int], list[tuple[int, int, int, int, T]]]
+
+    def __init__(self, bucket: int = 8) -> None:
+        self.bucket: int = bucket
+        self._buckets = dict()
+
+    def clear(self) -> None:
+        self._buckets.clear()
+
+    def add(self, target: T, position: maths.Vector2D, size: maths.Size) -> None:
+        """
+        Register `target` on the area of `size` cells, from the upper left `position`.
+        """
+        left: int = int(position.x)
+        top: int = int(position.y)
+        right: int = left + size.x
+        bottom: int = top + size.y
+        if size.x <= 0 or size.y <= 0:
+            return
+        area: tuple[int, int, int, int, T] = (left, top, right, bottom, target)
+        for bucket_y in range(top // self.bucket, (bottom - 1) // self.bucket + 1):
+            for bucket_x in range(left // self.bucket, (right - 1) // self.bucket + 1):
+                self._buckets.setdefault((bucket_x, bucket_y), []).append(area)
+
+    def add_shape(self, target: T, position: maths.Vector2D, size: maths.Size) -> None:
+        """
+        Register a table written with `Screen.write_table`, whose rows go up from `position`.
+        """
+        self.add(target, maths.Vector2D(position.x, position.y - size.y + 1), size)
+
+    def remove(self, target: T) -> None:
+        """
+        Unregister every area of `target`.
+        """
+        for key, areas in list(self._buckets.items()):
+            kept: list[tuple[int, int, int, int, T]] = [area for area in areas if area[4] is not target]
+            if kept:
+                self._buckets[key] = kept
+            else:
+                del self._buckets[key]
+
+    def at(self, x: int, y: int) -> Optional[T]:
+        """
+        Return the topmost target at the cell, or None.
+        """
+        areas: Optional[list[tuple[int, int, int, int, T]]] = self._buckets.get((x // self.bucket, y // self.bucket))
+        if areas is None:
+            return None
+        # Buckets are filled in order: the last match is on top.
+        for left, top, right, bottom, target in reversed(areas):
+            if left <= x < right and top <= y < bottom:
+                return target
+        return None
+
+    def hit(self, event: MouseEvent) -> Optional[T]:
+        """
+        Return the topmost target under the event.
+        """
+        return self.at(event.x, event.y)
+
+
+class Mouse:
+    """
+    Context manager turning mouse reporting on, and off on exit (even on errors).
+    """
+    tracking: Tracking
+
+    def __init__(self, tracking: Tracking = Tracking.CLICKS) -> None:
+        self.tracking: Tracking = tracking
+
+    def __enter__(self) -> 'Mouse':
+        sys.stdout.write(enable(self.tracking))
+        sys.stdout.flush()
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        sys.stdout.write(disable(self.tracking))
+        sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    print("cf. Exemples.")
@@ -2,108 +2,379 @@
 CLI - Inputs
 select_menu.py
 """
+import os
 import sys
+from typing import Iterable, Optional, Sequence, Union
+
+from ..compatibility import plateform
+from ..base import style
+from . import keys
+from . import fuzzy
+from . import sources
+
+# Navigation keys, by OS.
+if plateform.OS == plateform.Os.UNIX:
+    UP: set[str] = {"\x1b[A", "\x1bOA"}
+    DOWN: set[str] = {"\x1b[B", "\x1bOB"}
+    PAGE_UP: set[str] = {"\x1b[5~"}
+    PAGE_DOWN: set[str] = {"\x1b[6~"}
+    HOME: set[str] = {"\x1b[H", "\x1bOH", "\x1b[1~"}
+    END: set[str] = {"\x1b[F", "\x1bOF", "\x1b[4~"}
+    RIGHT: set[str] = {"\x1b[C", "\x1bOC"}
+    LEFT: set[str] = {"\x1b[D", "\x1bOD"}
+    ENTER: set[str] = {"\r", "\n"}
+    BACKSPACE: set[str] = {"\x7f", "\x08"}
+else:
+    UP = {"H"}
+    DOWN = {"P"}
+    PAGE_UP = {"I"}
+    PAGE_DOWN = {"Q"}
+    HOME = {"G"}
+    END = {"O"}
+    RIGHT = {"M"}
+    LEFT = {"K"}
+    ENTER = {"\r"}
+    BACKSPACE = {"\x08"}
+
+
+def _terminal_size() -> os.terminal_size:
+    """
+    Return the terminal's size, as `shutil.get_terminal_size` does (`COLUMNS` and `LINES` first,
+    80x24 if unknown): `shutil` would import its compression modules, and `re`, at startup.
+    """
+    try:
+        size: os.terminal_size = os.get_terminal_size(sys.__stdout__.fileno())
+    except (AttributeError, ValueError, OSError):
+        size = os.terminal_size((80, 24))
+    columns: str = os.environ.get("COLUMNS", "")
+    lines: str = os.environ.get("LINES", "")
+    return os.terminal_size((
+        int(columns) if columns.isdigit() and int(columns) > 0 else size.columns or 80,
+        int(lines) if lines.isdigit() and int(lines) > 0 else size.lines or 24,
+    ))
 
-import compatibility.plateform as plateform
-import base.style as style
-import inputs.keys as keys
 
 class SelectMenu:
     """
-    Select with arrow. Most of the code is from Claude.
+    Select with arrow. Most of the code is from Claude. \n
+    Only the options around the selection are shown, in a window of `height` lines,
+    scrolling with the selection: long lists (millions of options) stay instant.
+    Moving inside the window only repaints the previous and the new selected rows. \n
+    If `searchable`, typing filters the options with a fuzzy search (see `inputs.fuzzy`),
+    the best matches first; backspace widens it again. Its index is built while no key
+    is pressed. \n
+    Options can be lazy (a generator, a `sources.Source`): pages are loaded as the window
+    scrolls to them. Searching, or going to the end, loads them all.
     """
-    options: list[str]
+    options: sources.Source
     prompt: str
     selected_index: int
+    height: int
+    top: int
+    searchable: bool
+    query: str
 
     select_character: str
 
-    def __init__(self, options: list[str], prompt: str = "Select an option:") -> None:
-        self.options: list[str] = options
+    def __init__(
+        self,
+        options: Union[sources.Source, Sequence[str], Iterable[str]],
+        prompt: str = "Select an option:",
+        height: Optional[int] = None,
+        searchable: bool = True,
+    ) -> None:
+        self.options: sources.Source = sources.source(options)
         self.prompt: str = prompt
+        # Position in the shown (filtered) options.
         self.selected_index: int = 0
+        self.searchable: bool = searchable
+        self.query: str = ""
+        # Indexes of the shown options, and the search index (built on the first search).
+        self._shown: Sequence[int] = range(len(self.options))
+        self._index: Optional[fuzzy.FuzzyIndex] = None
 
         self.select_character: str = "> "
 
+        # Visible window: `height` options from `top`.
+        self.height: int = height if height is not None else self._fit_height()
+        self.top: int = 0
+        self._width: int = _terminal_size().columns
+        self._load(2 * self.height)
+
+    def _terminal_lines(self) -> int:
+        """
+        Return the lines of the terminal left to the window: without the prompt, the search line,
+        and the cursor's line.
+        """
+        return _terminal_size().lines - self.prompt.count("\n") - 2 - self.searchable
+
+    def _fit_height(self) -> int:
+        """
+        Return the window height fitting the terminal, under the prompt.
+        """
+        lines: int = self._terminal_lines()
+        if not self.options.exhausted:
+            self.options.ensure(lines)
+        return max(1, min(len(self.options), lines))
+
+    def _load(self, count: Optional[int]) -> None:
+        """
+        Load the options up to `count` (all if None); shown if not filtered.
+        """
+        if not self.options.exhausted:
+            self.options.ensure(count)
+        if not self.query:
+            self._shown = range(len(self.options))
+
+    def _prepare(self) -> bool:
+        """
+        Prepare the search a step further: the index, the rest of the shown results
+        (repainted), then the common characters' postings.
+        Return False when there is nothing left to prepare.
+        """
+        if not self.searchable:
+            return False
+        if self._index is None:
+            # Lazy sources are only loaded by a search.
+            if not self.options.exhausted:
+                return False
+            self._index = fuzzy.FuzzyIndex(self.options)
+            return True
+        if self.query and not self._index.complete:
+            self._index.prepare()
+            self._shown = self._index.results
+            if self._index.complete:
+                # Sorted by score: the best one first.
+                self.selected_index = 0
+                self.top = 0
+            self._repaint_search()
+            return True
+        return self._index.prepare()
+
     def _get_key(self) -> str:
         """
-        Get a single keypress from stdin
+        Get a single keypress from stdin, preparing the search while waiting for it.
         """
+        reader: keys.KeyReader = keys.default_reader()
+        while not reader.pending() and self._prepare():
+            pass
         return keys.get_key()
 
-    def _clear_menu(self, num_lines: int) -> None:
+    def _mark(self, option: int) -> str:
         """
-        Clear the menu from terminal
+        Return the text before an option (by its index in `options`).
         """
-        for _ in range(num_lines):
-            # Move up and clear line
-            sys.stdout.write('\x1b[1A\x1b[2K')  
-        sys.stdout.flush()
-    
+        return ""
+
+    def _row(self, index: int) -> str:
+        """
+        Return the line of an option, highlighted if selected, cut to the terminal width.
+        """
+        if index >= len(self._shown):
+            return ""
+        mark: str = self._mark(self._shown[index])
+        option: str = self.options[self._shown[index]][:max(0, self._width - len(self.select_character) - len(mark) - 1)]
+        if index == self.selected_index:
+            # Highlight selected option (style).
+            return f"{style.Color.CYAN}{style.Text.BOLD}{self.select_character}{mark}{option}{style.END}"
+        return f"{' ' * len(self.select_character)}{mark}{option}"
+
+    def _window(self) -> str:
+        """
+        Return the rows of the visible window, each erasing its line first.
+        """
+        return "".join(
+            f"\r\x1b[2K{self._row(index)}\n"
+            for index in range(self.top, self.top + self.height)
+        )
+
+    def _repaint_row(self, index: int) -> str:
+        """
+        Return the escapes repainting a single visible row, the cursor coming back under the menu.
+        """
+        if not self.top <= index < self.top + self.height:
+            return ""
+        up: int = self.height - (index - self.top)
+        return f"\x1b[{up}A\r\x1b[2K{self._row(index)}\x1b[{up}B\r"
+
+    def _search_line(self) -> str:
+        """
+        Return the search line: the query and the number of matches (`+` while still searching).
+        """
+        if not self.searchable:
+            return ""
+        partial: str = "+" if self.query and self._index is not None and not self._index.complete else ""
+        return f"\r\x1b[2K/ {self.query}{style.Text.BOLD} ({len(self._shown)}{partial}/{len(self.options)}){style.END}\n"
+
     def _draw_menu(self) -> None:
         """
         Draw the menu with current selection highlighted
         """
-        print(self.prompt)
-        for i, option in enumerate(self.options):
-            if i == self.selected_index:
-                # Highlight selected option (style).
-                style.printc(
-                    f"{self.select_character}{option}",
-                    style=style.Color.CYAN + style.Text.BOLD
-                ) 
-            else:
-                print(f"{' ' * len(self.select_character)}{option}")
-        # sys.stdout.flush()
-    
-    def show(self) -> str:
+        sys.stdout.write(f"{self.prompt}\n{self._search_line()}{self._window()}")
+        sys.stdout.flush()
+
+    def search(self, query: str) -> None:
         """
-        Display the menu and handle user input.
-        Call to display to user.
-        Return a string, the choosen index.
+        Filter the options, and repaint the search line and the window.
+        """
+        if self._index is None:
+            self._load(None)
+            self._index = fuzzy.FuzzyIndex(self.options)
+        self.query = query
+        if query:
+            self._shown = self._index.search(query)
+        else:
+            self._index.reset()
+            self._shown = range(len(self.options))
+        self.selected_index = 0
+        self.top = 0
+        self._repaint_search()
+
+    def _repaint_search(self) -> None:
         """
+        Repaint the search line and the window.
+        """
+        sys.stdout.write(f"\x1b[{self.height + 1}A{self._search_line()}{self._window()}")
+        sys.stdout.flush()
+
+    def select(self, index: int, wrap: bool = True) -> None:
+        """
+        Move the selection, repainting only what changed.
+        """
+        # Next pages, before wrapping around (to the real last option).
+        self._load(None if index < 0 and wrap else index + self.height + 1)
+        if not self._shown:
+            return
+        if wrap:
+            index %= len(self._shown)
+        else:
+            index = min(max(index, 0), len(self._shown) - 1)
+        previous: int = self.selected_index
+        if index == previous:
+            return
+        self.selected_index = index
+
+        if self.top <= index < self.top + self.height:
+            sys.stdout.write(self._repaint_row(previous) + self._repaint_row(index))
+            sys.stdout.flush()
+            return
+
+        # Scroll: the selection becomes the first or last visible row.
+        self.top = index if index < self.top else index - self.height + 1
+        self._load(self.top + 2 * self.height)
+        sys.stdout.write(f"\x1b[{self.height}A{self._window()}")
+        sys.stdout.flush()
+
+    def _handle(self, key: str) -> bool:
+        """
+        React to a key. Return True when the choice is done.
+        """
+        if key in UP:
+            self.select(self.selected_index - 1)
+        elif key in DOWN:
+            self.select(self.selected_index + 1)
+        elif key in PAGE_UP:
+            self.select(self.selected_index - self.height, wrap=False)
+        elif key in PAGE_DOWN:
+            self.select(self.selected_index + self.height, wrap=False)
+        elif key in HOME:
+            self.select(0, wrap=False)
+        elif key in END:
+            self._load(None)
+            self.select(len(self._shown) - 1, wrap=False)
+        elif key in ENTER:
+            return bool(self._shown)
+        elif key == '\x03':  # Ctrl+C
+            raise KeyboardInterrupt
+        elif self.searchable and key in BACKSPACE:
+            if self.query:
+                self.search(self.query[:-1])
+        elif self.searchable and len(key) == 1 and key.isprintable():
+            self.search(self.query + key)
+        return False
+
+    def _run(self) -> None:
+        """
+        Draw the menu and handle the keys until the choice is done.
+        """
+        self._width = _terminal_size().columns
+        self.top = max(0, min(self.selected_index - self.height // 2, len(self._shown) - self.height))
         try:
             # Hide cursor
             sys.stdout.write('\x1b[?25l')
 
-            self._draw_menu()
-            
-            while True:
-                key: str = self._get_key()
-                # Handle arrow keys
-                if plateform.OS == plateform.Os.UNIX:
-                    if key == '\x1b[A':  # Up arrow
-                        self.selected_index = (self.selected_index - 1) % len(self.options)
-                    elif key == '\x1b[B':  # Down arrow
-                        self.selected_index = (self.selected_index + 1) % len(self.options)
-                    elif key == '\r' or key == '\n':  # Enter
-                        break
-                    elif key == '\x03':  # Ctrl+C
-                        raise KeyboardInterrupt
-                elif plateform.OS == plateform.Os.WINDOWS:  
-                    if key == 'H':  # Up arrow
-                        self.selected_index = (self.selected_index - 1) % len(self.options)
-                    elif key == 'P':  # Down arrow
-                        self.selected_index = (self.selected_index + 1) % len(self.options)
-                    elif key == '\r':  # Enter
-                        break
-                    elif key == '\x03':  # Ctrl+C
-                        raise KeyboardInterrupt(f"{style.Color.YELLOW}(!) - Keyboard Interrupt. {style.END}")
-                else:
-                    raise OSError(f"(X) - SelectMenu.show - Unsupported OS ({plateform.OS}).")            
-
-
-                # Clear and redraw menu
-                self._clear_menu(len(self.options) + 1)
+            # Raw mode for the whole menu, not once per key.
+            with keys.default_reader():
                 self._draw_menu()
+                while not self._handle(self._get_key()):
+                    pass
         except KeyboardInterrupt:
             raise KeyboardInterrupt(f"{style.Color.YELLOW}(!) - Keyboard Interrupt. {style.END}")
         finally:
             # Show cursor again
             sys.stdout.write('\x1b[?25h')
             sys.stdout.flush()
-        
-        return self.options[self.selected_index]
+
+    def show(self) -> str:
+        """
+        Display the menu and handle user input.
+        Call to display to user.
+        Return a string, the choosen index.
+        """
+        self._run()
+        return self.options[self._shown[self.selected_index]]
+
+
+class MultiSelectMenu(SelectMenu):
+    """
+    Select many options: space toggles the highlighted one, enter validates. \n
+    The choices are a bitset (an int, bit i for option i), so toggling and counting
+    stay cheap whatever the number of options.
+    """
+    chosen: int
+    marks: tuple[str, str]
+
+    def __init__(
+        self,
+        options: Union[sources.Source, Sequence[str], Iterable[str]],
+        prompt: str = "Select options (space to toggle):",
+        height: Optional[int] = None,
+        searchable: bool = True,
+    ) -> None:
+        self.chosen: int = 0
+        self.marks: tuple[str, str] = ("[ ] ", "[x] ")
+        super().__init__(options, prompt, height, searchable)
+
+    def _mark(self, option: int) -> str:
+        return self.marks[self.chosen >> option & 1]
+
+    def toggle(self, option: int) -> None:
+        """
+        Choose, or un-choose, an option (by its index in `options`).
+        """
+        self.chosen ^= 1 << option
+
+    def _handle(self, key: str) -> bool:
+        if key == " " and self._shown:
+            self.toggle(self._shown[self.selected_index])
+            sys.stdout.write(self._repaint_row(self.selected_index))
+            sys.stdout.flush()
+            return False
+        return super()._handle(key)
+
+    def indexes(self) -> list[int]:
+        """
+        Return the indexes of the chosen options, in order.
+        """
+        return fuzzy.bit_indexes(self.chosen)
+
+    def show(self) -> list[str]:  # pyright: ignore[reportIncompatibleMethodOverride]
+        """
+        Display the menu and handle user input.
+        Return the chosen options, in order.
+        """
+        self._run()
+        return [self.options[index] for index in self.indexes()]
 
 
 def main() -> None:
@@ -120,4 +391,4 @@ def main() -> None:
         prompt="Main CLI test: "
     )
     sel = menu.show()
-    print(sel)
\ No newline at end of file
+    print(sel)
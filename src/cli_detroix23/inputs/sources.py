@@ -0,0 +1,170 @@
+"""
+CLI - Inputs
+sources.py
+Lazy option sources for the select menus: options are fetched page by page, when shown.
+"""
+import os
+import itertools
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, Optional, Sequence, Union
+
+if TYPE_CHECKING:
+    # Only the connection's methods are used: no import cost for menus without SQLite.
+    import sqlite3
+
+
+class Source:
+    """
+    Options loaded on demand, by pages of `page_size`. \n
+    `len` is the number of options loaded so far; `exhausted` tells if there are no more.
+    Indexing past the loaded options loads them.
+    """
+    page_size: int
+    _items: list[str]
+    _exhausted: bool
+
+    def __init__(self, page_size: int = 100) -> None:
+        self.page_size: int = page_size
+        self._items = list()
+        self._exhausted = False
+
+    def _fetch(self) -> Sequence[str]:
+        """
+        Return the next page of options; a page shorter than `page_size` is the last one.
+        """
+        raise NotImplementedError("(X) - Source._fetch: must be implemented.")
+
+    @property
+    def exhausted(self) -> bool:
+        return self._exhausted
+
+    def ensure(self, count: Optional[int] = None) -> None:
+        """
+        Load pages until `count` options are loaded (every option if None), or no more exists.
+        """
+        while not self._exhausted and (count is None or len(self._items) < count):
+            page: Sequence[str] = self._fetch()
+            self._items.extend(page)
+            if len(page) < self.page_size:
+                self._exhausted = True
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, index: int) -> str:
+        if index >= len(self._items):
+            self.ensure(index + 1)
+        return self._items[index]
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Iterate every option, loading them.
+        """
+        index: int = 0
+        while index < len(self._items) or not self._exhausted:
+            if index >= len(self._items):
+                self.ensure(index + 1)
+                if index >= len(self._items):
+                    return
+            yield self._items[index]
+            index += 1
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(loaded: int = {len(self._items)}, exhausted: bool = {self._exhausted})"
+
+
+class ListSource(Source):
+    """
+    Already loaded options, without copy.
+    """
+    options: Sequence[str]
+
+    def __init__(self, options: Sequence[str]) -> None:
+        super().__init__(max(1, len(options)))
+        self.options: Sequence[str] = options
+        self._exhausted = True
+
+    def __len__(self) -> int:
+        return len(self.options)
+
+    def __getitem__(self, index: int) -> str:
+        return self.options[index]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.options)
+
+
+class IterableSource(Source):
+    """
+    Options pulled from an iterable (a generator...), one page at a time.
+    """
+    _iterator: Iterator[str]
+
+    def __init__(self, iterable: Iterable[str], page_size: int = 100) -> None:
+        super().__init__(page_size)
+        self._iterator = iter(iterable)
+
+    def _fetch(self) -> Sequence[str]:
+        return list(itertools.islice(self._iterator, self.page_size))
+
+
+class PagedSource(Source):
+    """
+    Options returned by a paging function: `fetch(offset, limit)` returns at most `limit` options.
+    ```python
+        PagedSource(lambda offset, limit: api.users(skip=offset, take=limit))
+    ```
+    """
+    fetch: Callable[[int, int], Sequence[str]]
+
+    def __init__(self, fetch: Callable[[int, int], Sequence[str]], page_size: int = 100) -> None:
+        super().__init__(page_size)
+        self.fetch: Callable[[int, int], Sequence[str]] = fetch
+
+    def _fetch(self) -> Sequence[str]:
+        return self.fetch(len(self._items), self.page_size)
+
+
+class DirectorySource(IterableSource):
+    """
+    Entries of a directory, listed as they are read (`os.scandir`). Directories end with `/`.
+    """
+    path: str
+
+    def __init__(self, path: str = ".", page_size: int = 100) -> None:
+        self.path: str = path
+        super().__init__(self._entries(), page_size)
+
+    def _entries(self) -> Iterator[str]:
+        with os.scandir(self.path) as entries:
+            for entry in entries:
+                try:
+                    directory: bool = entry.is_dir()
+                except OSError:
+                    directory = False
+                yield entry.name + "/" if directory else entry.name
+
+
+def source(options: Union[Source, Sequence[str], Iterable[str]], page_size: int = 100) -> Source:
+    """
+    Return the options as a source: sequences are used as is, other iterables are loaded lazily.
+    """
+    if isinstance(options, Source):
+        return options
+    if isinstance(options, Sequence):
+        return ListSource(options)
+    return IterableSource(options, page_size)
+
+
+def sqlite_source(connection: 'sqlite3.Connection', query: str, page_size: int = 100) -> PagedSource:
+    """
+    Return the first column of a SQLite query's rows, fetched page by page (`LIMIT`/`OFFSET`).
+    """
+    def fetch(offset: int, limit: int) -> list[str]:
+        rows = connection.execute(f"SELECT * FROM ({query}) LIMIT ? OFFSET ?", (limit, offset))
+        return [str(row[0]) for row in rows]
+
+    return PagedSource(fetch, page_size)
+
+
+if __name__ == "__main__":
+    print("cf. Exemples.")
@@ -6,7 +6,7 @@ Basic maths stuff.
 import os
 import math
 
-import compatibility.types as types
+from ..compatibility import types
 
 table2D = types.table2D
 
@@ -3,7 +3,7 @@ Terminal - MATHS
 transformations.py
 """
 
-import maths.maths as base
+from . import maths as base
 
 
 def simple_cos(a: int) -> int:
@@ -3,8 +3,8 @@ CLI - Shapes
 base.py
 Draw basic shapes. Uses the screen script.
 """
-import maths.maths as maths
-import animations.screen as screen
+from ..maths import maths
+from ..animations import screen
 
 class DrawError(Exception):
     """
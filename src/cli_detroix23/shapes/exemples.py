@@ -2,10 +2,13 @@
 CLI - Shapes
 exemples.py
 """
-import maths.maths as maths
-import animations.screen as screen
-import shapes.base as base
-import shapes.sprites as sprites
+from typing import Optional
+
+from ..maths import maths
+from ..animations import screen
+from ..inputs import mouse
+from . import base
+from . import sprites
 
 # Exemples
 class Exemple1(screen.Screen):
@@ -23,12 +26,18 @@ class Exemple1(screen.Screen):
         self.hrect1 = base.RectangleHollow(self, maths.Vector2D(7, 8), maths.Size(9, 6), "@", 2, True)
         self.ell1 = base.Ellipse(self, maths.Vector2D(10, 10), maths.Size(8, 8), "$", True)
         self.sprt1 = sprites.Sprite(self, maths.Vector2D(20, 20), maths.Size(10, 10), sprites.Exemples.Human)
+        self.clicked: Optional[base.Shape] = None
 
     def drawer(self) -> None:
-        self.write_table(self.rect1.draw(), self.rect1.position)
-        self.write_table(self.hrect1.draw(), self.hrect1.position)
-        self.write_table(self.ell1.draw(), self.ell1.position)
-        self.write_table(self.sprt1.draw(), self.sprt1.position)
+        for shape in (self.rect1, self.hrect1, self.ell1, self.sprt1):
+            self.write_table(shape.draw(), shape.position)
+            self.hit_map.add_shape(shape, shape.position, shape.size)
+        if self.clicked is not None:
+            self.write(f"Clicked: {type(self.clicked).__name__}", maths.Vector2D(0, 0))
+
+    def on_mouse(self, event: mouse.MouseEvent) -> None:
+        if event.action == mouse.Action.CLICK:
+            self.clicked = self.hit_map.hit(event)
 
     def updater(self) -> None:
         self.hrect1.shift(maths.Vector2D(0, 1))
@@ -47,7 +56,7 @@ For the sprite!
         frame_delay=1
     )
 
-    ex1.run(Exemple1.updater, Exemple1.drawer)
+    ex1.run(Exemple1.updater, Exemple1.drawer, on_mouse=Exemple1.on_mouse)
 
 if __name__ == "__main__":
     run_exemple1()
\ No newline at end of file
@@ -2,10 +2,10 @@
 CLI - Shapes
 sprites.py
 """
-import maths.maths as maths
-import maths.transformations as transformations
-import animations.screen as screen
-import shapes.base as base
+from ..maths import maths
+from ..maths import transformations
+from ..animations import screen
+from . import base
 
 class Sprite(base.Shape):
     sprite: maths.table2D
@@ -43,13 +43,34 @@ def create_sprite(drawing: str) -> maths.table2D:
     return table
 
 
+class LazySprite:
+    """
+    Sprite of a class, created (`create_sprite`) on first access instead of at class definition.
+    The created table then replaces the descriptor on the class.
+    """
+    drawing: str
+    name: str
+
+    def __init__(self, drawing: str) -> None:
+        self.drawing: str = drawing
+        self.name: str = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: object, owner: type) -> maths.table2D:
+        table: maths.table2D = create_sprite(self.drawing)
+        setattr(owner, self.name, table)
+        return table
+
+
 class Exemples:
-    Human: maths.table2D = create_sprite(r"""
+    Human = LazySprite(r"""
   @
 /###\
  | |
 """)
-    Block1: maths.table2D = create_sprite(r"""
+    Block1 = LazySprite(r"""
 @#
 $O
 """)
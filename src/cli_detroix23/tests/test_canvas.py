@@ -0,0 +1,77 @@
+"""
+CLI - Tests
+test_canvas.py
+"""
+import unittest
+
+from ..animations.canvas import Canvas, Mode
+from ..maths import maths
+
+
+class TestBraille(unittest.TestCase):
+    """
+    Braille cells: 2x4 pixels, each one bit of the `U+2800` block.
+    """
+    def setUp(self) -> None:
+        self.canvas: Canvas = Canvas(maths.Size(2, 1), Mode.BRAILLE)
+
+    def test_size(self) -> None:
+        self.assertEqual((self.canvas.size.x, self.canvas.size.y), (4, 4))
+        self.assertEqual(len(self.canvas.pixels), 2)
+
+    def test_bits(self) -> None:
+        # Dots 1 to 8 of a braille cell, by (x, y).
+        dots: list[tuple[int, int, int]] = [
+            (0, 0, 0x01), (0, 1, 0x02), (0, 2, 0x04), (1, 0, 0x08),
+            (1, 1, 0x10), (1, 2, 0x20), (0, 3, 0x40), (1, 3, 0x80),
+        ]
+        for x, y, bit in dots:
+            self.canvas.clear()
+            self.canvas.set(x, y)
+            self.assertEqual(self.canvas.pixels[0], bit, (x, y))
+            self.assertEqual(self.canvas.rows(), [[chr(0x2800 + bit), ""]])
+
+    def test_second_cell(self) -> None:
+        self.canvas.set(3, 3)
+        self.assertEqual(list(self.canvas.pixels), [0, 0x80])
+        self.assertTrue(self.canvas.get(3, 3))
+        self.assertFalse(self.canvas.get(2, 3))
+
+    def test_set_off(self) -> None:
+        self.canvas.set(0, 0)
+        self.canvas.set(1, 0)
+        self.canvas.set(0, 0, False)
+        self.assertEqual(self.canvas.pixels[0], 0x08)
+
+    def test_outside(self) -> None:
+        for x, y in ((-1, 0), (4, 0), (0, -1), (0, 4)):
+            self.canvas.set(x, y)
+            self.assertFalse(self.canvas.get(x, y))
+        self.assertEqual(list(self.canvas.pixels), [0, 0])
+
+
+class TestHalfBlock(unittest.TestCase):
+    def test_rows(self) -> None:
+        canvas: Canvas = Canvas(maths.Size(3, 1), Mode.HALF_BLOCK)
+        canvas.set(0, 0)
+        canvas.set(1, 1)
+        canvas.set(2, 0)
+        canvas.set(2, 1)
+        self.assertEqual(canvas.rows(), [["▀", "▄", "█"]])
+
+    def test_styles(self) -> None:
+        canvas: Canvas = Canvas(maths.Size(2, 1), Mode.HALF_BLOCK, "\x1b[31m")
+        canvas.set(0, 0)
+        self.assertEqual(canvas.rows(), [["\x1b[31m▀\x1b[0m", ""]])
+
+
+class TestLine(unittest.TestCase):
+    def test_diagonal(self) -> None:
+        canvas: Canvas = Canvas(maths.Size(2, 1), Mode.BRAILLE)
+        canvas.line(maths.Vector2D(0, 0), maths.Vector2D(3, 3))
+        lit: list[tuple[int, int]] = [(x, y) for y in range(4) for x in range(4) if canvas.get(x, y)]
+        self.assertEqual(lit, [(0, 0), (1, 1), (2, 2), (3, 3)])
+
+
+if __name__ == "__main__":
+    unittest.main()
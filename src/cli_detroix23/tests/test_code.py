@@ -0,0 +1,53 @@
+"""
+CLI - Tests
+test_code.py
+"""
+import pickle
+import unittest
+
+from ..base.code import Code, code_from_id, fuse_ids
+
+
+class TestCode(unittest.TestCase):
+    def test_interned(self) -> None:
+        code: Code = Code("\x1b[1;31m")
+        self.assertIs(Code("\x1b[1;31m"), code)
+        self.assertIs(Code("\x1b[1m\x1b[31m"), code)
+        self.assertIs(Code(codes=[1, 31]), code)
+        self.assertIsNot(Code("\x1b[31;1m"), code)
+        self.assertEqual(code.codes, (1, 31))
+        self.assertEqual(code.string, "\x1b[1;31m")
+        self.assertEqual(code.encoded, b"\x1b[1;31m")
+
+    def test_ids(self) -> None:
+        code: Code = Code("\x1b[4m")
+        self.assertIs(code_from_id(code.id), code)
+        self.assertNotEqual(Code("\x1b[5m").id, code.id)
+
+    def test_fuse(self) -> None:
+        bold: Code = Code("\x1b[1m")
+        red: Code = Code("\x1b[31m")
+        fused: Code = bold.fuse(red)
+        self.assertEqual(fused.codes, (1, 31))
+        self.assertIs(fused, Code("\x1b[1;31m"))
+        self.assertIs(bold + red, fused)
+        self.assertIs(bold.fuse(red), fused)
+        self.assertEqual(fuse_ids(bold.id, red.id), fused.id)
+        self.assertEqual(red.fuse(bold).codes, (31, 1))
+
+    def test_add_string(self) -> None:
+        self.assertEqual(Code("\x1b[1m") + "text", "\x1b[1mtext")
+        with self.assertRaises(ValueError):
+            Code("\x1b[1m") + 1  # pyright: ignore
+
+    def test_immutable(self) -> None:
+        with self.assertRaises(AttributeError):
+            Code("\x1b[1m").string = ""  # pyright: ignore
+
+    def test_pickle(self) -> None:
+        code: Code = Code("\x1b[2;33m")
+        self.assertIs(pickle.loads(pickle.dumps(code)), code)
+
+
+if __name__ == "__main__":
+    unittest.main()
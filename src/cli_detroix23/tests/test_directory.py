@@ -0,0 +1,110 @@
+"""
+CLI - Tests
+test_directory.py
+"""
+import os
+import tempfile
+import unittest
+
+from ..inputs import directory
+
+
+class TestListing(unittest.TestCase):
+    path: str
+
+    def setUp(self) -> None:
+        self.path = self.enterContext(tempfile.TemporaryDirectory())
+        for name in ("b.txt", "A.txt", "c.txt", ".hidden", "a2.txt"):
+            open(os.path.join(self.path, name), "w").close()
+        for name in ("Zdir", "adir"):
+            os.mkdir(os.path.join(self.path, name))
+
+    def listing(self, **kwargs) -> directory.Listing:
+        listing: directory.Listing = directory.Listing(self.path, **kwargs)
+        self.addCleanup(listing.close)
+        return listing
+
+    def test_order(self) -> None:
+        # Directories first, then case insensitive names.
+        listing: directory.Listing = self.listing()
+        self.assertEqual(
+            list(listing),
+            ["adir/", "Zdir/", ".hidden", "A.txt", "a2.txt", "b.txt", "c.txt"],
+        )
+        self.assertTrue(listing.exhausted)
+        self.assertFalse(listing.truncated)
+
+    def test_merge(self) -> None:
+        # Batches read between accesses are merged in order.
+        listing: directory.Listing = self.listing(page_size=2)
+        listing.stream()
+        self.assertEqual(len(listing), 2)
+        first: list[str] = [listing[0], listing[1]]
+        self.assertEqual(first, sorted(first, key=directory._key))
+        listing.stream()
+        listing.stream()
+        self.assertEqual(len(listing), 6)
+        listing.ensure()
+        self.assertEqual(
+            [listing[index] for index in range(len(listing))],
+            ["adir/", "Zdir/", ".hidden", "A.txt", "a2.txt", "b.txt", "c.txt"],
+        )
+
+    def test_index(self) -> None:
+        listing: directory.Listing = self.listing()
+        listing.ensure()
+        self.assertEqual(listing.index("Zdir/"), 1)
+        self.assertEqual(listing.index("b.txt"), 5)
+        # Missing: where it would be.
+        self.assertEqual(listing.index("B.tx"), 5)
+
+    def test_hidden(self) -> None:
+        listing: directory.Listing = self.listing(hidden=False)
+        self.assertNotIn(".hidden", list(listing))
+        self.assertEqual(len(listing), 6)
+
+    def test_max_entries(self) -> None:
+        listing: directory.Listing = self.listing(page_size=2, max_entries=3)
+        listing.ensure()
+        self.assertEqual(len(listing), 3)
+        self.assertTrue(listing.exhausted)
+        self.assertTrue(listing.truncated)
+        # Still sorted.
+        self.assertEqual(list(listing), sorted(listing, key=directory._key))
+
+    def test_max_entries_exact(self) -> None:
+        # As many entries as the bound: nothing is cut.
+        for page_size in (2, 7, 100):
+            with self.subTest(page_size=page_size):
+                listing: directory.Listing = self.listing(page_size=page_size, max_entries=7)
+                listing.ensure()
+                self.assertEqual(len(listing), 7)
+                self.assertFalse(listing.truncated)
+                # Hidden entries aren't counted.
+                listing = self.listing(page_size=page_size, max_entries=6, hidden=False)
+                listing.ensure()
+                self.assertEqual(len(listing), 6)
+                self.assertFalse(listing.truncated)
+
+
+class TestStatCache(unittest.TestCase):
+    def test_bounded(self) -> None:
+        path: str = self.enterContext(tempfile.TemporaryDirectory())
+        stats: directory.StatCache = directory.StatCache(2)
+        for name in ("a", "b", "c"):
+            open(os.path.join(path, name), "w").close()
+            self.assertIsNotNone(stats.get(os.path.join(path, name)))
+        self.assertEqual(len(stats), 2)
+        self.assertIsNone(stats.get(os.path.join(path, "missing")))
+
+
+class TestHumanSize(unittest.TestCase):
+    def test_sizes(self) -> None:
+        self.assertEqual(
+            [directory.human_size(size) for size in (12, 4096, 15_000, 512 * 1024 ** 2)],
+            ["  12B", " 4.0K", "  15K", " 512M"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
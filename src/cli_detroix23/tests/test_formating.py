@@ -0,0 +1,71 @@
+"""
+CLI - Tests
+test_formating.py
+"""
+import unittest
+from typing import Iterator
+
+from ..base.formating import ELLIPSIS, fit, table_lines
+from ..base import ansi
+
+
+class TestFit(unittest.TestCase):
+    def test_padding(self) -> None:
+        self.assertEqual(fit("abc", 5), "abc  ")
+        self.assertEqual(fit("abc", 5, ">"), "  abc")
+        self.assertEqual(fit("abc", 6, "^"), " abc  ")
+        self.assertEqual(fit("abc", 3), "abc")
+
+    def test_cut(self) -> None:
+        self.assertEqual(fit("abcdef", 4), f"abc{ELLIPSIS}")
+        self.assertEqual(fit("ab", 1), ELLIPSIS)
+        self.assertEqual(fit("x", 0), "")
+
+    def test_escapes(self) -> None:
+        self.assertEqual(fit("\x1b[31mab\x1b[0m", 4, ">"), "  \x1b[31mab\x1b[0m")
+        cut: str = fit("\x1b[31mabcdef\x1b[0m", 4)
+        self.assertEqual(ansi.strip_ansi(cut), f"abc{ELLIPSIS}")
+        self.assertTrue(cut.startswith("\x1b[31mabc"))
+        self.assertEqual(ansi.visible_len(cut), 4)
+
+
+class TestTableLines(unittest.TestCase):
+    def test_border(self) -> None:
+        self.assertEqual(list(table_lines([(1, "a")])), ["┌───┬───┐", "│ 1 │ a │", "└───┴───┘"])
+
+    def test_header_and_sample(self) -> None:
+        # Widths from the header and the first 2 rows: the third row's first cell is cut.
+        lines: list[str] = list(table_lines(
+            [(1, "a"), (22, "bbbb"), (333, "c")], header=("n", "s"), border=None, sample=2,
+        ))
+        self.assertEqual(lines, ["n   s   ", "1   a   ", "22  bbbb", f"3{ELLIPSIS}  c   "])
+
+    def test_sample_none(self) -> None:
+        lines: list[str] = list(table_lines([(1, "a"), (22, "b"), (333, "c")], border=None, sample=None))
+        self.assertEqual(lines, ["1    a", "22   b", "333  c"])
+
+    def test_sample_invalid(self) -> None:
+        with self.assertRaises(ValueError):
+            list(table_lines([(1,)], sample=0))
+
+    def test_missing_cells_and_short_align(self) -> None:
+        # Missing alignments are `<`.
+        self.assertEqual(list(table_lines([(1, "a"), (22,)], border=None, align=(">",))), [" 1  a", "22   "])
+
+    def test_extra_cells(self) -> None:
+        lines: list[str] = list(table_lines([(1, "a"), (2, "b", "extra")], border=None, sample=1))
+        self.assertEqual(lines, ["1  a", "2  b"])
+
+    def test_max_width(self) -> None:
+        self.assertEqual(list(table_lines([(1, "abcdef")], border=None, max_width=3)), [f"1  ab{ELLIPSIS}"])
+
+    def test_lazy(self) -> None:
+        def rows() -> Iterator[tuple[int, str]]:
+            yield (1, "a")
+            raise RuntimeError("read too far")
+        lines: Iterator[str] = table_lines(rows(), border=None, sample=1)
+        self.assertEqual(next(lines), "1  a")
+
+
+if __name__ == "__main__":
+    unittest.main()
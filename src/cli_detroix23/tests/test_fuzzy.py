@@ -0,0 +1,102 @@
+"""
+CLI - Tests
+test_fuzzy.py
+"""
+import random
+import unittest
+
+from ..inputs.fuzzy import VERIFY_CHUNK, FuzzyIndex, bit_indexes, pattern
+
+
+def matching(options: list[str], query: str) -> set[int]:
+    """
+    Return the indexes of the options containing the query's characters in order.
+    """
+    return {index for index, option in enumerate(options) if pattern(query.casefold()).match(option.casefold())}
+
+
+class TestBitIndexes(unittest.TestCase):
+    def test_bit_indexes(self) -> None:
+        self.assertEqual(bit_indexes(0), [])
+        self.assertEqual(bit_indexes(0b1), [0])
+        self.assertEqual(bit_indexes(0b101100), [2, 3, 5])
+
+
+class TestFuzzyIndex(unittest.TestCase):
+    """
+    `FuzzyIndex.search`: same results as a plain subsequence check, while typing or deleting.
+    """
+    options: list[str] = ["alpha", "Beta", "gamma", "delta", "Alphabet", "zeta", "lambda"]
+
+    def test_empty_query(self) -> None:
+        index: FuzzyIndex = FuzzyIndex(self.options)
+        self.assertEqual(index.search(""), list(range(len(self.options))))
+
+    def test_narrowing(self) -> None:
+        index: FuzzyIndex = FuzzyIndex(self.options)
+        for query in ("a", "al", "alp", "alph", "alphb"):
+            self.assertEqual(set(index.search(query)), matching(self.options, query), query)
+        self.assertEqual(index.search("alphb"), [4])
+
+    def test_case_insensitive(self) -> None:
+        index: FuzzyIndex = FuzzyIndex(self.options)
+        self.assertEqual(set(index.search("BET")), {1, 4})
+
+    def test_best_first(self) -> None:
+        index: FuzzyIndex = FuzzyIndex(self.options)
+        self.assertEqual(index.search("alpha")[0], 0)
+
+    def test_backspace(self) -> None:
+        index: FuzzyIndex = FuzzyIndex(self.options)
+        index.search("alp")
+        self.assertEqual(index.search("al"), FuzzyIndex(self.options).search("al"))
+        self.assertEqual(index.search("ze"), FuzzyIndex(self.options).search("ze"))
+        self.assertEqual(index.search(""), list(range(len(self.options))))
+
+    def test_no_match(self) -> None:
+        index: FuzzyIndex = FuzzyIndex(self.options)
+        self.assertEqual(index.search("q"), [])
+        self.assertEqual(index.search("qa"), [])
+
+    def test_random(self) -> None:
+        # Enough options for postings to be built, and for unsorted results (over `score_limit`).
+        generator: random.Random = random.Random(23)
+        options: list[str] = ["".join(generator.choices("abcdeAB_ ", k=8)) for _ in range(3000)]
+        index: FuzzyIndex = FuzzyIndex(options, score_limit=100)
+        prepared: FuzzyIndex = FuzzyIndex(options, score_limit=100)
+        while prepared.prepare():
+            pass
+        for _ in range(50):
+            query: str = "".join(generator.choices("abcde_", k=generator.randint(0, 5)))
+            expected: set[int] = matching(options, query)
+            self.assertEqual(set(index.search(query)), expected, query)
+            self.assertEqual(set(prepared.search(query)), expected, query)
+
+    def test_partial(self) -> None:
+        # Without time budget, a search or a `prepare` checks a single chunk.
+        options: list[str] = [f"{'ab' if index % 3 else 'ba'}/{index}" for index in range(3 * VERIFY_CHUNK)]
+        index: FuzzyIndex = FuzzyIndex(options, score_limit=0, verify_budget=0.0)
+        results: list[int] = index.search("ab")
+        self.assertFalse(index.complete)
+        self.assertEqual(results, [option for option in range(VERIFY_CHUNK) if option % 3])
+        # Narrowed from the partial results and the unchecked candidates.
+        index.search("ab/1")
+        self.assertFalse(index.complete)
+        while index.prepare() and not index.complete:
+            pass
+        self.assertEqual(set(index.results), matching(options, "ab/1"))
+        # Back to the partial query: completed by the next searches.
+        index.search("ab")
+        while not index.complete:
+            index.search("ab")
+        self.assertEqual(index.results, sorted(matching(options, "ab")))
+
+    def test_reset(self) -> None:
+        index: FuzzyIndex = FuzzyIndex(self.options)
+        index.search("alp")
+        index.reset()
+        self.assertEqual(set(index.search("ta")), matching(self.options, "ta"))
+
+
+if __name__ == "__main__":
+    unittest.main()
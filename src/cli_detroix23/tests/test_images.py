@@ -0,0 +1,46 @@
+"""
+CLI - Tests
+test_images.py
+"""
+import os
+import tempfile
+import unittest
+
+from ..animations import images
+from ..base import colors
+
+
+class TestFrameStream(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory: tempfile.TemporaryDirectory[str] = tempfile.TemporaryDirectory()
+        self.paths: list[str] = list()
+        for index in range(2):
+            path: str = os.path.join(self.directory.name, f"frames{index}.rgb")
+            with open(path, "wb") as file:
+                # Two frames of 4x2 pixels.
+                file.write(bytes(range(index, index + 24)) * 2)
+            self.paths.append(path)
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_frames(self) -> None:
+        with images.FrameStream(self.paths[0], 4, 2) as stream:
+            self.assertEqual(len(stream), 2)
+            self.assertEqual(bytes(stream[1].data), bytes(range(24)))
+            self.assertEqual(stream[1].source, f"{self.paths[0]}#1")
+            self.assertRaises(IndexError, stream.__getitem__, 2)
+
+    def test_close_keeps_other_streams_cached(self) -> None:
+        first: images.FrameStream = images.FrameStream(self.paths[0], 4, 2)
+        second: images.FrameStream = images.FrameStream(self.paths[1], 4, 2)
+        images.render(first[0], 4, 1, colors.Depth.TRUECOLOR)
+        table: list[list[str]] = images.render(second[0], 4, 1, colors.Depth.TRUECOLOR)
+        # Rendered frames don't keep the memory map exported: it closes.
+        first.close()
+        self.assertIs(images.render(second[0], 4, 1, colors.Depth.TRUECOLOR), table)
+        second.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+"""
+CLI - Tests
+test_inputs.py
+"""
+import unittest
+
+from ..inputs.inputs import Validator, symbol_mode, symbol_bool
+
+
+class TestValidator(unittest.TestCase):
+    def test_aliases(self) -> None:
+        validator: Validator = Validator(symbol_mode)
+        self.assertEqual(validator.get("encode"), "1")
+        self.assertEqual(validator.get(" dec \n"), "2")
+        self.assertIsNone(validator.get("enco"))
+        self.assertIn("de", validator)
+        self.assertNotIn("3", validator)
+
+    def test_list(self) -> None:
+        validator: Validator = Validator(["x", "y"])
+        self.assertEqual(validator.symbols, ("x", "y"))
+        self.assertEqual(validator.get("y"), "y")
+
+    def test_casefold(self) -> None:
+        self.assertIsNone(Validator(symbol_bool).get("yEs"))
+        self.assertEqual(Validator(symbol_bool, casefold=True).get("yEs"), "1")
+
+    def test_prefix(self) -> None:
+        validator: Validator = Validator(symbol_mode, prefix=True)
+        self.assertEqual(validator.get("enco"), "1")
+        self.assertEqual(validator.get("e"), "1")
+        self.assertEqual(validator.get("d"), "2")
+        self.assertIsNone(validator.get("x"))
+        self.assertIsNone(validator.get(""))
+
+    def test_prefix_ambiguous(self) -> None:
+        validator: Validator = Validator({"a": ["start"], "b": ["stop"]}, prefix=True)
+        self.assertIsNone(validator.get("st"))
+        self.assertEqual(validator.get("sta"), "a")
+        self.assertEqual(validator.get("sto"), "b")
+
+    def test_conflict(self) -> None:
+        with self.assertRaises(ValueError):
+            Validator({"a": ["x"], "b": ["x"]})
+        with self.assertRaises(ValueError):
+            Validator({"a": ["X"], "b": ["x"]}, casefold=True)
+        # Repeated aliases of one symbol are fine.
+        Validator({"a": ["x", "x"]})
+
+    def test_aliases_frozen(self) -> None:
+        validator: Validator = Validator(symbol_mode)
+        with self.assertRaises(TypeError):
+            validator.aliases["3"] = "3"  # pyright: ignore
+
+    def test_validate_stream(self) -> None:
+        validator: Validator = Validator(symbol_mode, casefold=True, prefix=True)
+        self.assertEqual(list(validator.validate_stream(["ENC\n", "2\n", "x\n", "deco\n"])), ["1", "2", None, "2"])
+        self.assertEqual(list(Validator(symbol_mode).validate_stream(["enc", "enco"])), ["1", None])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+"""
+CLI - Tests
+test_keys.py
+"""
+import os
+import tempfile
+import unittest
+
+from ..inputs.keys import KeyReader, split_key
+
+
+class TestSplitKey(unittest.TestCase):
+    """
+    `split_key`: length of the first complete key of a buffer, 0 while incomplete.
+    """
+    def test_empty(self) -> None:
+        self.assertEqual(split_key(b""), 0)
+
+    def test_characters(self) -> None:
+        self.assertEqual(split_key(b"ab"), 1)
+        self.assertEqual(split_key("é".encode()), 2)
+        self.assertEqual(split_key("€x".encode()), 3)
+
+    def test_incomplete_character(self) -> None:
+        self.assertEqual(split_key("é".encode()[:1]), 0)
+        self.assertEqual(split_key("€".encode()[:2]), 0)
+
+    def test_csi(self) -> None:
+        self.assertEqual(split_key(b"\x1b[A"), 3)
+        self.assertEqual(split_key(b"\x1b[5~"), 4)
+        # Parameters, then a following key.
+        self.assertEqual(split_key(b"\x1b[1;5Cx"), 6)
+        self.assertEqual(split_key(b"\x1b[<0;3;4M"), 9)
+
+    def test_incomplete_escape(self) -> None:
+        self.assertEqual(split_key(b"\x1b"), 0)
+        self.assertEqual(split_key(b"\x1b["), 0)
+        self.assertEqual(split_key(b"\x1b[1;5"), 0)
+        self.assertEqual(split_key(b"\x1bO"), 0)
+
+    def test_ss3(self) -> None:
+        self.assertEqual(split_key(b"\x1bOP"), 3)
+
+    def test_x10_mouse(self) -> None:
+        self.assertEqual(split_key(b"\x1b[M !"), 0)
+        self.assertEqual(split_key(b"\x1b[M !!x"), 6)
+
+    def test_double_escape(self) -> None:
+        self.assertEqual(split_key(b"\x1b\x1b[A"), 1)
+
+    def test_alt(self) -> None:
+        self.assertEqual(split_key(b"\x1bx"), 2)
+        self.assertEqual(split_key(b"\x1b\xc3"), 0)
+        self.assertEqual(split_key("\x1bé".encode()), 3)
+
+    def test_bytearray(self) -> None:
+        self.assertEqual(split_key(bytearray(b"\x1b[Bq")), 3)
+
+
+class TestKeyReaderFile(unittest.TestCase):
+    """
+    `KeyReader` on a regular file (stdin redirected from a file): read as is, never waited for.
+    """
+    def reader(self, data: bytes) -> KeyReader:
+        file = tempfile.TemporaryFile()
+        self.addCleanup(file.close)
+        file.write(data)
+        file.seek(0)
+        reader: KeyReader = KeyReader(file.fileno(), allow_keyboard_interrupt=False)
+        self.enterContext(reader)
+        return reader
+
+    def test_read(self) -> None:
+        reader: KeyReader = self.reader("a\x1b[Bé\x1bOP".encode())
+        self.assertTrue(reader.pending())
+        self.assertEqual(list(reader), ["a", "\x1b[B", "é", "\x1bOP"])
+        # End of input, again and again.
+        self.assertEqual(reader.read(), "")
+        self.assertEqual(reader.read(0.0), "")
+
+    def test_escape_at_end(self) -> None:
+        reader: KeyReader = self.reader(b"q\x1b")
+        self.assertEqual(reader.read(), "q")
+        self.assertEqual(reader.read(), "\x1b")
+        self.assertEqual(reader.read(), "")
+
+    def test_poll(self) -> None:
+        reader: KeyReader = self.reader(b"ab\x1b[A\x03")
+        self.assertEqual(reader.poll(), ["a", "b", "\x1b[A", "\x03"])
+        self.assertEqual(reader.poll(), [])
+
+    def test_interrupt(self) -> None:
+        reader: KeyReader = self.reader(b"\x03")
+        with self.assertRaises(KeyboardInterrupt):
+            reader.read(allow_keyboard_interrupt=True)
+
+    def test_pipe(self) -> None:
+        read_end, write_end = os.pipe()
+        self.addCleanup(os.close, read_end)
+        reader: KeyReader = KeyReader(read_end)
+        self.assertIsNone(reader.read(0.0))
+        os.write(write_end, b"z")
+        os.close(write_end)
+        self.assertEqual(reader.read(1.0), "z")
+        self.assertEqual(reader.read(1.0), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
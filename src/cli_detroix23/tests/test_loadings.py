@@ -0,0 +1,302 @@
+"""
+CLI - Tests
+test_loadings.py
+"""
+import io
+import contextlib
+import unittest
+from unittest import mock
+
+from ..animations import loadings
+from ..animations.loadings import Template
+
+
+class Clock:
+    """
+    Fake `time.monotonic`, moved by hand.
+    """
+    now: float
+
+    def __init__(self, now: float = 100.0) -> None:
+        self.now: float = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def counting_bar(min_delta: int = 1, min_interval: float = 0.0) -> tuple[loadings.Bar, list[int]]:
+    """
+    Return a bar (not drawn) and the list of its counts at each refresh.
+    """
+    bar: loadings.Bar = loadings.Bar(
+        "#", 100, prefix="", multiple=10, min_delta=min_delta, min_interval=min_interval, log=False,
+    )
+    refreshes: list[int] = list()
+    bar.refresh = lambda: refreshes.append(bar.count)
+    return bar, refreshes
+
+
+class TestRateEstimator(unittest.TestCase):
+    def test_unknown(self) -> None:
+        estimator: loadings.RateEstimator = loadings.RateEstimator()
+        self.assertEqual(estimator.rate, 0.0)
+        self.assertIsNone(estimator.eta(10))
+        estimator.update(5, 10.0)
+        self.assertEqual(estimator.rate, 0.0)
+
+    def test_average_before_first_window(self) -> None:
+        estimator: loadings.RateEstimator = loadings.RateEstimator(window=0.5)
+        estimator.update(0, 10.0)
+        estimator.update(10, 10.25)
+        self.assertAlmostEqual(estimator.rate, 40.0)
+
+    def test_smoothing(self) -> None:
+        estimator: loadings.RateEstimator = loadings.RateEstimator(window=0.5, smoothing=0.25)
+        estimator.update(0, 10.0)
+        estimator.update(20, 10.5)
+        self.assertAlmostEqual(estimator.rate, 40.0)
+        # Inside a window: no change.
+        estimator.update(100, 10.75)
+        self.assertAlmostEqual(estimator.rate, 40.0)
+        # A window at 160 per second: a quarter of the difference.
+        estimator.update(100, 11.0)
+        self.assertAlmostEqual(estimator.rate, 70.0)
+
+    def test_eta(self) -> None:
+        estimator: loadings.RateEstimator = loadings.RateEstimator(window=0.5)
+        estimator.update(0, 10.0)
+        estimator.update(20, 10.5)
+        self.assertAlmostEqual(estimator.eta(80) or 0.0, 2.0)
+        self.assertEqual(estimator.eta(-5), 0.0)
+
+    def test_reset(self) -> None:
+        estimator: loadings.RateEstimator = loadings.RateEstimator(window=0.5)
+        estimator.update(0, 10.0)
+        estimator.update(20, 10.5)
+        estimator.reset()
+        self.assertEqual(estimator.rate, 0.0)
+
+    def test_animation(self) -> None:
+        clock: Clock = Clock()
+        with mock.patch.object(loadings.time, "monotonic", clock):
+            bar, _ = counting_bar()
+            self.assertIsNone(bar.eta)
+            for _ in range(50):
+                clock.now += 0.1
+                bar.increment()
+        self.assertAlmostEqual(bar.rate, 10.0)
+        self.assertAlmostEqual(bar.eta or 0.0, 5.0)
+
+
+class TestThrottling(unittest.TestCase):
+    """
+    `min_delta` and `min_interval`: redraws only once enough operations and time passed.
+    """
+    def test_every_increment(self) -> None:
+        bar, refreshes = counting_bar()
+        for _ in range(5):
+            bar.increment()
+        self.assertEqual(refreshes, [1, 2, 3, 4, 5])
+
+    def test_min_delta(self) -> None:
+        bar, refreshes = counting_bar(min_delta=10)
+        for _ in range(100):
+            bar.increment()
+        self.assertEqual(refreshes, [1, 11, 21, 31, 41, 51, 61, 71, 81, 91])
+        self.assertEqual(bar.count, 100)
+
+    def test_min_delta_big_steps(self) -> None:
+        bar, refreshes = counting_bar(min_delta=10)
+        for add in (4, 4, 4, 15, 1):
+            bar.increment(add)
+        self.assertEqual(refreshes, [4, 27])
+
+    def test_min_interval(self) -> None:
+        clock: Clock = Clock()
+        with mock.patch.object(loadings.time, "monotonic", clock):
+            bar, refreshes = counting_bar(min_interval=1.0)
+            for _ in range(20):
+                clock.now += 0.25
+                bar.increment()
+        self.assertEqual(refreshes, [1, 5, 9, 13, 17])
+
+
+class TestTemplateUpdate(unittest.TestCase):
+    """
+    `Template.update`: a full draw first, then only the changed fields, at their column.
+    """
+    def setUp(self) -> None:
+        # Static widths: "Go: [" is 5, "] " is 2.
+        self.template: Template = Template("{prefix}[{bar}] {percentage}", {"prefix": "Go: "}, end="\r")
+        self.template.update(["## ", " 5%"])
+
+    def test_first_update_draws(self) -> None:
+        template: Template = Template("{prefix}[{bar}] {percentage}", {"prefix": "Go: "}, end="\r")
+        self.assertFalse(template.drawn)
+        self.assertEqual(template.update(["## ", " 5%"]), "\rGo: [## ]  5%\x1b[K\r")
+        self.assertTrue(template.drawn)
+
+    def test_unchanged(self) -> None:
+        self.assertEqual(self.template.update(["## ", " 5%"]), "")
+
+    def test_changed_field_column(self) -> None:
+        self.assertEqual(self.template.update(["###", " 5%"]), "\x1b[6G###\r")
+        # Column of the second field: 5 + 3 + 2, 1 based.
+        self.assertEqual(self.template.update(["###", "10%"]), "\x1b[11G10%\r")
+
+    def test_width_change_rewrites_the_rest(self) -> None:
+        self.assertEqual(self.template.update(["## ", "100%"]), "\x1b[11G100%\x1b[K\r")
+        self.assertEqual(self.template.update(["#", "100%"]), "\x1b[6G#] 100%\x1b[K\r")
+
+    def test_escapes_are_not_counted(self) -> None:
+        self.assertEqual(self.template.update(["\x1b[31m#\x1b[0m##", " 5%"]), "\x1b[6G\x1b[31m#\x1b[0m##\r")
+        self.assertEqual(self.template.update(["\x1b[31m#\x1b[0m##", "10%"]), "\x1b[11G10%\r")
+
+    def test_forget(self) -> None:
+        self.template.forget()
+        self.assertFalse(self.template.drawn)
+        self.assertEqual(self.template.update(["## ", " 5%"]), "\rGo: [## ]  5%\x1b[K\r")
+
+
+class TestBar(unittest.TestCase):
+    """
+    `Bar._bar`: `width` cells, filled by whole cells, or by eighths if smooth.
+    """
+    def bar_at(self, bar: loadings.Bar, count: int) -> str:
+        bar.template
+        bar._i = count  # pyright: ignore[reportPrivateUsage]
+        return bar._bar()  # pyright: ignore[reportPrivateUsage]
+
+    def test_cells(self) -> None:
+        bar: loadings.Bar = loadings.Bar("#", 10, prefix="", multiple=4, empty="-", log=False)
+        bars: list[str] = [self.bar_at(bar, count) for count in range(11)]
+        self.assertEqual(bars[0], "----")
+        self.assertEqual(bars[2], "----")
+        self.assertEqual(bars[3], "#---")
+        self.assertEqual(bars[5], "##--")
+        self.assertEqual(bars[10], "####")
+
+    def test_smooth(self) -> None:
+        width: int = 4
+        bar: loadings.Bar = loadings.Bar("#", 64, prefix="", multiple=width, empty="-", smooth=True, log=False)
+        for count in range(65):
+            full, partial = divmod(8 * width * count // 64, 8)
+            expected: str = (
+                loadings.FULL_BLOCK * full + loadings.EIGHTHS[partial] + "-" * (width - full - (partial > 0))
+            )
+            self.assertEqual(self.bar_at(bar, count), expected, count)
+
+    def test_smooth_steps(self) -> None:
+        bar: loadings.Bar = loadings.Bar("#", 16, prefix="", multiple=2, empty="-", smooth=True, log=False)
+        self.assertEqual(self.bar_at(bar, 1), "▏-")
+        self.assertEqual(self.bar_at(bar, 7), "▉-")
+        self.assertEqual(self.bar_at(bar, 8), "█-")
+        self.assertEqual(self.bar_at(bar, 9), "█▏")
+        self.assertEqual(self.bar_at(bar, 16), "██")
+
+    def test_out_of_range(self) -> None:
+        for smooth in (False, True):
+            bar: loadings.Bar = loadings.Bar("#", 10, prefix="", multiple=4, empty="-", smooth=smooth, log=False)
+            self.assertEqual(self.bar_at(bar, -3), "----")
+            self.assertEqual(self.bar_at(bar, 15), "█" * 4 if smooth else "####")
+
+
+class TestProgress(unittest.TestCase):
+    """
+    `Progress`: the animation is closed once, finished or stopped.
+    """
+    def setUp(self) -> None:
+        self.output: io.StringIO = io.StringIO()
+        self.enterContext(contextlib.redirect_stdout(self.output))
+
+    def bar(self) -> loadings.Bar:
+        return loadings.Bar("#", 1, prefix="", multiple=4, log=False)
+
+    def test_completed(self) -> None:
+        progress: loadings.Progress[int] = loadings.Progress(range(10), self.bar())
+        self.assertEqual(list(progress), list(range(10)))
+        self.assertEqual(progress.animation.state, loadings.State.FINISHED)
+        self.assertEqual(progress.animation.count, 10)
+        # Cursor shown again, then a new line.
+        self.assertTrue(self.output.getvalue().endswith("\x1b[?25h\n"))
+
+    def test_break(self) -> None:
+        progress: loadings.Progress[int] = loadings.Progress(range(10), self.bar())
+        for item in progress:
+            if item == 3:
+                break
+        # The generator is closed by the `break` (CPython): no `with` needed.
+        self.assertEqual(progress.animation.state, loadings.State.STOPPED)
+        self.assertTrue(self.output.getvalue().endswith("\x1b[?25h\n"))
+
+    def test_exception(self) -> None:
+        progress: loadings.Progress[int] = loadings.Progress(range(10), self.bar())
+        with self.assertRaises(KeyError):
+            with progress:
+                for item in progress:
+                    if item == 3:
+                        raise KeyError(item)
+        self.assertEqual(progress.animation.state, loadings.State.STOPPED)
+
+    def test_close_once(self) -> None:
+        progress: loadings.Progress[int] = loadings.Progress(range(10), self.bar())
+        with progress:
+            pass
+        written: str = self.output.getvalue()
+        progress.close()
+        progress.close(completed=True)
+        self.assertEqual(progress.animation.state, loadings.State.STOPPED)
+        self.assertEqual(self.output.getvalue(), written)
+
+    def test_len(self) -> None:
+        self.assertEqual(len(loadings.Progress(range(3), self.bar())), 3)
+        self.assertEqual(len(loadings.Progress(iter("ab"), self.bar(), total=2)), 2)
+        with self.assertRaises(TypeError):
+            len(loadings.Progress(iter("ab"), self.bar()))
+
+    def test_default_animation(self) -> None:
+        self.assertIsInstance(loadings.Progress(range(3)).animation, loadings.Bar)
+        self.assertIsInstance(loadings.Progress(iter("ab")).animation, loadings.Spinner)
+
+
+class TestLogMode(unittest.TestCase):
+    """
+    Log mode: plain lines every `log_percent` percents or `log_interval` seconds, no escapes.
+    """
+    def setUp(self) -> None:
+        self.output: io.StringIO = io.StringIO()
+        self.enterContext(contextlib.redirect_stdout(self.output))
+        self.clock: Clock = Clock()
+        self.enterContext(mock.patch.object(loadings.time, "monotonic", self.clock))
+
+    def test_detected(self) -> None:
+        # The output is not a terminal.
+        self.assertTrue(loadings.Bar("#", 10, prefix="").logging)
+        self.assertFalse(loadings.Bar("#", 10, prefix="", log=False).logging)
+
+    def test_percent(self) -> None:
+        bar: loadings.Bar = loadings.Bar("#", 100, prefix="L: ", multiple=10, empty="-", log_percent=25)
+        for _ in range(100):
+            bar.increment()
+        bar.finish()
+        lines: list[str] = self.output.getvalue().splitlines()
+        self.assertNotIn("\x1b", self.output.getvalue())
+        self.assertEqual([line.split()[3] for line in lines], ["1.0%", "26.0%", "51.0%", "76.0%", "100.0%"])
+        self.assertEqual(lines[-1], "L: |##########| - 100.0% 100/100ops 0.00s")
+
+    def test_interval(self) -> None:
+        bar: loadings.Bar = loadings.Bar("#", 1000, prefix="", multiple=10, log_interval=10.0, log_percent=100)
+        for _ in range(100):
+            self.clock.now += 1.0
+            bar.increment()
+        self.assertEqual(len(self.output.getvalue().splitlines()), 10)
+
+    def test_same_line_once(self) -> None:
+        spinner: loadings.Spinner = loadings.Spinner("ab", prefix="", log=True, log_interval=0.0)
+        spinner.stop()
+        spinner.stop()
+        self.assertEqual(len(self.output.getvalue().splitlines()), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
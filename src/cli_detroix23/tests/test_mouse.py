@@ -0,0 +1,84 @@
+"""
+CLI - Tests
+test_mouse.py
+"""
+import unittest
+from typing import Optional
+
+from ..inputs.mouse import Action, Button, MouseEvent, coalesce, decode
+
+
+def x10(code: int, x: int, y: int) -> str:
+    """
+    Return the X10 report of a button code at 0 based coordinates.
+    """
+    return f"\x1b[M{chr(code + 32)}{chr(x + 33)}{chr(y + 33)}"
+
+
+class TestMouseEvent(unittest.TestCase):
+    def test_hash(self) -> None:
+        click: MouseEvent = MouseEvent(Action.CLICK, Button.LEFT, 2, 3)
+        same: MouseEvent = MouseEvent(Action.CLICK, Button.LEFT, 2, 3, shift=True)
+        self.assertEqual(click, same)
+        self.assertEqual(hash(click), hash(same))
+        self.assertEqual(len({click, same, MouseEvent(Action.RELEASE, Button.LEFT, 2, 3)}), 2)
+        self.assertEqual({click: "a"}[same], "a")
+
+
+class TestDecode(unittest.TestCase):
+    def test_sgr(self) -> None:
+        self.assertEqual(decode("\x1b[<0;3;4M"), MouseEvent(Action.CLICK, Button.LEFT, 2, 3))
+        self.assertEqual(decode("\x1b[<2;1;1m"), MouseEvent(Action.RELEASE, Button.RIGHT, 0, 0))
+        self.assertEqual(decode("\x1b[<32;10;5M"), MouseEvent(Action.DRAG, Button.LEFT, 9, 4))
+        self.assertEqual(decode("\x1b[<35;10;5M"), MouseEvent(Action.MOVE, Button.NONE, 9, 4))
+        self.assertEqual(decode("\x1b[<64;1;2M"), MouseEvent(Action.SCROLL_UP, Button.NONE, 0, 1))
+        self.assertEqual(decode("\x1b[<65;1;2M"), MouseEvent(Action.SCROLL_DOWN, Button.NONE, 0, 1))
+
+    def test_modifiers(self) -> None:
+        event: Optional[MouseEvent] = decode("\x1b[<21;1;1M")
+        assert event is not None
+        self.assertEqual((event.action, event.button), (Action.CLICK, Button.MIDDLE))
+        self.assertEqual((event.shift, event.alt, event.ctrl), (True, False, True))
+
+    def test_x10(self) -> None:
+        self.assertEqual(decode(x10(0, 2, 3)), MouseEvent(Action.CLICK, Button.LEFT, 2, 3))
+        self.assertEqual(decode(x10(3, 2, 3)), MouseEvent(Action.RELEASE, Button.NONE, 2, 3))
+        self.assertEqual(decode(x10(35, 4, 0)), MouseEvent(Action.MOVE, Button.NONE, 4, 0))
+        self.assertEqual(decode(x10(65, 0, 0)), MouseEvent(Action.SCROLL_DOWN, Button.NONE, 0, 0))
+
+    def test_other_keys(self) -> None:
+        self.assertIsNone(decode("a"))
+        self.assertIsNone(decode("\x1b[A"))
+        self.assertIsNone(decode("\x1b[<0;3M"))
+        self.assertIsNone(decode("\x1b[M !"))
+
+
+class TestCoalesce(unittest.TestCase):
+    def test_coalesce(self) -> None:
+        events: list[MouseEvent] = [
+            MouseEvent(Action.MOVE, Button.NONE, 0, 0),
+            MouseEvent(Action.MOVE, Button.NONE, 1, 0),
+            MouseEvent(Action.CLICK, Button.LEFT, 1, 0),
+            MouseEvent(Action.DRAG, Button.LEFT, 2, 0),
+            MouseEvent(Action.DRAG, Button.LEFT, 3, 1),
+            MouseEvent(Action.DRAG, Button.RIGHT, 3, 2),
+            MouseEvent(Action.MOVE, Button.NONE, 4, 2),
+            MouseEvent(Action.RELEASE, Button.LEFT, 4, 2),
+            MouseEvent(Action.RELEASE, Button.LEFT, 4, 2),
+        ]
+        self.assertEqual(coalesce(events), [
+            MouseEvent(Action.MOVE, Button.NONE, 1, 0),
+            MouseEvent(Action.CLICK, Button.LEFT, 1, 0),
+            MouseEvent(Action.DRAG, Button.LEFT, 3, 1),
+            MouseEvent(Action.DRAG, Button.RIGHT, 3, 2),
+            MouseEvent(Action.MOVE, Button.NONE, 4, 2),
+            MouseEvent(Action.RELEASE, Button.LEFT, 4, 2),
+            MouseEvent(Action.RELEASE, Button.LEFT, 4, 2),
+        ])
+
+    def test_empty(self) -> None:
+        self.assertEqual(coalesce([]), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
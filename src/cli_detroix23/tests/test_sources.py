@@ -0,0 +1,113 @@
+"""
+CLI - Tests
+test_sources.py
+"""
+import sqlite3
+import unittest
+from typing import Iterator
+
+from ..inputs import sources
+
+
+class Pages:
+    """
+    Paging function over `total` options, recording its calls.
+    """
+    total: int
+    calls: list[tuple[int, int]]
+
+    def __init__(self, total: int) -> None:
+        self.total: int = total
+        self.calls: list[tuple[int, int]] = list()
+
+    def __call__(self, offset: int, limit: int) -> list[str]:
+        self.calls.append((offset, limit))
+        return [f"option {index}" for index in range(offset, min(self.total, offset + limit))]
+
+
+class TestPagedSource(unittest.TestCase):
+    def test_lazy(self) -> None:
+        pages: Pages = Pages(25)
+        source: sources.PagedSource = sources.PagedSource(pages, page_size=10)
+        self.assertEqual(len(source), 0)
+        self.assertEqual(pages.calls, [])
+        self.assertFalse(source.exhausted)
+
+    def test_ensure(self) -> None:
+        pages: Pages = Pages(25)
+        source: sources.PagedSource = sources.PagedSource(pages, page_size=10)
+        source.ensure(5)
+        self.assertEqual((len(source), pages.calls), (10, [(0, 10)]))
+        source.ensure(10)
+        self.assertEqual(len(pages.calls), 1)
+        source.ensure(11)
+        self.assertEqual((len(source), pages.calls[-1]), (20, (10, 10)))
+        # A short page is the last one.
+        source.ensure()
+        self.assertEqual(len(source), 25)
+        self.assertTrue(source.exhausted)
+        source.ensure(100)
+        self.assertEqual(len(pages.calls), 3)
+
+    def test_exact_pages(self) -> None:
+        # The last page is full: an empty one tells the end.
+        pages: Pages = Pages(20)
+        source: sources.PagedSource = sources.PagedSource(pages, page_size=10)
+        source.ensure()
+        self.assertEqual(pages.calls, [(0, 10), (10, 10), (20, 10)])
+        self.assertEqual(len(source), 20)
+
+    def test_getitem(self) -> None:
+        pages: Pages = Pages(25)
+        source: sources.PagedSource = sources.PagedSource(pages, page_size=10)
+        self.assertEqual(source[12], "option 12")
+        self.assertEqual(len(pages.calls), 2)
+        self.assertRaises(IndexError, source.__getitem__, 30)
+
+    def test_iter(self) -> None:
+        pages: Pages = Pages(25)
+        source: sources.PagedSource = sources.PagedSource(pages, page_size=10)
+        iterator: Iterator[str] = iter(source)
+        self.assertEqual(next(iterator), "option 0")
+        self.assertEqual(len(pages.calls), 1)
+        self.assertEqual(len(list(iterator)), 24)
+        self.assertTrue(source.exhausted)
+        # Loaded options are not fetched again.
+        self.assertEqual(list(source), [f"option {index}" for index in range(25)])
+        self.assertEqual(len(pages.calls), 3)
+
+    def test_empty(self) -> None:
+        source: sources.PagedSource = sources.PagedSource(Pages(0), page_size=10)
+        self.assertEqual(list(source), [])
+        self.assertTrue(source.exhausted)
+
+
+class TestSources(unittest.TestCase):
+    def test_source(self) -> None:
+        options: list[str] = ["a", "b"]
+        listed: sources.Source = sources.source(options)
+        self.assertIsInstance(listed, sources.ListSource)
+        self.assertTrue(listed.exhausted)
+        self.assertEqual((len(listed), listed[1]), (2, "b"))
+        self.assertIs(sources.source(listed), listed)
+
+    def test_iterable(self) -> None:
+        source: sources.Source = sources.source((f"{index}" for index in range(250)), page_size=100)
+        self.assertIsInstance(source, sources.IterableSource)
+        self.assertEqual(source[150], "150")
+        self.assertEqual(len(source), 200)
+        self.assertEqual(list(source), [f"{index}" for index in range(250)])
+
+    def test_sqlite(self) -> None:
+        connection: sqlite3.Connection = sqlite3.connect(":memory:")
+        self.addCleanup(connection.close)
+        connection.execute("CREATE TABLE users (id INTEGER, name TEXT)")
+        connection.executemany("INSERT INTO users VALUES (?, ?)", [(index, f"user {index}") for index in range(15)])
+        source: sources.PagedSource = sources.sqlite_source(connection, "SELECT name FROM users ORDER BY id", page_size=4)
+        self.assertEqual(source[5], "user 5")
+        self.assertEqual(len(source), 8)
+        self.assertEqual(list(source)[-1], "user 14")
+
+
+if __name__ == "__main__":
+    unittest.main()